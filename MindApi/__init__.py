@@ -1,3 +1,26 @@
-from MindApi.core import compiler
+from MindApi.cache import CompileCache
+from MindApi.core import compiler, optimization_report
+from MindApi.cost import BudgetExceeded, CostReport
+from MindApi.decorators import inline, noinline
+from MindApi.mlog import dump, dumps, emit
+from MindApi.pgo import Profile, collect_profile
+from MindApi.profiler import Stats, profile
+from MindApi.sourcemap import SourceMap
 
-__all__ = ["compiler"]
+__all__ = [
+    "BudgetExceeded",
+    "CompileCache",
+    "CostReport",
+    "Profile",
+    "SourceMap",
+    "Stats",
+    "collect_profile",
+    "compiler",
+    "dump",
+    "dumps",
+    "emit",
+    "inline",
+    "noinline",
+    "optimization_report",
+    "profile",
+]
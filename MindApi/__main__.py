@@ -0,0 +1,5 @@
+import sys
+
+from MindApi.cli import main
+
+sys.exit(main())
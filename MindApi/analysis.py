@@ -0,0 +1,331 @@
+from typing import Callable, Dict, List, Optional, Tuple, Type, TypeGuard, TypeVar
+
+from MindApi.builtin import (
+    End,
+    GetLink,
+    Jump,
+    JumpTable,
+    LookUp,
+    MetaInstruction,
+    Operation,
+    PackColor,
+    Print,
+    Read,
+    Set,
+    Stop,
+    UnitLocate,
+    UnitRadar,
+    Write,
+)
+from MindApi.semantics import fold, is_variable, op_name
+
+COUNTER = "@counter"
+JUMPBACK = "__jumpback"  # prefix of the return address register of every function
+
+# attributes holding values an instruction reads and that may be replaced
+# by an equivalent operand (a constant or a copy of the variable)
+OPERAND_FIELDS: Dict[Type[MetaInstruction], Tuple[str, ...]] = {
+    Set: ("src",),
+    Operation: ("left", "right"),
+    Jump: ("left", "right"),
+    Write: ("src", "index"),
+    Read: ("index",),
+    JumpTable: ("index",),
+}
+
+# attributes holding the variables an instruction writes
+DEST_FIELDS: Dict[Type[MetaInstruction], Tuple[str, ...]] = {
+    Set: ("dest",),
+    Operation: ("dest",),
+    Read: ("dest",),
+    GetLink: ("dest",),
+    LookUp: ("dest",),
+    PackColor: ("dest",),
+    UnitRadar: ("dest",),
+    UnitLocate: ("outX", "outY", "Found", "building"),
+}
+
+# attributes that select what an instruction does rather than holding a value
+_NOT_OPERANDS = {"op", "cmd", "actiontype", "method", "line", "column"}
+
+
+def operand_fields(inst: MetaInstruction) -> Tuple[str, ...]:
+    if isinstance(inst, Print):
+        return ("val",) if inst.is_var else ()
+    return OPERAND_FIELDS.get(type(inst), ())
+
+
+Inst = TypeVar("Inst", bound=MetaInstruction)
+
+
+def inherit(new: Inst, old: Optional[MetaInstruction]) -> Inst:
+    """
+    Let ``new``, which replaces ``old``, keep track of where ``old`` came from
+    """
+    if old is not None:
+        new.method = old.method
+        new.line = old.line
+        new.column = old.column
+    return new
+
+
+def defs(inst: MetaInstruction) -> List[str]:
+    """
+    Variables written by ``inst``
+    """
+    return [
+        getattr(inst, field)
+        for field in DEST_FIELDS.get(type(inst), ())
+        if is_variable(getattr(inst, field))
+    ]
+
+
+def return_register(method: str) -> str:
+    """
+    Variable holding the address a call to ``method`` returns to
+    """
+    return f"{JUMPBACK}_{method}"
+
+
+def is_return_register(name) -> TypeGuard[str]:
+    return isinstance(name, str) and name.startswith(JUMPBACK)
+
+
+def address_field(inst: MetaInstruction) -> Optional[str]:
+    """
+    Name of the attribute of ``inst`` holding a code address (a jump target
+    or the return address of a call), None if it has none
+    """
+    if isinstance(inst, Jump) and not isinstance(inst.to, str):
+        return "to"
+    if (
+        isinstance(inst, Set)
+        and is_return_register(inst.dest)
+        and not is_variable(inst.src)
+    ):
+        return "src"
+    return None
+
+
+def addresses(inst: MetaInstruction) -> list:
+    """
+    Every code address held by ``inst``
+    """
+    if isinstance(inst, JumpTable):
+        return list(inst.targets)
+    field = address_field(inst)
+    return [] if field is None else [getattr(inst, field)]
+
+
+def map_addresses(inst: MetaInstruction, function: Callable):
+    """
+    Replace every code address ``a`` held by ``inst`` with ``function(a)``
+    """
+    if isinstance(inst, JumpTable):
+        inst.targets = [function(target) for target in inst.targets]
+        return
+    field = address_field(inst)
+    if field is not None:
+        setattr(inst, field, function(getattr(inst, field)))
+
+
+def relative_return(instructions: List[MetaInstruction], index: int) -> Optional[int]:
+    """
+    Address stored by ``op add __jumpback_f @counter k`` at ``index``, the
+    position independent form return addresses are emitted in.
+    None if the instruction is not one.
+    """
+    inst = instructions[index]
+    if (
+        isinstance(inst, Operation)
+        and is_return_register(inst.dest)
+        and inst.left == COUNTER
+        and op_name(inst.op) == "add"
+        and isinstance(inst.right, int)
+    ):
+        # @counter already points to the next instruction
+        return index + 1 + inst.right
+    return None
+
+
+def jump_targets(instructions: List[MetaInstruction]) -> set[int]:
+    """
+    Every index control may be transferred to by something other than
+    falling through: jump targets and the return addresses of calls
+    """
+    targets = set()
+    for i, inst in enumerate(instructions):
+        targets.update(addresses(inst))
+        address = relative_return(instructions, i)
+        if address is not None:
+            targets.add(address)
+    return targets
+
+
+def ends_block(inst: MetaInstruction) -> bool:
+    """
+    Whether control may leave ``inst`` other than by falling through
+    """
+    return isinstance(inst, (Jump, JumpTable, End, Stop)) or COUNTER in defs(inst)
+
+
+def computed_jump(inst: MetaInstruction) -> bool:
+    """
+    Whether ``inst`` writes @counter with a value that is not known to be
+    a return address, so control may continue at any instruction
+    """
+    return COUNTER in defs(inst) and not (
+        isinstance(inst, Set) and is_return_register(inst.src)
+    )
+
+
+def leaders(instructions: List[MetaInstruction]) -> set[int]:
+    """
+    Indices of the first instruction of every basic block
+    """
+    if any(computed_jump(inst) for inst in instructions):
+        return set(range(len(instructions)))
+    result = {0} | jump_targets(instructions)
+    for i, inst in enumerate(instructions):
+        if ends_block(inst):
+            result.add(i + 1)
+    return {i for i in result if 0 <= i < len(instructions)}
+
+
+def uses(inst: MetaInstruction) -> List[str]:
+    """
+    Variables (possibly) read by ``inst``.
+    Instructions without a precise description report every operand that
+    could name a variable, which errs on the side of keeping stores alive.
+    """
+    if isinstance(inst, Print):
+        return [inst.val] if inst.is_var and is_variable(inst.val) else []
+    if isinstance(inst, Jump):
+        values = [inst.left, inst.right, inst.to]
+    elif type(inst) in OPERAND_FIELDS:
+        values = [getattr(inst, field) for field in OPERAND_FIELDS[type(inst)]]
+        if isinstance(inst, (Read, Write)):
+            values.append(inst.dest if isinstance(inst, Write) else inst.src)
+    else:
+        dests = DEST_FIELDS.get(type(inst), ())
+        values = []
+        for field in inst.fields:
+            if field in dests or field in _NOT_OPERANDS:
+                continue
+            value = getattr(inst, field)
+            values.extend(value if isinstance(value, (tuple, list)) else [value])
+    return [value for value in values if is_variable(value)]
+
+
+def relocate(instructions: List[MetaInstruction], index_map: List[int]):
+    """
+    Rewrite every code address after instructions were inserted or removed.
+    ``index_map[old]`` is the new index of old instruction ``old``, with one
+    extra trailing entry for the end of the program.
+    Relative return addresses are not rewritten, they are only made relative
+    once the program no longer changes.
+    """
+    end = len(index_map) - 1
+    for inst in instructions:
+        map_addresses(inst, lambda address: index_map[min(address, end)])
+
+
+def condition(jump: Jump) -> Optional[bool]:
+    """
+    Whether ``jump`` is always (True) or never (False) taken, None if it
+    depends on values only known at run time
+    """
+    result = fold(jump.op, jump.left, jump.right)
+    if result is None:
+        return None
+    return (result == 0) if jump.reverse else (result != 0)
+
+
+def return_addresses(instructions: List[MetaInstruction]) -> Dict[str, List[int]]:
+    """
+    Addresses stored in each return register, where ``set @counter`` with
+    that register may land
+    """
+    size = len(instructions)
+    result: Dict[str, set] = {}
+    for i, inst in enumerate(instructions):
+        address = relative_return(instructions, i)
+        if address is None and address_field(inst) == "src":
+            address = inst.src  # type: ignore
+        if address is not None:
+            result.setdefault(inst.dest, set()).add(  # type: ignore
+                address if address < size else 0
+            )
+    return {register: sorted(addresses) for register, addresses in result.items()}
+
+
+def successors(
+    instructions: List[MetaInstruction],
+    index: int,
+    returns: Dict[str, List[int]],
+) -> List[int]:
+    """
+    Indices control may continue at after ``instructions[index]``.
+    ``returns`` are the return addresses of every return register.
+    """
+    size = len(instructions)
+    inst = instructions[index]
+    following = (index + 1) % size
+    if isinstance(inst, Jump):
+        if not isinstance(inst.to, int):
+            # a jump to a variable could land anywhere
+            return list(range(size))
+        targets = [inst.to if inst.to < size else 0]
+        taken = condition(inst)
+        if taken is True:
+            return targets
+        if taken is False:
+            return [following]
+        return [following] + targets
+    if isinstance(inst, JumpTable):
+        return [target if target < size else 0 for target in inst.targets]
+    if isinstance(inst, End):
+        return [0]
+    if isinstance(inst, Stop):
+        return []
+    if isinstance(inst, Set) and inst.dest == COUNTER and is_return_register(inst.src):
+        # return from a call
+        return list(returns.get(inst.src, []))
+    if COUNTER in defs(inst):
+        # a computed jump could land anywhere
+        return list(range(size))
+    return [following]
+
+
+def reachable(instructions: List[MetaInstruction]) -> set[int]:
+    if not instructions:
+        return set()
+    returns = return_addresses(instructions)
+    seen = {0}
+    stack = [0]
+    while stack:
+        for succ in successors(instructions, stack.pop(), returns):
+            if succ not in seen:
+                seen.add(succ)
+                stack.append(succ)
+    return seen
+
+
+def rename(inst: MetaInstruction, names: Dict[str, str]):
+    """
+    Replace every variable of ``inst`` found in ``names``, read or written
+    """
+    if isinstance(inst, Print) and not inst.is_var:
+        return
+    for field in inst.fields:
+        if field in _NOT_OPERANDS or (isinstance(inst, Jump) and field == "to"):
+            continue
+        value = getattr(inst, field)
+        if isinstance(value, str) and value in names:
+            setattr(inst, field, names[value])
+        elif isinstance(value, tuple):
+            setattr(
+                inst,
+                field,
+                tuple(names.get(v, v) if isinstance(v, str) else v for v in value),
+            )
@@ -0,0 +1,550 @@
+"""
+Run many copies of one program in lockstep, each with its own inputs.
+Needs numpy, which MindApi does not depend on otherwise.
+"""
+import struct
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from MindApi.analysis import COUNTER, DEST_FIELDS
+from MindApi.builtin import (
+    Draw,
+    DrawFlush,
+    End,
+    Jump,
+    JumpTable,
+    MetaInstruction,
+    Operation,
+    PackColor,
+    Print,
+    PrintFlush,
+    Read,
+    Set,
+    Stop,
+    UnitBind,
+    UnitControl,
+    UnitLocate,
+    UnitRadar,
+    Wait,
+    Write,
+)
+from MindApi.emulator import (
+    DEFAULT_PROCESSOR,
+    IPT,
+    MAX_TEXT_BUFFER,
+    TICKS_PER_SECOND,
+    Building,
+    MemoryCell,
+    Message,
+    noise,
+    text,
+)
+from MindApi.semantics import op_name, to_number
+from MindApi.utils import condition_ops, condition_ops_inverse
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+# values of the instances selected by an index array, with a null mask
+Values = Tuple["np.ndarray", "np.ndarray"]
+
+
+def _long(a):
+    # java (long) cast: truncate towards zero and saturate
+    a = np.trunc(a)
+    high, low = a >= 2.0**63, a < -(2.0**63)
+    result = np.where(high | low, 0, a).astype(np.int64)
+    result[high] = np.iinfo(np.int64).max
+    result[low] = np.iinfo(np.int64).min
+    return result
+
+
+def _angle(x, y):
+    return np.degrees(np.arctan2(y, x)) % 360
+
+
+def _angle_diff(a, b):
+    a, b = a % 360, b % 360
+    return np.minimum((a - b) % 360, (b - a) % 360)
+
+
+def _functions():
+    binary = {
+        "add": np.add,
+        "sub": np.subtract,
+        "mul": np.multiply,
+        "div": np.true_divide,
+        "idiv": lambda a, b: np.floor(a / b),
+        "mod": np.fmod,
+        "pow": np.power,
+        "land": lambda a, b: (a != 0) & (b != 0),
+        "shl": lambda a, b: _long(a) << (_long(b) & 63),
+        "shr": lambda a, b: _long(a) >> (_long(b) & 63),
+        "or": lambda a, b: _long(a) | _long(b),
+        "and": lambda a, b: _long(a) & _long(b),
+        "xor": lambda a, b: _long(a) ^ _long(b),
+        "max": np.maximum,
+        "min": np.minimum,
+        "angle": _angle,
+        "angleDiff": _angle_diff,
+        "len": np.hypot,
+        "noise": np.vectorize(noise, otypes=[float]),
+    }
+    unary = {
+        "not": lambda a: ~_long(a),
+        "abs": np.abs,
+        "log": np.log,
+        "log10": np.log10,
+        "floor": np.floor,
+        "ceil": np.ceil,
+        "sqrt": np.sqrt,
+        "sin": lambda a: np.sin(np.radians(a)),
+        "cos": lambda a: np.cos(np.radians(a)),
+        "tan": lambda a: np.tan(np.radians(a)),
+        "asin": lambda a: np.degrees(np.arcsin(a)),
+        "acos": lambda a: np.degrees(np.arccos(a)),
+        "atan": lambda a: np.degrees(np.arctan(a)),
+    }
+    return binary, unary
+
+
+def compare(name: str, left: Values, right: Values):
+    """
+    Evaluate a comparison for every instance, as a boolean array
+    """
+    (a, a_null), (b, b_null) = left, right
+    if name == "strictEqual":
+        return (a_null == b_null) & (a_null | (a == b))
+    # null is 0 when compared with a number (and equal to null)
+    a, b = np.where(a_null, 0, a), np.where(b_null, 0, b)
+    if name == "equal":
+        return np.abs(a - b) < 0.000001
+    if name == "notEqual":
+        return np.abs(a - b) >= 0.000001
+    if name == "lessThan":
+        return a < b
+    if name == "lessThanEq":
+        return a <= b
+    if name == "greaterThan":
+        return a > b
+    if name == "greaterThanEq":
+        return a >= b
+    raise ValueError(f"Invalid condition operator: {name}")
+
+
+class BatchProcessor:
+    """
+    Runs ``size`` copies of a compiled program in lockstep. Variables are
+    numpy arrays with one value per instance and every instance has its
+    own @counter: each step runs every instruction some instances are at,
+    for those instances only.
+    Only numbers and null are supported as values; draw commands are
+    dropped and there is no world, like in ``Processor``.
+    """
+
+    def __init__(
+        self,
+        instructions: Sequence[MetaInstruction],
+        size: int,
+        kind: str = DEFAULT_PROCESSOR,
+        links: Sequence[Building] = (),
+        ipt: Optional[int] = None,
+        seed: int = 0,
+    ):
+        if np is None:
+            raise ImportError("BatchProcessor needs numpy (pip install numpy)")
+        self.instructions = list(instructions)
+        self.size = size
+        self.kind = kind
+        self.ipt = IPT[kind] if ipt is None else ipt
+        self.links = list(links)
+        self.random = np.random.default_rng(seed)
+        self.cells = {
+            link.name: np.tile(np.asarray(link.memory, dtype=float), (size, 1))
+            for link in self.links
+            if isinstance(link, MemoryCell)
+        }
+        self.messages = {
+            link.name: [""] * size for link in self.links if isinstance(link, Message)
+        }
+        self.counter = np.zeros(size, dtype=np.int64)
+        self.text = [""] * size
+        self.stopped = np.zeros(size, dtype=bool)
+        self._yielded = np.zeros(size, dtype=bool)
+        self._waited = np.zeros(size, dtype=np.int64)
+        # statistics
+        self.executed = np.zeros(size, dtype=np.int64)
+        self.ticks = 0
+        self.counts = np.zeros(len(self.instructions), dtype=np.int64)
+
+        self._registers: Dict[str, int] = {}
+        self._binary, self._unary = _functions()
+        self._code = [self._compile(inst) for inst in self.instructions]
+        self.values = np.zeros((len(self._registers), size))
+        self.nulls = np.ones((len(self._registers), size), dtype=bool)
+
+    # variables
+    def __getitem__(self, name: str):
+        """
+        Value of ``name`` in every instance, NaN where it is null
+        """
+        if name not in self._registers:
+            return np.full(self.size, np.nan)
+        register = self._registers[name]
+        return np.where(self.nulls[register], np.nan, self.values[register])
+
+    def __setitem__(self, name: str, value):
+        """
+        Set ``name`` in every instance, to one value or one per instance.
+        None and NaN are null.
+        """
+        if name not in self._registers:
+            return  # the program never reads it
+        register = self._registers[name]
+        value = np.broadcast_to(
+            np.asarray(np.nan if value is None else value, dtype=float), (self.size,)
+        )
+        self.nulls[register] = np.isnan(value)
+        self.values[register] = np.nan_to_num(value)
+
+    # compilation
+    def _register(self, name: str) -> int:
+        return self._registers.setdefault(name, len(self._registers))
+
+    def _operand(self, operand) -> Callable[["np.ndarray"], Values]:
+        number = to_number(operand)
+        if number is None and operand in ("true", "false"):
+            number = 1 if operand == "true" else 0
+        if number is not None:
+            return lambda idx: (
+                np.full(len(idx), float(number)),
+                np.zeros(len(idx), bool),
+            )
+        if operand is None or operand in ("null", "@unit"):
+            return lambda idx: (np.zeros(len(idx)), np.ones(len(idx), bool))
+        if not isinstance(operand, str) or operand.startswith('"'):
+            raise NotImplementedError(f"Batch mode only has numbers, not {operand}")
+        if operand.startswith("@"):
+            return self._builtin(operand)
+        if operand in {link.name for link in self.links}:
+            raise NotImplementedError(f"Batch mode can't use {operand} as a value")
+        register = self._register(operand)
+        return lambda idx: (self.values[register, idx], self.nulls[register, idx])
+
+    def _builtin(self, name: str) -> Callable[["np.ndarray"], Values]:
+        values: Dict[str, Callable[[], float]] = {
+            "@ipt": lambda: self.ipt,
+            "@links": lambda: len(self.links),
+            "@tick": lambda: self.ticks,
+            "@second": lambda: self.ticks / TICKS_PER_SECOND,
+            "@time": lambda: self.ticks * 1000 / TICKS_PER_SECOND,
+        }
+        if name == COUNTER:
+            return lambda idx: (
+                self.counter[idx].astype(float),
+                np.zeros(len(idx), bool),
+            )
+        if name not in values:
+            raise NotImplementedError(f"Batch mode does not support {name}")
+        value = values[name]
+        return lambda idx: (np.full(len(idx), float(value())), np.zeros(len(idx), bool))
+
+    def _store(
+        self, dest: str
+    ) -> Callable[["np.ndarray", "np.ndarray", "np.ndarray"], None]:
+        if dest == COUNTER:
+
+            def jump(idx, values, nulls):
+                self.counter[idx] = _long(np.where(nulls, 0, values))
+
+            return jump
+        if dest.startswith("@") or dest in {link.name for link in self.links}:
+            return lambda idx, values, nulls: None
+        register = self._register(dest)
+
+        def store(idx, values, nulls):
+            self.values[register, idx] = values
+            self.nulls[register, idx] = nulls
+
+        return store
+
+    def _compile(self, inst: MetaInstruction) -> Callable[["np.ndarray"], None]:
+        handler = {
+            Set: self._set,
+            Operation: self._op,
+            Jump: self._jump,
+            JumpTable: self._jump_table,
+            Print: self._print,
+            PrintFlush: self._print_flush,
+            Read: self._read,
+            Write: self._write,
+            PackColor: self._pack_color,
+            Wait: self._wait,
+            End: self._end,
+            Stop: self._stop,
+        }.get(type(inst))
+        if isinstance(inst, (Draw, DrawFlush)):
+            return lambda idx: None
+        if isinstance(inst, (UnitBind, UnitControl, UnitRadar, UnitLocate)):
+            return self._no_world(inst)
+        if handler is None:
+            raise NotImplementedError(
+                f"{type(inst).__name__} is not supported in batch mode"
+            )
+        return handler(inst)  # type: ignore
+
+    def _set(self, inst: Set):
+        src, store = self._operand(inst.src), self._store(inst.dest)
+        return lambda idx: store(idx, *src(idx))
+
+    def _op(self, inst: Operation):
+        name = op_name(inst.op)
+        left, right = self._operand(inst.left), self._operand(inst.right)
+        store = self._store(inst.dest)
+        if name in ("equal", "notEqual", "strictEqual"):
+
+            def evaluate(idx):
+                return compare(name, left(idx), right(idx)).astype(float)
+
+        elif name == "rand":
+
+            def evaluate(idx):
+                a, a_null = left(idx)
+                return self.random.random(len(idx)) * np.where(a_null, 0, a)
+
+        elif name in self._unary:
+            function = self._unary[name]
+
+            def evaluate(idx):
+                a, a_null = left(idx)
+                return function(np.where(a_null, 0, a))
+
+        elif name in self._binary or name in condition_ops.values():
+            function = self._binary.get(name)
+
+            def evaluate(idx):
+                a, b = left(idx), right(idx)
+                if function is None:
+                    return compare(name, a, b).astype(float)
+                return function(np.where(a[1], 0, a[0]), np.where(b[1], 0, b[0]))
+
+        else:
+            raise ValueError(f"Invalid operator: {inst.op}")
+
+        def run(idx):
+            with np.errstate(all="ignore"):
+                result = np.asarray(evaluate(idx), dtype=float)
+            # NaN and infinity become null
+            nulls = ~np.isfinite(result)
+            store(idx, np.where(nulls, 0, result), nulls)
+
+        return run
+
+    def _jump(self, inst: Jump):
+        ops = condition_ops_inverse if inst.reverse else condition_ops
+        name = ops.get(inst.op, inst.op)
+        left, right = self._operand(inst.left), self._operand(inst.right)
+        target = inst.to
+
+        def run(idx):
+            taken = compare(name, left(idx), right(idx))
+            self.counter[idx[taken]] = target
+
+        return run
+
+    def _jump_table(self, inst: JumpTable):
+        index = self._operand(inst.index)
+        targets = np.asarray(inst.targets, dtype=np.int64)
+
+        def run(idx):
+            values, nulls = index(idx)
+            self.counter[idx] = targets[_long(np.where(nulls, 0, values))]
+
+        return run
+
+    def _append(self, i: int, value: str):
+        self.text[i] = (self.text[i] + value)[:MAX_TEXT_BUFFER]
+
+    def _print(self, inst: Print):
+        if not inst.is_var:
+            literal = str(inst.val)
+            return lambda idx: [self._append(i, literal) for i in idx]
+        value = self._operand(inst.val)
+
+        def run(idx):
+            values, nulls = value(idx)
+            for i, v, null in zip(idx, values, nulls):
+                self._append(i, text(None if null else float(v)))
+
+        return run
+
+    def _print_flush(self, inst: PrintFlush):
+        message = self.messages.get(inst.message)
+
+        def run(idx):
+            for i in idx:
+                if message is not None:
+                    message[i] = self.text[i]
+                self.text[i] = ""
+
+        return run
+
+    def _address(self, cell: "np.ndarray", index, idx):
+        values, nulls = index(idx)
+        address = _long(np.where(nulls, 0, values))
+        inside = (address >= 0) & (address < cell.shape[1])
+        return address, inside
+
+    def _read(self, inst: Read):
+        cell = self.cells.get(inst.src)
+        index, store = self._operand(inst.index), self._store(inst.dest)
+        if cell is None:
+            return lambda idx: None
+
+        def run(idx):
+            address, inside = self._address(cell, index, idx)
+            values = np.zeros(len(idx))
+            values[inside] = cell[idx[inside], address[inside]]
+            store(idx, values, np.zeros(len(idx), bool))
+
+        return run
+
+    def _write(self, inst: Write):
+        cell = self.cells.get(inst.dest)
+        index, src = self._operand(inst.index), self._operand(inst.src)
+        if cell is None:
+            return lambda idx: None
+
+        def run(idx):
+            address, inside = self._address(cell, index, idx)
+            values, nulls = src(idx)
+            values = np.where(nulls, 0, values)
+            cell[idx[inside], address[inside]] = values[inside]
+
+        return run
+
+    def _pack_color(self, inst: PackColor):
+        rgba = 0
+        for channel in (inst.r, inst.g, inst.b, inst.a):
+            rgba = (rgba << 8) | int(channel * 255)
+        packed = struct.unpack("<d", struct.pack("<Q", rgba))[0]
+        store = self._store(inst.dest)
+        return lambda idx: store(
+            idx, np.full(len(idx), packed), np.zeros(len(idx), bool)
+        )
+
+    def _wait(self, inst: Wait):
+        time = self._operand(inst.time)
+
+        def run(idx):
+            values, nulls = time(idx)
+            done = self._waited[idx] / TICKS_PER_SECOND >= np.where(nulls, 0, values)
+            self._waited[idx[done]] = 0
+            waiting = idx[~done]
+            # run the wait again next tick
+            self._waited[waiting] += 1
+            self.counter[waiting] -= 1
+            self._yielded[waiting] = True
+
+        return run
+
+    def _end(self, inst: End):
+        end = len(self.instructions)
+
+        def run(idx):
+            self.counter[idx] = end
+
+        return run
+
+    def _stop(self, inst: Stop):
+        def run(idx):
+            self.counter[idx] -= 1
+            self.stopped[idx] = True
+            self._yielded[idx] = True
+
+        return run
+
+    def _no_world(self, inst: MetaInstruction):
+        stores = [
+            self._store(getattr(inst, f)) for f in DEST_FIELDS.get(type(inst), ())
+        ]
+
+        def run(idx):
+            for store in stores:
+                store(idx, np.zeros(len(idx)), np.ones(len(idx), bool))
+
+        return run
+
+    # execution
+    def step(self, running: Optional["np.ndarray"] = None):
+        """
+        Execute one instruction in every running instance
+        """
+        if not self.instructions:
+            return
+        running = ~self.stopped if running is None else running
+        counter = self.counter
+        # running off the end restarts the program
+        counter[running & ((counter < 0) | (counter >= len(self.instructions)))] = 0
+        active = np.flatnonzero(running)
+        if not len(active):
+            return
+        self.executed[active] += 1
+        current = counter[active]
+        order = np.argsort(current, kind="stable")
+        positions = current[order]
+        bounds = np.flatnonzero(np.diff(positions)) + 1
+        for idx, index in zip(
+            np.split(active[order], bounds), positions[np.r_[0, bounds]]
+        ):
+            self.counts[index] += len(idx)
+            counter[idx] = index + 1
+            self._code[index](idx)
+
+    def tick(self) -> int:
+        """
+        Run one game tick in every instance, return the number of
+        instructions executed
+        """
+        before = int(self.executed.sum())
+        running = ~self.stopped
+        for _ in range(self.ipt):
+            if not running.any():
+                break
+            self._yielded[:] = False
+            self.step(running)
+            running &= ~self._yielded
+        self.ticks += 1
+        return int(self.executed.sum()) - before
+
+    def run(self, ticks: int) -> int:
+        """
+        Run ``ticks`` game ticks, return the number of instructions executed
+        """
+        before = int(self.executed.sum())
+        for _ in range(ticks):
+            if self.stopped.all():
+                break
+            self.tick()
+        return int(self.executed.sum()) - before
+
+
+def sweep(
+    instructions: Sequence[MetaInstruction],
+    inputs: Dict[str, Sequence[float]],
+    ticks: int,
+    **kwargs,
+) -> BatchProcessor:
+    """
+    Run ``instructions`` once for every scenario in ``inputs`` (one sequence
+    of values per variable, all of the same length) for ``ticks`` ticks
+    """
+    sizes = {len(values) for values in inputs.values()}
+    if len(sizes) != 1:
+        raise ValueError("Every input needs one value per scenario")
+    batch = BatchProcessor(instructions, sizes.pop(), **kwargs)
+    for name, values in inputs.items():
+        batch[name] = values
+    batch.run(ticks)
+    return batch
@@ -0,0 +1,207 @@
+"""
+Batch builds: find every processor class (a class with ``init`` or
+``loop``) in packages, modules or directories and compile each one to an
+``.mlog`` file on a pool of processes, with a JSON manifest of the results.
+"""
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from MindApi.passes import DEFAULT_OPT_LEVEL
+
+MANIFEST_VERSION = 1
+MANIFEST = "manifest.json"
+
+Target = Tuple[str, str]  # module and qualified name of a processor class
+
+
+def is_processor(value) -> bool:
+    return inspect.isclass(value) and (
+        callable(getattr(value, "init", None)) or callable(getattr(value, "loop", None))
+    )
+
+
+def module_names(source: str) -> Tuple[Optional[str], List[str]]:
+    """
+    The directory to import ``source`` from (None if it is importable as
+    is) and the modules it stands for. ``source`` is a dotted module or
+    package name, a python file or a directory.
+    """
+    path = os.path.abspath(source)
+    if os.path.isfile(path):
+        root, name = os.path.split(path)
+        return root, [os.path.splitext(name)[0]]
+    if not os.path.isdir(path):
+        return None, [source]
+    if os.path.exists(os.path.join(path, "__init__.py")):
+        root, name = os.path.split(path)
+        return root, [name]
+    # a plain directory of modules and packages
+    return path, [module.name for module in pkgutil.iter_modules([path])]
+
+
+def walk(name: str, errors: Dict[str, str]) -> Iterator[str]:
+    """
+    ``name`` and, if it is a package, every module inside it. Subpackages
+    that fail to import are recorded in ``errors`` and skipped.
+    """
+
+    def failed(module: str):
+        errors[module] = traceback.format_exc()
+
+    module = importlib.import_module(name)
+    yield name
+    if hasattr(module, "__path__"):
+        for info in pkgutil.walk_packages(module.__path__, name + ".", failed):
+            yield info.name
+
+
+def discover(sources: Iterable[str]) -> Tuple[List[Target], List[str], Dict]:
+    """
+    Processor classes defined in ``sources``, the directories they are
+    imported from, and the modules that failed to import with the error
+    """
+    targets: List[Target] = []
+    roots: List[str] = []
+    errors: Dict[str, str] = {}
+    for source in sources:
+        root, names = module_names(source)
+        if root is not None and root not in sys.path:
+            sys.path.insert(0, root)
+        if root is not None and root not in roots:
+            roots.append(root)
+        for name in names:
+            try:
+                modules = list(walk(name, errors))
+            except Exception:
+                errors[name] = traceback.format_exc()
+                continue
+            for module_name in modules:
+                if module_name in errors:
+                    continue
+                try:
+                    module = importlib.import_module(module_name)
+                except Exception:
+                    errors[module_name] = traceback.format_exc()
+                    continue
+                for qualname, value in vars(module).items():
+                    # imported classes are built where they are defined
+                    if is_processor(value) and value.__module__ == module_name:
+                        target = (module_name, qualname)
+                        if target not in targets:
+                            targets.append(target)
+    return targets, roots, errors
+
+
+def output_name(target: Target) -> str:
+    return f"{target[0]}.{target[1]}.mlog"
+
+
+def outcome(target: Target, error: Optional[str] = None) -> dict:
+    """
+    Manifest entry of a processor class
+    """
+    return {
+        "module": target[0],
+        "class": target[1],
+        "output": None,
+        "instructions": None,
+        "seconds": 0.0,
+        "error": error,
+    }
+
+
+def build_one(
+    target: Target,
+    output: str,
+    roots: List[str],
+    opt_level: int = DEFAULT_OPT_LEVEL,
+    cache: Optional[str] = None,
+) -> dict:
+    """
+    Compile one processor class to ``output`` and describe the result.
+    Runs in the worker processes, exceptions end up in the result.
+    """
+    from MindApi.cache import CompileCache
+    from MindApi.core import compiler
+    from MindApi.mlog import dump
+
+    for root in roots:
+        if root not in sys.path:
+            sys.path.insert(0, root)
+    result = outcome(target)
+    start = time.perf_counter()
+    try:
+        cls = getattr(importlib.import_module(target[0]), target[1])
+        instructions = compiler(
+            cls,
+            opt_level=opt_level,
+            cache=CompileCache(cache) if cache is not None else None,
+        )
+        path = os.path.join(output, output_name(target))
+        with open(path, "w") as file:
+            dump(instructions, file)
+        result["output"] = path
+        result["instructions"] = len(instructions)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def collect(future, target: Target) -> dict:
+    """
+    Result of a worker, or the error a worker that died left behind
+    """
+    try:
+        return future.result()
+    except BaseException:
+        return outcome(target, traceback.format_exc())
+
+
+def build(
+    sources: Iterable[str],
+    output: str,
+    jobs: Optional[int] = None,
+    opt_level: int = DEFAULT_OPT_LEVEL,
+    cache: Optional[str] = None,
+) -> dict:
+    """
+    Compile every processor class of ``sources`` into ``output`` on
+    ``jobs`` processes (one per core by default, in this process with 1)
+    and write the manifest. A class or module that fails is recorded in
+    the manifest, the others are still built.
+    """
+    start = time.perf_counter()
+    os.makedirs(output, exist_ok=True)
+    targets, roots, errors = discover(sources)
+    if jobs == 1 or len(targets) <= 1:
+        results = [build_one(t, output, roots, opt_level, cache) for t in targets]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(build_one, t, output, roots, opt_level, cache)
+                for t in targets
+            ]
+            results = [
+                collect(future, target) for future, target in zip(futures, targets)
+            ]
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "opt_level": opt_level,
+        "seconds": time.perf_counter() - start,
+        "built": sum(result["error"] is None for result in results),
+        "failed": sum(result["error"] is not None for result in results) + len(errors),
+        "classes": results,
+        "modules": [{"module": name, "error": error} for name, error in errors.items()],
+    }
+    with open(os.path.join(output, MANIFEST), "w") as file:
+        json.dump(manifest, file, indent=2)
+    return manifest
@@ -1,11 +1,57 @@
 import abc
-from typing import Union
+import itertools
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
-from MindApi.types import MetaType, OperationType, UnitType
+from MindApi.types import MetaType, OperationType
+
+if TYPE_CHECKING:
+    from MindApi.types import UnitType
 from MindApi.utils import binary_ops, condition_ops, condition_ops_inverse
 
+# mlog names of the operators of Operation, by ast name or OperationType
+# (whose members equal their mlog name)
+_OPERATORS = dict(binary_ops)
+_OPERATORS.update((op, op.value) for op in OperationType)
+# padding of the arguments of draw and ucontrol, by number of arguments
+_DRAW_PADDING = [("0",) * (6 - n) for n in range(7)]
+_CONTROL_PADDING = [("0",) * (5 - n) for n in range(6)]
+
+# attributes telling where an instruction comes from: the python method it
+# was converted from and where in its source file (1-based line, 0-based column)
+LOCATION = ("method", "line", "column")
+
 
 class MetaInstruction(metaclass=abc.ABCMeta):
+    """
+    Instructions keep their attributes in slots, programs hold tens of
+    thousands of them once loops are unrolled and methods inlined.
+    ``fields`` names the attributes of each kind of instruction, in order.
+    """
+
+    __slots__ = LOCATION
+    # None until set, see ``__getattr__``
+    method: Optional[str]
+    line: Optional[int]
+    column: Optional[int]
+    fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+            if name not in LOCATION
+        )
+
+    def __getattr__(self, name: str):
+        # where an instruction comes from is unknown until it is set
+        if name in LOCATION:
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
     @abc.abstractmethod
     def __str__(self):
         pass
@@ -13,6 +59,8 @@ class MetaInstruction(metaclass=abc.ABCMeta):
 
 # ---------Input/Output---------#
 class Read(MetaInstruction):
+    __slots__ = ("dest", "src", "index")
+
     def __init__(self, dest: str, src: str, index: str):
         self.dest = dest
         self.src = src
@@ -23,6 +71,8 @@ class Read(MetaInstruction):
 
 
 class Write(MetaInstruction):
+    __slots__ = ("dest", "src", "index")
+
     def __init__(self, src: str, dest: str, index: str):
         self.dest = dest
         self.src = src
@@ -33,16 +83,22 @@ class Write(MetaInstruction):
 
 
 class Draw(MetaInstruction):
+    __slots__ = ("cmd", "args")
+
     def __init__(self, cmd: str, *args):
         self.cmd = cmd
         self.args = args
 
     def __str__(self):
-        args = list(self.args) + ["0"] * (6 - len(self.args))
+        args = self.args
+        if len(args) < 6:
+            args = (*args, *_DRAW_PADDING[len(args)])
         return f"draw {self.cmd} {' '.join(args)}"
 
 
 class Print(MetaInstruction):
+    __slots__ = ("val", "is_var")
+
     def __init__(self, val: str, is_var: bool = False):
         self.val = val
         self.is_var = is_var
@@ -56,6 +112,8 @@ class Print(MetaInstruction):
 
 # ---------Block Control---------#
 class DrawFlush(MetaInstruction):
+    __slots__ = ("display",)
+
     def __init__(self, display: str):
         self.display = display
 
@@ -64,6 +122,8 @@ class DrawFlush(MetaInstruction):
 
 
 class PrintFlush(MetaInstruction):
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
 
@@ -72,6 +132,8 @@ class PrintFlush(MetaInstruction):
 
 
 class GetLink(MetaInstruction):
+    __slots__ = ("dest", "src")
+
     def __init__(self, dest: str, src: int):
         self.dest = dest
         self.src = src
@@ -82,7 +144,10 @@ class GetLink(MetaInstruction):
 
 # ---------Operations---------#
 class Set(MetaInstruction):
-    def __init__(self, dest: str, src: Union[str, float, int]) -> None:
+    __slots__ = ("dest", "src")
+
+    def __init__(self, dest: str, src: Union[str, float, int, "Label"]) -> None:
+        # a label is the address a call returns to, until ``link``
         self.dest = dest
         self.src = src
 
@@ -91,6 +156,8 @@ class Set(MetaInstruction):
 
 
 class Operation(MetaInstruction):
+    __slots__ = ("dest", "left", "op", "right")
+
     def __init__(
         self,
         dest: str,
@@ -104,17 +171,15 @@ class Operation(MetaInstruction):
         self.right = right
 
     def __str__(self) -> str:
-        if not isinstance(self.op, OperationType):
-            try:
-                op = binary_ops[self.op]
-            except KeyError:
-                raise ValueError(f"Invalid binary operator: {self.op}")
-        else:
-            op = self.op.value
+        op = _OPERATORS.get(self.op)
+        if op is None:
+            raise ValueError(f"Invalid binary operator: {self.op}")
         return f"op {self.dest} {self.left} {op} {self.right}"
 
 
 class LookUp(MetaInstruction):
+    __slots__ = ("dest", "type", "index")
+
     def __init__(self, dest: str, type: MetaType, index: int):
         self.dest = dest
         self.type = type
@@ -125,6 +190,8 @@ class LookUp(MetaInstruction):
 
 
 class PackColor(MetaInstruction):
+    __slots__ = ("dest", "r", "g", "b", "a")
+
     def __init__(self, dest: str, rgba_tuple: tuple = (1, 0, 0, 1)):
         self.dest = dest
         if len(rgba_tuple) != 4:
@@ -139,13 +206,33 @@ class PackColor(MetaInstruction):
 
 
 # ---------Flow Control---------#
+class Label(MetaInstruction):
+    """
+    Names the position of the instruction following it. Jumps, jump tables
+    and return addresses refer to labels until ``link`` replaces them with
+    indices and drops the labels. Not an mlog instruction.
+    """
+
+    __slots__ = ("name",)
+
+    _numbers = itertools.count()
+
+    def __init__(self, name: str = "label"):
+        self.name = f"{name}{next(self._numbers)}"
+
+    def __str__(self):
+        return self.name
+
+
 class Jump(MetaInstruction):
+    __slots__ = ("left", "op", "right", "to", "reverse")
+
     def __init__(
         self,
         left: Union[str, float, int],
         op: str,
         right: Union[str, float, int],
-        to: Union[int, str],
+        to: Union[int, str, Label],
         reverse=True,
     ):
         self.left = left
@@ -154,18 +241,40 @@ class Jump(MetaInstruction):
         self.to = to
         self.reverse = reverse
 
+    @classmethod
+    def always(cls, to: Union[int, str, Label]) -> "Jump":
+        """
+        Unconditional jump
+        """
+        return cls("1", "Eq", "1", to, reverse=False)
+
     def __str__(self) -> str:
-        try:
-            if self.reverse:
-                op = condition_ops_inverse[self.op]
-            else:
-                op = condition_ops[self.op]
-            return f"jump {self.to} {self.left} {op} {self.right}"
-        except KeyError:
+        op = (condition_ops_inverse if self.reverse else condition_ops).get(self.op)
+        if op is None:
             raise ValueError(f"Invalid condition operator: {self.op}")
+        return f"jump {self.to} {self.left} {op} {self.right}"
+
+
+class JumpTable(MetaInstruction):
+    """
+    Jump to ``targets[index]``, ``index`` must be within the table.
+    Not an mlog instruction: it is emitted as ``op add @counter @counter index``
+    followed by one jump per target.
+    """
+
+    __slots__ = ("index", "targets")
+
+    def __init__(self, index: Union[str, int], targets: list):
+        self.index = index
+        self.targets = targets
+
+    def __str__(self):
+        return f"jumptable {self.index} {' '.join(str(t) for t in self.targets)}"
 
 
 class Wait(MetaInstruction):
+    __slots__ = ("time",)
+
     def __init__(self, delay_seconds: float):
         self.time = delay_seconds
 
@@ -178,6 +287,8 @@ class Stop(MetaInstruction):
     Stop the program
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return "stop"
 
@@ -187,13 +298,17 @@ class End(MetaInstruction):
     Jump to the beginning of the program
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return "end"
 
 
 # ---------Unit Control---------#
 class UnitBind(MetaInstruction):
-    def __init__(self, unitType: UnitType):
+    __slots__ = ("unit_type",)
+
+    def __init__(self, unitType: "UnitType"):
         self.unit_type = unitType
 
     def __str__(self):
@@ -201,16 +316,29 @@ class UnitBind(MetaInstruction):
 
 
 class UnitControl(MetaInstruction):
+    __slots__ = ("actiontype", "args")
+
     def __init__(self, actiontype: str, *args):
         self.actiontype = actiontype
         self.args = args
 
     def __str__(self):
-        args = list(self.args) + ["0"] * (5 - len(self.args))
+        args = self.args
+        if len(args) < 5:
+            args = (*args, *_CONTROL_PADDING[len(args)])
         return f"ucontrol {self.actiontype} {' '.join(args)}"
 
 
 class UnitRadar(MetaInstruction):
+    __slots__ = (
+        "dest",
+        "targetclass1",
+        "targetclass2",
+        "targetclass3",
+        "order",
+        "sort",
+    )
+
     def __init__(
         self,
         dest: str,
@@ -232,6 +360,8 @@ class UnitRadar(MetaInstruction):
 
 
 class UnitLocate(MetaInstruction):
+    __slots__ = ("outX", "outY", "Found", "building", "find", "group", "enemy")
+
     def __init__(
         self,
         outX: str,
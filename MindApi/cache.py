@@ -0,0 +1,170 @@
+"""
+On-disk compilation cache: compiled programs keyed by a hash of the source
+of the methods of a class, the compiler itself and the options, so an
+unchanged class is loaded instead of compiled again.
+"""
+import contextlib
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+from typing import Any, List, Mapping, Optional, Tuple
+
+from MindApi.builtin import MetaInstruction
+from MindApi.cost import CostReport
+
+CACHE_VERSION = 1
+CACHE_SIZE = 64 * 1024 * 1024  # bytes kept on disk before the oldest go
+SUFFIX = ".mlogc"
+
+Entry = Tuple[List[MetaInstruction], Optional[CostReport]]
+
+
+@functools.lru_cache(maxsize=None)
+def compiler_version() -> str:
+    """
+    Hash of the source of the compiler, a cache entry made by any other
+    compiler does not apply
+    """
+    digest = hashlib.sha256(str(CACHE_VERSION).encode())
+    root = os.path.dirname(os.path.abspath(__file__))
+    for directory, subdirectories, files in sorted(os.walk(root)):
+        subdirectories.sort()
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(directory, name)
+                digest.update(os.path.relpath(path, root).encode())
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+    return digest.hexdigest()
+
+
+def class_source(cls) -> str:
+    """
+    Source of every method ``cls`` defines or inherits, by name, with the
+    file and line it starts at: the program records where its instructions
+    come from
+    """
+    sources = []
+    for name in sorted(dir(cls)):
+        value = getattr(cls, name)
+        if not inspect.isfunction(value):
+            continue
+        try:
+            source = inspect.getsource(value)
+        except (OSError, TypeError):
+            continue  # not compiled from source, it cannot be called
+        where = f"{inspect.getsourcefile(value)}:{value.__code__.co_firstlineno}"
+        sources.append(f"{name} {where}\n{source}")
+    return "\n".join(sources)
+
+
+def cache_key(cls, options: Mapping[str, Any]) -> str:
+    """
+    Key of the program ``cls`` compiles to with ``options``
+    """
+    digest = hashlib.sha256(compiler_version().encode())
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode())
+    digest.update(class_source(cls).encode())
+    return digest.hexdigest()
+
+
+class CompileCache:
+    """
+    Compiled programs stored in ``directory``, one file per key. Once the
+    files take more than ``max_size`` bytes the least recently used go.
+    Pass one to ``compiler(cls, cache=...)``.
+    """
+
+    def __init__(self, directory: str, max_size: int = CACHE_SIZE):
+        self.directory = directory
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def get(self, key: str) -> Optional[Entry]:
+        """
+        The entry stored under ``key``, None if there is none or it is
+        unreadable. An unreadable entry is removed.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+            instructions, cost = entry
+            if not all(isinstance(inst, MetaInstruction) for inst in instructions):
+                raise TypeError("Not a compiled program")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # whatever a corrupt or stale file raises, it is compiled again
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # used just now
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: Entry):
+        """
+        Store ``entry`` under ``key`` and evict the least recently used
+        entries beyond the size limit
+        """
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                pickle.dump(entry, file, pickle.HIGHEST_PROTOCOL)
+            # replaced at once, a concurrent reader never sees half a file
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.evict()
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Last use, size and path of every entry, least recently used first
+        """
+        result = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue  # evicted by another build
+            result.append((stat.st_mtime, stat.st_size, path))
+        return sorted(result)
+
+    @property
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.unlink(path)
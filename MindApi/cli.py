@@ -0,0 +1,119 @@
+"""
+Command line interface, ``python -m MindApi <command>``
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from MindApi.passes import DEFAULT_OPT_LEVEL
+
+
+def positive(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+
+def build_command(args: argparse.Namespace) -> int:
+    from MindApi.build import MANIFEST, build
+
+    manifest = build(args.sources, args.output, args.jobs, args.opt_level, args.cache)
+    for result in manifest["classes"]:
+        name = f"{result['module']}.{result['class']}"
+        if result["error"] is None:
+            print(f"{name}: {result['instructions']} instructions", file=sys.stderr)
+        else:
+            print(f"{name}: failed\n{result['error']}", file=sys.stderr)
+    for module in manifest["modules"]:
+        print(f"{module['module']}: import failed\n{module['error']}", file=sys.stderr)
+    print(
+        f"built {manifest['built']}, failed {manifest['failed']}"
+        f" in {manifest['seconds']:.2f}s, see {args.output}/{MANIFEST}",
+        file=sys.stderr,
+    )
+    return 1 if manifest["failed"] else 0
+
+
+def watch_command(args: argparse.Namespace) -> int:
+    from MindApi.watch import Watcher
+
+    watcher = Watcher(args.sources, args.output, args.opt_level)
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def serve_command(args: argparse.Namespace) -> int:
+    from MindApi.server import serve
+
+    def ready(addresses):
+        print(f"listening on {', '.join(map(str, addresses))}", file=sys.stderr)
+
+    try:
+        serve(args.socket, args.host, args.port, args.cache_size, ready)
+    except KeyboardInterrupt:
+        pass
+    except ValueError as error:
+        print(f"serve: {error}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    result = argparse.ArgumentParser(prog="python -m MindApi")
+    commands = result.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build", help="compile every processor class found in packages or files"
+    )
+    build.add_argument(
+        "sources", nargs="+", help="package or module names, directories or files"
+    )
+    build.add_argument("-o", "--output", default="build", help="directory to write to")
+    build.add_argument(
+        "-j", "--jobs", type=positive, help="processes to compile on (default: cores)"
+    )
+    build.add_argument(
+        "-O", "--opt-level", type=int, default=DEFAULT_OPT_LEVEL, choices=(0, 1, 2)
+    )
+    build.add_argument("--cache", help="directory of the compilation cache")
+    build.set_defaults(run=build_command)
+
+    watch = commands.add_parser(
+        "watch", help="rebuild processor classes whenever their source changes"
+    )
+    watch.add_argument(
+        "sources", nargs="+", help="package or module names, directories or files"
+    )
+    watch.add_argument("-o", "--output", default="build", help="directory to write to")
+    watch.add_argument(
+        "-O", "--opt-level", type=int, default=DEFAULT_OPT_LEVEL, choices=(0, 1, 2)
+    )
+    watch.add_argument(
+        "--interval", type=float, default=0.1, help="seconds between checks"
+    )
+    watch.set_defaults(run=watch_command)
+
+    serve = commands.add_parser(
+        "serve", help="compile the source sent over a local socket, with warm caches"
+    )
+    serve.add_argument("--socket", help="unix socket to listen on")
+    serve.add_argument(
+        "--host", default="127.0.0.1", help="loopback address to listen on"
+    )
+    serve.add_argument(
+        "--port", type=int, default=0, help="port to listen on without --socket"
+    )
+    serve.add_argument(
+        "--cache-size", type=int, default=256, help="results and classes kept"
+    )
+    serve.set_defaults(run=serve_command)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parser().parse_args(argv)
+    return args.run(args)
@@ -0,0 +1,89 @@
+"""
+Client of the compile server (``python -m MindApi serve``)
+"""
+import itertools
+import json
+import socket
+from typing import Dict, Optional
+
+
+class CompileError(ValueError):
+    """
+    Raised when the server could not compile the source it was sent
+    """
+
+
+class Client:
+    """
+    Connection to a compile server on the unix socket ``path`` or on
+    ``host`` and ``port``. Requests are answered in the order they are
+    sent, a client is not meant to be shared between threads.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        if path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(path)
+        elif port is not None:
+            self.socket = socket.create_connection((host, port), timeout)
+        else:
+            raise ValueError("Either a socket path or a port is needed")
+        self.file = self.socket.makefile("rwb")
+        self._ids = itertools.count()
+
+    def request(self, payload: dict) -> dict:
+        """
+        Send one request and wait for the answer
+        """
+        payload = dict(payload, id=next(self._ids))
+        self.file.write(json.dumps(payload).encode() + b"\n")
+        self.file.flush()
+        line = self.file.readline()
+        if not line:
+            raise ConnectionError("The compile server closed the connection")
+        return json.loads(line)
+
+    def compile(
+        self,
+        source: str,
+        cls: Optional[str] = None,
+        opt_level: Optional[int] = None,
+        document: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        The mlog of the processor class ``cls`` of ``source``, or of every
+        one, by class name. Sources sent with the same ``document`` name
+        are versions of one file, a new one only converts the methods that
+        changed.
+        """
+        payload: dict = {"source": source}
+        if cls is not None:
+            payload["class"] = cls
+        if opt_level is not None:
+            payload["opt_level"] = opt_level
+        if document is not None:
+            payload["document"] = document
+        answer = self.request(payload)
+        if not answer["ok"]:
+            raise CompileError(answer["error"])
+        return answer["programs"]
+
+    def stats(self) -> dict:
+        return self.request({"op": "stats"})
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,52 +1,280 @@
 import ast
+import collections
+import copy
 import inspect
-from typing import Any, Callable, List
+import textwrap
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
 
-from MindApi.builtin import Jump, MetaInstruction, Operation, Set
+from MindApi.analysis import (
+    COUNTER,
+    address_field,
+    inherit,
+    map_addresses,
+    relocate,
+    return_register,
+)
+from MindApi.builtin import (
+    Jump,
+    JumpTable,
+    Label,
+    MetaInstruction,
+    Operation,
+    Read,
+    Set,
+    Write,
+)
+from MindApi.cache import CompileCache, cache_key
+from MindApi.cost import CostReport, check_budget, estimate
+from MindApi.emulator import DEFAULT_PROCESSOR
 from MindApi.extension import PythonBuiltIn
+from MindApi.mlog import emit, listing
+from MindApi.passes import DEFAULT_OPT_LEVEL, optimize
+from MindApi.pgo import Profile
 
 SHOULD_REMOVE = "__remove"  # It signals that the instruction should be removed
 
 
-class CodeConvert(ast.NodeVisitor):
+INLINE_SIZE = 4  # a call costs about as many instructions besides the arguments
+HOT_INLINE_SIZE = 16  # largest method inlined when the profile says it is hot
+
+JUMP_TABLE_SIZE = 4  # fewest cases an if/elif chain needs to become a jump table
+JUMP_TABLE_INDEX = "__case"
+JUMP_TABLE_WHOLE = "__case_whole"  # the index without its fraction
+
+STACK = "cell1"  # memory cell recursive calls save their variables in
+STACK_POINTER = "__sp"
+
+
+class MethodCache:
+    """
+    What one compilation learns about the methods of a class. Every method
+    is parsed, renamed and converted once however many call sites it has.
+    """
+
     def __init__(self, cls):
+        self.cls = cls
+        self._sources: Dict[str, ast.AST] = {}
+        self._trees: Dict[str, ast.AST] = {}
+        self._origins: Dict[str, Callable[[int, int], Tuple[int, int]]] = {}
+        # converted methods and whether calls to them are inlined
+        self.converted: Dict[str, "CodeConvert"] = {}
+        self.inlined: Dict[str, bool] = {}
+        # init and loop
+        self.programs: Dict[str, "CodeConvert"] = {}
+        # labels of the first instruction of every method
+        self.entries: Dict[str, Label] = {}
+        self.graph = call_graph(cls, self.source)
+        self.recursive = recursive_methods(self.graph)
+
+    def update(self, cls, changed: Iterable[str], moved: Dict[str, int]) -> set:
+        """
+        Switch to ``cls``, a new version of the class. The methods in
+        ``changed`` have new code, the ones in ``moved`` the same code that
+        many lines further down. Forget every conversion that depends on the
+        changed methods and return the methods converted again.
+        """
+        self.cls = cls
+        for name in set(changed) | set(moved):
+            self._origins.pop(name, None)
+        for name in changed:
+            self._sources.pop(name, None)
+            self._trees.pop(name, None)
+        graph = call_graph(cls, self.source)
+        recursive = recursive_methods(graph)
+
+        # how often a method is called and whether it is recursive decide
+        # whether it is inlined
+        stale = set(changed) | (recursive ^ self.recursive)
+        before = collections.Counter(c for cs in self.graph.values() for c in cs)
+        after = collections.Counter(c for cs in graph.values() for c in cs)
+        stale |= {name for name in before | after if before[name] != after[name]}
+        # and the methods calling them hold their code or their calls
+        callers: Dict[str, set] = {}
+        for calls in (self.graph, graph):
+            for caller, callees in calls.items():
+                for callee in callees:
+                    callers.setdefault(callee, set()).add(caller)
+        pending = list(stale)
+        while pending:
+            for caller in callers.get(pending.pop(), ()):
+                if caller not in stale:
+                    stale.add(caller)
+                    pending.append(caller)
+        self.graph, self.recursive = graph, recursive
+        for name in stale:
+            self.converted.pop(name, None)
+            self.inlined.pop(name, None)
+            self.programs.pop(name, None)
+        self._shift(moved)
+        return stale
+
+    def _shift(self, moved: Dict[str, int]):
+        """
+        Move the instructions converted from the methods in ``moved``
+        """
+        if not moved:
+            return
+        seen = set()
+        for name, code in [*self.converted.items(), *self.programs.items()]:
+            for owner, body in [(name, code.instructions), *code.fn_list.items()]:
+                for inst in body:
+                    if id(inst) in seen or inst.line is None:
+                        continue
+                    seen.add(id(inst))
+                    # inlined code is tagged with the method it comes from
+                    inst.line += moved.get(inst.method or owner, 0)
+
+    def source(self, name: str) -> ast.AST:
+        """
+        The body of method ``name`` as ``pre_process`` leaves it
+        """
+        if name not in self._sources:
+            self._sources[name] = ast.parse(pre_process(getattr(self.cls, name)))
+        return self._sources[name]
+
+    def tree(self, name: str) -> ast.AST:
+        """
+        The body of method ``name`` with its variables renamed apart
+        """
+        if name not in self._trees:
+            self._trees[name] = isolate(getattr(self.cls, name))
+        return self._trees[name]
+
+    def origin(self, name: str) -> Callable[[int, int], Tuple[int, int]]:
+        if name not in self._origins:
+            self._origins[name] = origin(getattr(self.cls, name))
+        return self._origins[name]
+
+    def entry(self, name: str) -> Label:
+        return self.entries.setdefault(name, Label(name))
+
+
+class CodeConvert(ast.NodeVisitor):
+    def __init__(
+        self,
+        cls,
+        inline: bool = False,
+        cache: Optional[MethodCache] = None,
+        active=frozenset(),
+        method: Optional[str] = None,
+        stack: str = STACK,
+        profile: Optional[Profile] = None,
+    ):
         self.cls = cls
         self._instructions: list[MetaInstruction] = []
         self._fn_list: dict[str, list[MetaInstruction]] = {}
+        # expand calls to small or single-use methods in place
+        self.inline = inline
+        self.cache = MethodCache(cls) if cache is None else cache
+        # methods being converted further up, a recursive call only jumps there
+        self._active: frozenset = active
+        # the method being converted and where it saves its variables
+        # around calls that may come back to it
+        self.method = method
+        self.stack = stack
+        # execution counts steering inlining and the layout of if statements
+        self.profile = profile
+        # the innermost node being converted, new instructions come from it
+        self._node: Optional[ast.AST] = None
+        # where the returns of the method go
+        self.exit = Label("return")
+        # where a break in each enclosing loop goes
+        self._breaks: List[Label] = []
 
     # utility functions
     def push(self, instruction: MetaInstruction):
+        if self._node is not None and instruction.line is None:
+            instruction.line, instruction.column = self.position(self._node)
         self._instructions.append(instruction)
 
+    def visit(self, node: ast.AST) -> Any:
+        outer = self._node
+        if hasattr(node, "lineno"):
+            self._node = node
+        result = super().visit(node)
+        self._node = outer
+        return result
+
+    def position(self, node: ast.AST) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Line and column of ``node`` in the file the method being converted
+        is defined in
+        """
+        if self.method is None or not hasattr(self.cls, self.method):
+            return None, None
+        return self.cache.origin(self.method)(
+            node.lineno, node.col_offset  # type: ignore
+        )
+
     def pop(self):
         return self._instructions.pop()
 
-    def print_instructions(self):
-        for i, inst in enumerate(self._instructions):
-            print(f"{i}: {inst}")
+    def place(self, label: Label):
+        """
+        Make ``label`` refer to the next instruction pushed
+        """
+        self._instructions.append(label)
+
+    def print_instructions(self, file: Optional[TextIO] = None):
+        listing(self._instructions, file)
 
     def mlog(self) -> str:
-        self.print_instructions()
-        return "\n".join([str(i) for i in self._instructions])
-
-    def fn_code_process(self, fn: Callable) -> ast.AST:
-        fn_code = pre_process(fn)
-        # var name isolation
-        fn_ast = ast.parse(fn_code)
-
-        class FnVarNameIsolation(ast.NodeTransformer):
-            def visit_Call(self, node: ast.Call) -> ast.Call:
-                for arg in node.args:
-                    self.visit(arg)
-                return node
+        return "\n".join(emit(self._instructions))
 
-            def visit_Name(self, node: ast.Name) -> ast.Name:
-                if node.id.startswith("__"):
-                    return node
-                node.id = f"__{fn.__name__}__{node.id}"
-                return node
+    @property
+    def graph(self) -> Dict[str, List[str]]:
+        return self.cache.graph
+
+    def should_inline(self, func: Callable, body: List[MetaInstruction]) -> bool:
+        if func.__name__ in self.cache.recursive:
+            return False
+        forced = getattr(func, "__mindapi_inline__", None)
+        if forced is not None:
+            return forced
+        if not self.inline:
+            return False
+        calls = sum(callees.count(func.__name__) for callees in self.graph.values())
+        limit = INLINE_SIZE
+        if self.profile is not None:
+            if self.profile.cold(func.__name__):
+                limit = 0  # never runs, only worth inlining to save space
+            elif self.profile.hot(func.__name__):
+                limit = HOT_INLINE_SIZE
+        size = sum(not isinstance(inst, Label) for inst in body)
+        # the trailing return jump disappears when the body is inlined
+        return calls <= 1 or size - 1 <= limit
+
+    def inline_call(self, func: Callable, body: List[MetaInstruction], exit: Label):
+        """
+        Place the body of ``func`` at the call site, returns jump past it
+        """
+        tag(body, func.__name__)
+        self._instructions += body
+        self.place(exit)
 
-        return FnVarNameIsolation().visit(fn_ast)
+    def frame(self, method: str, call: ast.Call) -> List[str]:
+        """
+        Variables of ``method`` that ``call`` may overwrite while they are
+        still needed: its return register and the arguments and local
+        variables that may be read after the call returns
+        """
+        prefix = f"__{method}__"
+        names = {
+            name
+            for name in live_after(self.cache.tree(method), call)
+            if name.startswith(prefix)
+        }
+        return [return_register(method)] + sorted(names)
+
+    def spill(self, names: List[str]):
+        for name in names:
+            self.push(Write(name, self.stack, STACK_POINTER))
+            self.push(Operation(STACK_POINTER, STACK_POINTER, "Add", 1))
+
+    def restore(self, names: List[str]):
+        for name in reversed(names):
+            self.push(Operation(STACK_POINTER, STACK_POINTER, "Sub", 1))
+            self.push(Read(name, self.stack, STACK_POINTER))
 
     def visit_Constant(self, node: ast.Constant) -> Any:
         if node.value is True:
@@ -135,53 +363,130 @@ class CodeConvert(ast.NodeVisitor):
         self.push(Operation(dest, left, op, right))
 
     def visit_While(self, node: ast.While):
+        start, end = Label("while"), Label("end")
+        self.place(start)
         if isinstance(node.test, ast.Constant) or isinstance(node.test, ast.Name):
             self.visit_Compare(ast.Compare(node.test, [ast.Eq()], [ast.Constant(1)]))
-
-            # transform the jump instruction
-            binInst: Operation = self.pop()  # type: ignore
-            self.push(Jump(binInst.left, binInst.op, binInst.right, SHOULD_REMOVE))
-            jumpIndex = len(self._instructions)
-            for i in node.body:
-                self.visit(i)
-            self._instructions[jumpIndex - 1].to = len(self._instructions) + 1  # type: ignore
-
-            # fill the break instruction
-            for i in self._instructions[jumpIndex:]:  # type: ignore
-                if isinstance(i, Jump) and i.to == SHOULD_REMOVE:
-                    i.to = len(self._instructions) + 1
         elif isinstance(node.test, ast.Compare):
             self.visit_Compare(node.test)
-            binInst: Operation = self.pop()  # type: ignore
-            self.push(Jump(binInst.left, binInst.op, binInst.right, -1))
-            jumpIndex = len(self._instructions)
-            for i in node.body:
-                self.visit(i)
-            self._instructions[jumpIndex - 1].to = len(self._instructions) + 1  # type: ignore
         else:
             raise NotImplementedError(f"While with {type(node.test)} is not supported")
 
-        self.push(
-            Jump("1", ast.Eq().__class__.__name__, "1", jumpIndex - 1)
-        )  # jump to the beginning of the loop
+        # transform the jump instruction
+        binInst: Operation = self.pop()  # type: ignore
+        self.push(Jump(binInst.left, binInst.op, binInst.right, end))
+        self._breaks.append(end)
+        for i in node.body:
+            self.visit(i)
+        self._breaks.pop()
+        self.push(Jump.always(start))  # jump to the beginning of the loop
+        self.place(end)
 
     def visit_Break(self, node: ast.Break):
-        self.push(Jump("1", ast.Eq().__class__.__name__, "1", SHOULD_REMOVE))
+        self.push(Jump.always(self._breaks[-1]))
+
+    def jump_table(self, var: str, cases: Dict[int, list], orelse: list):
+        """
+        Dispatch on ``var`` with a single computed jump instead of testing
+        the cases one by one
+        """
+        low, high = min(cases), max(cases)
+        index = var
+        if low != 0:
+            index = JUMP_TABLE_INDEX
+            self.push(Operation(index, var, "Sub", low))
+        # values outside the table run the else branch
+        default, end = Label("default"), Label("end")
+        self.push(Jump(index, "Lt", 0, default, reverse=False))
+        self.push(Jump(index, "Gt", high - low, default, reverse=False))
+        # and so do values with a fraction, the processor would run the case
+        # of their integer part
+        self.push(Operation(JUMP_TABLE_WHOLE, index, "FloorDiv", 1))
+        self.push(Jump(JUMP_TABLE_WHOLE, "NotEq", index, default, reverse=False))
+        starts = {value: Label("case") for value in cases}
+        self.push(
+            JumpTable(index, [starts.get(v, default) for v in range(low, high + 1)])
+        )
+        for value, body in cases.items():
+            self.place(starts[value])
+            for i in body:
+                self.visit(i)
+            self.push(Jump.always(end))
+        self.place(default)
+        for i in orelse:
+            self.visit(i)
+        self.place(end)
 
     def visit_If(self, node: ast.If):
+        chain = switch_cases(node)
+        if chain is not None:
+            var, cases, orelse = chain
+            if len(cases) >= JUMP_TABLE_SIZE and max(cases) - min(cases) < 2 * len(
+                cases
+            ):  # dense enough
+                self.jump_table(var, cases, orelse)
+                return
+            node = self.order_cases(node)
         if not isinstance(node.test, ast.Compare):
             raise NotImplementedError(f"If with {type(node.test)} is not supported")
         self.visit_Compare(node.test)
 
         # transform the jump instruction
         binInst: Operation = self.pop()  # type: ignore
-        self.push(Jump(binInst.left, binInst.op, binInst.right, SHOULD_REMOVE))
-        jumpIndex = len(self._instructions)
-        for i in node.body:
-            self.visit(i)
-        self._instructions[jumpIndex - 1].to = len(self._instructions)  # type: ignore
-        for i in node.orelse:
+        skip, end = Label("else"), Label("end")
+        jump = Jump(
+            binInst.left, binInst.op, binInst.right, skip if node.orelse else end
+        )
+        self.push(jump)
+        body, orelse = node.body, node.orelse
+        if orelse and self.profile is not None:
+            held, failed = self.profile.branch(self.method, jump.line)  # type: ignore
+            if held > failed:
+                # the branch laid out second does not jump at its end,
+                # give that to the one running most
+                jump.reverse = False
+                body, orelse = orelse, body
+        for i in body:
             self.visit(i)
+        if orelse:
+            # the body has to skip the else branch
+            self.push(Jump.always(end))
+            self.place(skip)
+            for i in orelse:
+                self.visit(i)
+        self.place(end)
+
+    def order_cases(self, node: ast.If) -> ast.If:
+        """
+        Test the cases of a chain comparing one variable against constants
+        in the order the profile saw them run most. The tests exclude each
+        other, only the first of cases with the same value ever runs.
+        """
+        if self.profile is None:
+            return node
+        arms: List[ast.If] = []
+        values = set()
+        while True:
+            value = [
+                side.value
+                for side in (node.test.left, node.test.comparators[0])  # type: ignore
+                if isinstance(side, ast.Constant)
+            ][0]
+            if value not in values:
+                values.add(value)
+                arms.append(node)
+            if not (len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If)):
+                break
+            node = node.orelse[0]
+        arms.sort(
+            key=lambda arm: -self.profile.branch(  # type: ignore
+                self.method, self.position(arm)[0]  # type: ignore
+            )[0]
+        )
+        orelse = node.orelse
+        for arm in reversed(arms):
+            orelse = [ast.copy_location(ast.If(arm.test, arm.body, orelse), arm)]
+        return orelse[0]  # type: ignore
 
     def visit_Compare(self, node: ast.Compare):
         if not isinstance(node.left, ast.Name) and not isinstance(
@@ -221,53 +526,88 @@ class CodeConvert(ast.NodeVisitor):
             func_name = func_name[2:]
             try:
                 func = getattr(self.cls, func_name)
-                func_ast = self.fn_code_process(func)
-                func_convert = CodeConvert(self.cls)
-                func_convert.visit(func_ast)
-                if not isinstance(
-                    func_convert._instructions[-1], Jump
-                ):  # if the last instruction is not a jump instruction, add a jump instruction to jump back
-                    func_convert.push(
-                        Jump("1", ast.Eq().__class__.__name__, "1", "__jumpback")
-                    )
-                self._fn_list[func_name] = func_convert._instructions
-
-                # Below is the code to transform the function arguments
-                # The function arguments are stored in the "__{func_name}_{arg_name}" variables
-                for arg_value, arg_name in zip(
-                    node.args,
-                    func.__code__.co_varnames[1 : func.__code__.co_argcount],
-                ):
-                    if isinstance(arg_value, ast.Constant):
-                        self.push(Set(f"__{func.__name__}_{arg_name}", arg_value.value))
-                    elif isinstance(arg_value, ast.Name):
-                        self.push(Set(f"__{func.__name__}_{arg_name}", arg_value.id))
-                    else:
-                        raise NotImplementedError(
-                            f"Call with {type(arg_value)} is not supported"
-                        )
-
-                # Because the function may be called multiple times
-                # So we need a "__jumpback" variable to jump back to
-                # the raw function
-                self.push(Set("__jumpback", len(self._instructions) + 2))
-
-                # The function will append to the last instruction,
-                # so we need "__remove_{func_name}" to label the function position
-                # At the end, we will fill the fn position according to the label
-                self.push(
-                    Jump(
-                        "1",
-                        ast.Eq().__class__.__name__,
-                        "1",
-                        f"{SHOULD_REMOVE}_{func_name}",
-                    )
-                )
-                # Accept the return value, if the caller does not accept the return
-                # value, it will be removed
-                self.push(Set(SHOULD_REMOVE, "__return"))
             except AttributeError:
                 raise ValueError(f"Invalid function name: {func_name}")
+            converting = func_name in self._active
+            cache = self.cache
+            if not converting and func_name not in cache.converted:
+                # the body is converted at the first call site only
+                func_ast = cache.tree(func_name)
+                func_convert = CodeConvert(
+                    self.cls,
+                    self.inline,
+                    cache,
+                    self._active | {func_name},
+                    func_name,
+                    self.stack,
+                    self.profile,
+                )
+                func_convert.visit(func_ast)
+                if not isinstance(func_ast.body[-1], ast.Return):  # type: ignore
+                    # running off the end of the body returns as well
+                    func_convert.push(Jump.always(func_convert.exit))
+                cache.converted[func_name] = func_convert
+                cache.inlined[func_name] = self.should_inline(
+                    func, func_convert.instructions
+                )
+                if not cache.inlined[func_name]:
+                    # return to the address the caller left in the return register
+                    func_convert.fn_list[func_name] = [
+                        inherit(Set(COUNTER, return_register(func_name)), inst)
+                        if isinstance(inst, Jump) and inst.to is func_convert.exit
+                        else inst
+                        for inst in func_convert.instructions
+                    ]
+            inline = not converting and cache.inlined[func_name]
+            if not converting:
+                # functions called from the body, and the body itself
+                # unless it is inlined
+                self._fn_list.update(cache.converted[func_name].fn_list)
+
+            # A call that may come back to the method being converted
+            # (recursion) would overwrite its variables, they are saved
+            # on the stack around it. Other calls save nothing, every
+            # method has registers of its own.
+            saved: List[str] = []
+            if self.method is not None and reaches(self.graph, func_name, self.method):
+                saved = self.frame(self.method, node)
+            self.spill(saved)
+
+            # Below is the code to transform the function arguments
+            # The function arguments are stored in the "__{func_name}__{arg_name}"
+            # variables, the names FnVarNameIsolation gives them in the body
+            for arg_value, arg_name in zip(
+                node.args,
+                func.__code__.co_varnames[1 : func.__code__.co_argcount],
+            ):
+                if isinstance(arg_value, ast.Constant):
+                    self.push(Set(f"__{func.__name__}__{arg_name}", arg_value.value))
+                elif isinstance(arg_value, ast.Name):
+                    self.push(Set(f"__{func.__name__}__{arg_name}", arg_value.id))
+                else:
+                    raise NotImplementedError(
+                        f"Call with {type(arg_value)} is not supported"
+                    )
+
+            if inline:
+                func_convert = cache.converted[func_name]
+                exit = Label("return")
+                body = clone(func_convert.instructions, {func_convert.exit: exit})
+                self.inline_call(func, body, exit)
+            else:
+                # Because the function may be called from several places,
+                # the caller leaves the address to return to in the return
+                # register of the function. It is made relative to @counter
+                # once the program is complete.
+                back = Label("back")
+                self.push(Set(return_register(func_name), back))
+                # the function itself is appended after loop
+                self.push(Jump.always(cache.entry(func_name)))
+                self.place(back)
+            self.restore(saved)
+            # Accept the return value, if the caller does not accept the return
+            # value, it will be removed
+            self.push(Set(SHOULD_REMOVE, "__return"))
         else:
             try:
                 func = getattr(PythonBuiltIn, func_name)
@@ -295,7 +635,7 @@ class CodeConvert(ast.NodeVisitor):
                 binInst: Operation = self.pop()  # type: ignore
                 binInst.dest = "__return"
                 self.push(binInst)
-        self.push(Jump("1", ast.Eq().__class__.__name__, "1", "__jumpback"))
+        self.push(Jump.always(self.exit))
 
     @property
     def fn_list(self):
@@ -307,8 +647,10 @@ class CodeConvert(ast.NodeVisitor):
 
 
 def pre_process(fn) -> str:
-    # remove the 'def' from the source code
-    code = inspect.getsource(fn).split("\n")[1:-1]
+    # remove the 'def' (and its decorators) from the source code
+    source = textwrap.dedent(inspect.getsource(fn))
+    body = ast.parse(source).body[0].body  # type: ignore
+    code = source.split("\n")[body[0].lineno - 1 : -1]
     # remove the indentation
     indent = len(code[0]) - len(code[0].lstrip())
     code = "\n".join([line[indent:] for line in code])  # type: ignore
@@ -317,47 +659,496 @@ def pre_process(fn) -> str:
     return code  # type: ignore
 
 
-def convert(fn: Callable, cls) -> CodeConvert:
-    code = ast.parse(pre_process(fn))
-    convert = CodeConvert(cls)
+def origin(fn: Callable) -> Callable[[int, int], Tuple[int, int]]:
+    """
+    Map a line and column of the code ``pre_process(fn)`` returns to the
+    line and column in the file ``fn`` is defined in
+    """
+    lines, first_line = inspect.getsourcelines(fn)
+    body = ast.parse(textwrap.dedent("".join(lines))).body[0].body  # type: ignore
+    start = body[0].lineno - 1
+    indent = len(lines[start]) - len(lines[start].lstrip())
+
+    def position(line: int, column: int) -> Tuple[int, int]:
+        text = lines[start + line - 1][indent:]
+        # "self." became "__" in the converted code
+        i = converted = 0
+        while converted < column and i < len(text):
+            if text.startswith("self.", i):
+                i += 5
+                converted += 2
+            else:
+                i += 1
+                converted += 1
+        return first_line + start + line - 1, indent + i
+
+    return position
+
+
+def signature(fn: Callable) -> Tuple[str, int]:
+    """
+    The code of the method ``fn``, decorators included, with the position
+    of every node within the method but not where the method is, and the
+    line it starts at. A line added inside the method changes its code.
+    """
+    lines, first_line = inspect.getsourcelines(fn)
+    tree = ast.parse(textwrap.dedent("".join(lines)))
+    return ast.dump(tree, include_attributes=True), first_line
+
+
+def isolate(fn: Callable) -> ast.AST:
+    """
+    Parse the body of ``fn`` and prefix its variables with ``__{fn}__``,
+    so every method has registers of its own
+    """
+    fn_ast = ast.parse(pre_process(fn))
+
+    class FnVarNameIsolation(ast.NodeTransformer):
+        def visit_Call(self, node: ast.Call) -> ast.Call:
+            for arg in node.args:
+                self.visit(arg)
+            return node
+
+        def visit_Name(self, node: ast.Name) -> ast.Name:
+            if node.id.startswith("__"):
+                return node
+            node.id = f"__{fn.__name__}__{node.id}"
+            return node
+
+    return FnVarNameIsolation().visit(fn_ast)
+
+
+def clone(
+    instructions: List[MetaInstruction], labels: Optional[Dict[Label, Label]] = None
+) -> List[MetaInstruction]:
+    """
+    Copy of ``instructions`` with fresh labels in place of the labels it
+    places and of the ones in ``labels``, so it can appear more than once
+    in a program. References to other labels are kept.
+    """
+    labels = dict(labels or {})
+    for inst in instructions:
+        if isinstance(inst, Label):
+            labels[inst] = Label(inst.name.rstrip("0123456789"))
+    result: List[MetaInstruction] = []
+    for inst in instructions:
+        if isinstance(inst, Label):
+            result.append(labels[inst])
+            continue
+        inst = copy.copy(inst)
+        map_addresses(inst, lambda address: labels.get(address, address))
+        result.append(inst)
+    return result
+
+
+def switch_cases(node: ast.If) -> Optional[Tuple[str, Dict[int, list], list]]:
+    """
+    Recognize ``if x == 1: ... elif x == 2: ... else: ...`` comparing one
+    variable against integer constants. Return the variable, the body of
+    every value (the first one if a value repeats) and the else branch.
+    """
+    var = None
+    cases: Dict[int, list] = {}
+    while True:
+        test = node.test
+        if not (
+            isinstance(test, ast.Compare)
+            and len(test.ops) == 1
+            and isinstance(test.ops[0], ast.Eq)
+        ):
+            return None
+        name, value = test.left, test.comparators[0]
+        if isinstance(name, ast.Constant):
+            name, value = value, name
+        if not (
+            isinstance(name, ast.Name)
+            and name.id not in ("pi", "e")
+            and isinstance(value, ast.Constant)
+            and type(value.value) is int
+            and name.id == (var or name.id)
+        ):
+            return None
+        var = name.id
+        cases.setdefault(value.value, node.body)
+        if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+            node = node.orelse[0]
+        else:
+            return var, cases, node.orelse
+
+
+def _reads(node: ast.AST) -> set:
+    return {
+        name.id
+        for name in ast.walk(node)
+        if isinstance(name, ast.Name) and isinstance(name.ctx, ast.Load)
+    }
+
+
+class _Liveness:
+    """
+    Follows the statements of a method backwards from its end, collecting
+    the variables live right after the call at ``position``
+    """
+
+    def __init__(self, position: Tuple[int, int]):
+        self.position = position
+        self.at_call: Optional[set] = None
+
+    def has_call(self, node: ast.AST) -> bool:
+        return any(
+            isinstance(n, ast.Call) and (n.lineno, n.col_offset) == self.position
+            for n in ast.walk(node)
+        )
+
+    def found(self, live: set):
+        self.at_call = live if self.at_call is None else self.at_call | live
+
+    def block(self, body: list, live: set, exit: set) -> set:
+        # ``exit`` is live where a break goes
+        for statement in reversed(body):
+            live = self.step(statement, live, exit)
+        return live
+
+    def step(self, statement: ast.stmt, live: set, exit: set) -> set:
+        if isinstance(statement, ast.If):
+            before = (
+                _reads(statement.test)
+                | self.block(statement.body, live, exit)
+                | self.block(statement.orelse, live, exit)
+            )
+        elif isinstance(statement, ast.While):
+            before = set(live)
+            while True:
+                head = before
+                before = (
+                    _reads(statement.test)
+                    | self.block(statement.orelse, live, exit)
+                    | self.block(statement.body, head, live)
+                )
+                if before == head:
+                    break
+        else:
+            return self.simple(statement, live, exit)
+        if self.has_call(statement.test):
+            self.found(before)
+        return before
+
+    def simple(self, statement: ast.stmt, live: set, exit: set) -> set:
+        written = set()
+        if isinstance(statement, ast.Return):
+            before = _reads(statement)
+        elif isinstance(statement, ast.Break):
+            before = set(exit)
+        elif isinstance(statement, ast.Assign):
+            written = {t.id for t in statement.targets if isinstance(t, ast.Name)}
+            before = (live - written) | _reads(statement)
+        elif isinstance(statement, ast.AugAssign):
+            before = live | _reads(statement) | _reads(statement.target)
+            if isinstance(statement.target, ast.Name):
+                before.add(statement.target.id)
+        else:
+            before = live | _reads(statement)
+        if self.has_call(statement):
+            value = getattr(statement, "value", None)
+            if isinstance(statement, (ast.Assign, ast.Expr)) and (
+                isinstance(value, ast.Call)
+                and (value.lineno, value.col_offset) == self.position
+            ):
+                # the result of the call is assigned right after it returns
+                self.found(live - written)
+            else:
+                self.found(live | before)  # somewhere inside the statement
+        return before
+
+
+def live_after(tree: ast.AST, call: ast.Call) -> set:
+    """
+    Variables of the method ``tree`` that may be read after ``call``
+    returns, before they are written again. Assignments, branches, loops,
+    breaks and returns are followed, any other statement reads every
+    variable it names.
+    """
+    liveness = _Liveness((call.lineno, call.col_offset))
+    liveness.block(tree.body, set(), set())  # type: ignore
+    # a call that was not found could be followed by anything
+    return _reads(tree) if liveness.at_call is None else liveness.at_call
+
+
+def call_graph(
+    cls, parse: Optional[Callable[[str], ast.AST]] = None
+) -> Dict[str, List[str]]:
+    """
+    Methods called by each method reachable from init and loop,
+    once per call site. ``parse`` returns the preprocessed body of a
+    method by name.
+    """
+    if parse is None:
+        parse = lambda name: ast.parse(pre_process(getattr(cls, name)))  # noqa: E731
+    graph: Dict[str, List[str]] = {}
+    pending = [name for name in ("init", "loop") if hasattr(cls, name)]
+    while pending:
+        name = pending.pop()
+        if name in graph:
+            continue
+        graph[name] = [
+            node.func.id[2:]
+            for node in ast.walk(parse(name))
+            if isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id.startswith("__")
+            and hasattr(cls, node.func.id[2:])
+        ]
+        pending += graph[name]
+    return graph
+
+
+def reaches(graph: Dict[str, List[str]], caller: str, callee: str) -> bool:
+    """
+    Whether running ``caller`` may call ``callee``, directly or through
+    other methods
+    """
+    seen: set = set()
+    pending = list(graph.get(caller, []))
+    while pending:
+        name = pending.pop()
+        if name == callee:
+            return True
+        if name not in seen:
+            seen.add(name)
+            pending += graph.get(name, [])
+    return False
+
+
+def recursive_methods(graph: Dict[str, List[str]]) -> set:
+    """
+    Methods that may call themselves, directly or through other methods
+    """
+    return {name for name in graph if reaches(graph, name, name)}
+
+
+def convert(
+    fn: Callable,
+    cls,
+    inline: bool = False,
+    cache: Optional[MethodCache] = None,
+    stack: str = STACK,
+    profile: Optional[Profile] = None,
+    debug: bool = False,
+) -> CodeConvert:
+    """
+    Convert the method ``fn`` of ``cls``. With ``debug`` the instructions
+    are listed on stdout.
+    """
+    if cache is None:
+        cache = MethodCache(cls)
+    code = cache.source(fn.__name__)
+    convert = CodeConvert(
+        cls,
+        inline,
+        cache,
+        method=fn.__name__,
+        stack=stack,
+        profile=profile,
+    )
     convert.visit(code)
-    convert.mlog()
+    if debug:
+        convert.print_instructions()
     return convert
 
 
-def compiler(cls):
+def tag(instructions: List[MetaInstruction], method: str):
+    for inst in instructions:
+        if inst.method is None:
+            inst.method = method
+
+
+def link(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Drop the labels and replace every reference to one with the index of
+    the instruction following it
+    """
+    result: List[MetaInstruction] = []
+    positions: Dict[Label, int] = {}
+    for inst in instructions:
+        if isinstance(inst, Label):
+            positions[inst] = len(result)
+        else:
+            result.append(inst)
+
+    def resolve(address):
+        if not isinstance(address, Label):
+            return address
+        if address not in positions:
+            raise ValueError(f"Label {address} is never placed")
+        return positions[address]
+
+    for inst in result:
+        map_addresses(inst, resolve)
+    return result
+
+
+def relative_returns(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Store return addresses as ``op add __jumpback_f @counter offset``,
+    so a call site does not depend on where it ends up in the program
+    """
+    for i, inst in enumerate(instructions):
+        if isinstance(inst, Set) and address_field(inst) == "src":
+            # @counter is already i + 1 while the instruction runs
+            offset = inst.src - i - 1  # type: ignore
+            instructions[i] = inherit(
+                Operation(inst.dest, COUNTER, "Add", offset), inst
+            )
+    return instructions
+
+
+def expand_jump_tables(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Emit every jump table as ``op add @counter @counter index`` followed by
+    one jump per entry
+    """
+    result: List[MetaInstruction] = []
+    index_map: List[int] = []
+    for inst in instructions:
+        index_map.append(len(result))
+        if isinstance(inst, JumpTable):
+            result.append(inherit(Operation(COUNTER, COUNTER, "Add", inst.index), inst))
+            result += [inherit(Jump.always(t), inst) for t in inst.targets]
+        else:
+            result.append(inst)
+    index_map.append(len(result))
+    relocate(result, index_map)
+    return result
+
+
+def remove_unused_results(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Drop the results nobody accepted (the "__remove" destinations),
+    before the program is linked
+    """
+    return [
+        inst
+        for inst in instructions
+        if not (isinstance(inst, (Set, Operation)) and inst.dest == SHOULD_REMOVE)
+    ]
+
+
+def compiler(
+    cls,
+    opt_level: int = DEFAULT_OPT_LEVEL,
+    stack: str = STACK,
+    report: bool = False,
+    budget: Optional[float] = None,
+    processor: str = DEFAULT_PROCESSOR,
+    profile: Optional[Profile] = None,
+    cache: Optional[CompileCache] = None,
+    debug: bool = False,
+):
+    """
+    Compile the ``init`` and ``loop`` methods of ``cls`` to instructions.
+    With ``report`` the static cost report of the program is returned along
+    with them. With a ``budget``, compilation fails with BudgetExceeded when
+    an iteration of ``loop`` may take more ticks than that on ``processor``.
+    A ``profile`` (see ``MindApi.pgo``) decides what to inline and how to
+    lay out if statements. A ``cache`` (see ``MindApi.cache``) returns the
+    program compiled before if the source of ``cls`` did not change.
+    With ``debug`` the program is listed on stdout, see ``MindApi.mlog``
+    to write it out.
+    """
+    costed = report or budget is not None
+    if cache is not None:
+        key = cache_key(
+            cls,
+            {
+                "opt_level": opt_level,
+                "stack": stack,
+                "cost": costed,
+                "profile": profile.to_dict() if profile is not None else None,
+            },
+        )
+        entry = cache.get(key)
+        if entry is None:
+            entry = _compile(cls, opt_level, stack, costed, profile)
+            cache.put(key, entry)
+        instructions, cost = entry
+    else:
+        instructions, cost = _compile(cls, opt_level, stack, costed, profile)
+    if debug:
+        listing(instructions)
+    if budget is not None:
+        check_budget(cost, budget, processor)  # type: ignore
+    if report:
+        return instructions, cost
+    return instructions
+
+
+def _compile(
+    cls,
+    opt_level: int,
+    stack: str,
+    costed: bool,
+    profile: Optional[Profile],
+    cache: Optional[MethodCache] = None,
+) -> Tuple[List[MetaInstruction], Optional[CostReport]]:
+    """
+    Compile ``cls``. Conversions found in ``cache`` are used as they are,
+    the others are added to it.
+    """
     function_map = {}
     instructions: List[MetaInstruction] = []
-    if hasattr(cls, "init"):
-        init = getattr(cls, "init")
-        code = convert(init, cls)
-        function_map.update(code.fn_list)
-        instructions += code.instructions
-    if hasattr(cls, "loop"):
-        loop = getattr(cls, "loop")
-        code = convert(loop, cls)
+    # every method is parsed and converted once, whatever calls it
+    if cache is None:
+        cache = MethodCache(cls)
+    for name in ("init", "loop"):
+        if not hasattr(cls, name):
+            continue
+        if name not in cache.programs:
+            cache.programs[name] = convert(
+                getattr(cls, name), cls, opt_level >= 2, cache, stack, profile
+            )
+        code = cache.programs[name]
         function_map.update(code.fn_list)
-        # every jump instruction should be shifted
-        for inst in code.instructions:
-            if isinstance(inst, Jump) and isinstance(inst.to, int):
-                inst.to += len(instructions)  # type: ignore
-        code.push(
-            Jump("1", ast.Eq().__class__.__name__, "1", len(instructions))  # type: ignore
-        )  # loop jump
-        instructions += code.instructions
-
-    # process the function map
-    index_map = {}
+        body = list(code.instructions)
+        if name == "loop":
+            start = Label("loop")
+            body = [start, *body, Jump.always(start)]  # loop jump
+        tag(body, name)
+        instructions += body
+
+    # the methods that are called rather than inlined follow loop
     for fn_name, fn_inst in function_map.items():
-        index_map[fn_name] = len(instructions)  # type: ignore
+        instructions.append(cache.entry(fn_name))
+        tag(fn_inst, fn_name)
         instructions += fn_inst
-    # process the jump instruction(fill the function jump position)
+    # linking and the passes change the instructions, the conversions in
+    # the cache are kept as they are
+    instructions = link(remove_unused_results(clone(instructions)))
+    instructions = optimize(instructions, opt_level)
+    cost = estimate(instructions) if costed else None
+    instructions = relative_returns(expand_jump_tables(instructions))
+    return instructions, cost
+
+
+def method_counts(instructions: List[MetaInstruction]) -> Dict[str, int]:
+    """
+    Number of instructions each python method contributes to the program
+    """
+    counts: Dict[str, int] = {}
     for inst in instructions:
-        if isinstance(inst, Jump) and isinstance(inst.to, str):
-            if inst.to.startswith("__remove_"):
-                inst.to = index_map[inst.to[9:]]  # type: ignore
-        if (
-            isinstance(inst, Set) and inst.src == "__return"
-        ):  # remove the return value if it is not used
-            instructions.remove(inst)
-    return instructions
+        if inst.method is not None:
+            counts[inst.method] = counts.get(inst.method, 0) + 1
+    return counts
+
+
+def optimization_report(
+    cls, opt_level: int = DEFAULT_OPT_LEVEL
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Instruction count of every method before and after optimization
+    """
+    before = method_counts(compiler(cls, opt_level=0))
+    after = method_counts(compiler(cls, opt_level=opt_level))
+    return {
+        method: (before.get(method, 0), after.get(method, 0))
+        for method in list(before) + [m for m in after if m not in before]
+    }
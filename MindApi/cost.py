@@ -0,0 +1,269 @@
+"""
+Static cost model of a compiled program: instructions per method and the
+length of the paths through them, turned into ticks per iteration of
+``loop`` on every processor tier.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from MindApi.analysis import (
+    COUNTER,
+    JUMPBACK,
+    address_field,
+    condition,
+    is_return_register,
+    relative_return,
+    return_addresses,
+    successors,
+)
+from MindApi.builtin import End, Jump, JumpTable, MetaInstruction, Set, Stop
+from MindApi.emulator import DEFAULT_PROCESSOR, IPT
+
+Path = Tuple[int, float]  # worst case and typical number of instructions
+
+
+class BudgetExceeded(ValueError):
+    """
+    Raised by ``compiler`` when ``loop`` may take more ticks than allowed
+    """
+
+
+def size(inst: MetaInstruction) -> int:
+    """
+    Number of mlog instructions ``inst`` is emitted as
+    """
+    if isinstance(inst, JumpTable):
+        return 1 + len(inst.targets)
+    return 1
+
+
+def weight(inst: MetaInstruction) -> int:
+    """
+    Number of mlog instructions executed when control passes ``inst``
+    """
+    # a jump table runs its own add and one of its jumps
+    return 2 if isinstance(inst, JumpTable) else 1
+
+
+def call_site(
+    instructions: List[MetaInstruction], index: int
+) -> Optional[Tuple[str, int]]:
+    """
+    Name of the method the call jumping at ``index`` calls and the address
+    it returns to, None if the instruction is not such a jump
+    """
+    inst = instructions[index]
+    if not (isinstance(inst, Jump) and isinstance(inst.to, int) and index > 0):
+        return None
+    if condition(inst) is not True:
+        return None
+    before = instructions[index - 1]
+    address = relative_return(instructions, index - 1)
+    if address is None and address_field(before) == "src":
+        address = before.src  # type: ignore
+    if address is None:
+        return None
+    return before.dest[len(JUMPBACK) + 1 :], address  # type: ignore
+
+
+def loop_entry(instructions: List[MetaInstruction]) -> Optional[int]:
+    """
+    First instruction of loop, where the loop jump (the last unconditional
+    jump of loop) goes
+    """
+    entry = None
+    for inst in instructions:
+        if inst.method == "loop" and isinstance(inst, Jump) and condition(inst):
+            entry = inst.to
+    return entry  # type: ignore
+
+
+class CostModel:
+    """
+    Path lengths through the program, starting at any instruction.
+    A call costs the path through the method it calls, loops are counted
+    once, and a recursive call only costs the call itself. Branches are
+    equally likely on the typical path.
+    """
+
+    def __init__(self, instructions: List[MetaInstruction]):
+        self.instructions = instructions
+        self._returns = return_addresses(instructions)
+        # by entry and exits
+        self._paths: Dict[Tuple[int, frozenset], Path] = {}
+        self._active: set = set()
+
+    def _edges(self, index: int, exits: set) -> Tuple[List[int], Optional[int]]:
+        """
+        Successors of ``index`` inside the method it belongs to,
+        with the entry of the method it calls if it is a call
+        """
+        inst = self.instructions[index]
+        call = call_site(self.instructions, index)
+        if call is not None:
+            following = [call[1]]
+            callee = inst.to
+        elif isinstance(inst, (End, Stop)):
+            return [], None
+        elif (
+            isinstance(inst, Set)
+            and inst.dest == COUNTER
+            and is_return_register(inst.src)
+        ):
+            return [], None
+        else:
+            following = successors(self.instructions, index, self._returns)
+            callee = None
+        return [i for i in dict.fromkeys(following) if i not in exits], callee
+
+    def path(self, entry: int, exits=frozenset()) -> Path:
+        """
+        Worst case and typical number of instructions run from ``entry``
+        until the method returns, the program ends, control gets back to
+        ``entry`` or reaches one of ``exits``
+        """
+        key = entry, frozenset(exits)
+        if key in self._paths:
+            return self._paths[key]
+        if entry in self._active:
+            return 0, 0.0
+        self._active.add(entry)
+        exits = set(exits)
+
+        # depth first, dropping the edges back into the loops
+        edges: Dict[int, List[int]] = {}
+        calls: Dict[int, int] = {}
+        order: List[int] = []
+        on_stack = {entry}
+        stack = [(entry, iter(self._expand(entry, exits, edges, calls)))]
+        while stack:
+            index, children = stack[-1]
+            for child in children:
+                if child in on_stack:
+                    edges[index].remove(child)
+                elif child not in edges:
+                    on_stack.add(child)
+                    stack.append(
+                        (child, iter(self._expand(child, exits, edges, calls)))
+                    )
+                    break
+            else:
+                stack.pop()
+                on_stack.discard(index)
+                order.append(index)
+
+        worst: Dict[int, int] = {}
+        typical: Dict[int, float] = {}
+        for index in order:
+            cost = weight(self.instructions[index])
+            worst[index] = typical[index] = cost
+            if index in calls:
+                callee = self.path(calls[index])
+                worst[index] += callee[0]
+                typical[index] += callee[1]
+            following = edges[index]
+            if following:
+                worst[index] += max(worst[i] for i in following)
+                typical[index] += sum(typical[i] for i in following) / len(following)
+        self._active.discard(entry)
+        self._paths[key] = worst[entry], typical[entry]
+        return self._paths[key]
+
+    def _expand(self, index: int, exits: set, edges: dict, calls: dict) -> List[int]:
+        following, callee = self._edges(index, exits)
+        edges[index] = list(following)
+        if callee is not None:
+            calls[index] = callee
+        return following
+
+    def entries(self) -> Dict[str, int]:
+        """
+        First instruction of every method that is called rather than inlined
+        """
+        result = {}
+        for index in range(len(self.instructions)):
+            call = call_site(self.instructions, index)
+            if call is not None:
+                result[call[0]] = self.instructions[index].to
+        return result
+
+
+class CostReport:
+    """
+    Static cost of a compiled program.
+    ``instructions`` counts the instructions every method contributes,
+    ``paths`` holds the worst case and typical number of instructions
+    one run of every method takes, ``loop`` included.
+    """
+
+    def __init__(self, instructions: Dict[str, int], paths: Dict[str, Path]):
+        self.instructions = instructions
+        self.paths = paths
+
+    @property
+    def worst(self) -> int:
+        return self.paths.get("loop", (0, 0.0))[0]
+
+    @property
+    def typical(self) -> float:
+        return self.paths.get("loop", (0, 0.0))[1]
+
+    def ticks(self, kind: str = DEFAULT_PROCESSOR, worst: bool = True) -> float:
+        """
+        Ticks one iteration of ``loop`` takes on a processor of ``kind``
+        """
+        return (self.worst if worst else self.typical) / IPT[kind]
+
+    def __str__(self):
+        lines = [f"{'method':<16}{'size':>6}{'worst':>8}{'typical':>10}"]
+        methods = list(self.instructions)
+        methods += [method for method in self.paths if method not in methods]
+        for method in methods:
+            count = self.instructions.get(method, 0)
+            if method in self.paths:
+                worst, typical = self.paths[method]
+                lines.append(f"{method:<16}{count:>6}{worst:>8}{typical:>10.1f}")
+            else:
+                # inlined everywhere, its cost is part of its callers
+                lines.append(f"{method:<16}{count:>6}{'-':>8}{'-':>10}")
+        for kind in IPT:
+            lines.append(
+                f"{kind:<16}{self.ticks(kind):>8.2f} ticks per loop"
+                f" ({self.ticks(kind, worst=False):.2f} typical)"
+            )
+        return "\n".join(lines)
+
+
+def estimate(instructions: List[MetaInstruction]) -> CostReport:
+    """
+    Cost report of an optimized program whose jump tables are not expanded
+    and whose return addresses are not relative yet
+    """
+    counts: Dict[str, int] = {}
+    for inst in instructions:
+        if inst.method is not None:
+            counts[inst.method] = counts.get(inst.method, 0) + size(inst)
+
+    model = CostModel(instructions)
+    paths: Dict[str, Path] = {}
+    loop = loop_entry(instructions)
+    if instructions:
+        if loop != 0:
+            paths["init"] = model.path(0, {loop} if loop is not None else set())
+        if loop is not None:
+            paths["loop"] = model.path(loop)
+    for method, entry in model.entries().items():
+        paths[method] = model.path(entry)
+    return CostReport(counts, paths)
+
+
+def check_budget(report: CostReport, budget: float, kind: str = DEFAULT_PROCESSOR):
+    """
+    Raise BudgetExceeded when the worst case iteration of ``loop`` takes
+    more than ``budget`` ticks on a processor of ``kind``
+    """
+    ticks = report.ticks(kind)
+    if ticks > budget:
+        raise BudgetExceeded(
+            f"loop takes up to {ticks:.2f} ticks on a {kind},"
+            f" the budget is {budget}"
+        )
@@ -0,0 +1,17 @@
+from typing import Callable
+
+
+def inline(fn: Callable) -> Callable:
+    """
+    Always expand calls to the method at the call site
+    """
+    fn.__mindapi_inline__ = True  # type: ignore
+    return fn
+
+
+def noinline(fn: Callable) -> Callable:
+    """
+    Never expand calls to the method, keep a single shared copy
+    """
+    fn.__mindapi_inline__ = False  # type: ignore
+    return fn
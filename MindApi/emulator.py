@@ -0,0 +1,473 @@
+import functools
+import math
+import random
+import struct
+from typing import Callable, Dict, List, Optional, Sequence
+
+from MindApi import types
+from MindApi.analysis import COUNTER, DEST_FIELDS
+from MindApi.builtin import (
+    Draw,
+    DrawFlush,
+    End,
+    GetLink,
+    Jump,
+    JumpTable,
+    LookUp,
+    MetaInstruction,
+    Operation,
+    PackColor,
+    Print,
+    PrintFlush,
+    Read,
+    Set,
+    Stop,
+    UnitBind,
+    UnitControl,
+    UnitLocate,
+    UnitRadar,
+    Wait,
+    Write,
+)
+from MindApi.semantics import evaluate, op_name, to_number
+from MindApi.types import MetaType
+from MindApi.utils import condition_ops, condition_ops_inverse
+
+# instructions every processor runs per tick, by the value of its
+# BuildingType so the building catalog is not needed to look them up
+IPT: Dict[str, int] = {
+    "micro-processor": 2,
+    "logic-processor": 8,
+    "hyper-processor": 25,
+}
+DEFAULT_PROCESSOR = "logic-processor"
+
+TICKS_PER_SECOND = 60
+MAX_TEXT_BUFFER = 400  # characters print keeps before printflush
+MAX_GRAPHICS_BUFFER = 256  # draw commands kept before drawflush
+
+# catalog lookup indexes, by the type of content
+_CONTENT = {
+    MetaType.Block: "BuildingType",
+    MetaType.Item: "ItemType",
+    MetaType.Liquid: "LiquidType",
+    MetaType.Unit: "UnitType",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def content(kind: MetaType) -> List[str]:
+    """
+    Values of the catalog ``lookup`` indexes for ``kind``
+    """
+    if kind not in _CONTENT:
+        return []
+    return [member.value for member in getattr(types, _CONTENT[kind])]
+
+
+class Building:
+    """
+    A block linked to the processor
+    """
+
+    type: str  # value of its BuildingType
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"<{self.type} {self.name}>"
+
+
+class MemoryCell(Building):
+    type = "memory-cell"
+    size = 64
+
+    def __init__(self, name: str = "cell1"):
+        super().__init__(name)
+        self.memory: List[float] = [0] * self.size
+
+
+class MemoryBank(MemoryCell):
+    type = "memory-bank"
+    size = 512
+
+    def __init__(self, name: str = "bank1"):
+        super().__init__(name)
+
+
+class Display(Building):
+    """
+    Keeps the draw commands flushed to it since the last ``draw clear``
+    """
+
+    type = "logic-display"
+    size = 80
+
+    def __init__(self, name: str = "display1"):
+        super().__init__(name)
+        self.commands: List[tuple] = []
+        self.flushes = 0
+
+    def flush(self, commands: List[tuple]):
+        for command in commands:
+            if command[0] == "clear":
+                self.commands = []
+            self.commands.append(command)
+        self.flushes += 1
+
+
+class LargeDisplay(Display):
+    type = "large-logic-display"
+    size = 176
+
+
+class Message(Building):
+    type = "message"
+
+    def __init__(self, name: str = "message1"):
+        super().__init__(name)
+        self.text = ""
+
+
+def _simplex_permutation() -> List[int]:
+    rng = random.Random(0)
+    table = list(range(256))
+    rng.shuffle(table)
+    return table * 2
+
+
+_PERMUTATION = _simplex_permutation()
+_GRADIENTS = [(1, 1), (-1, 1), (1, -1), (-1, -1), (1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+def noise(x: float, y: float) -> float:
+    """
+    2D simplex noise in [-1, 1]. It has the shape of the in-game noise but
+    not its exact values.
+    """
+    skew = (math.sqrt(3) - 1) / 2
+    unskew = (3 - math.sqrt(3)) / 6
+    s = (x + y) * skew
+    i, j = math.floor(x + s), math.floor(y + s)
+    t = (i + j) * unskew
+    x0, y0 = x - (i - t), y - (j - t)
+    i1, j1 = (1, 0) if x0 > y0 else (0, 1)
+    corners = [
+        (x0, y0, 0, 0),
+        (x0 - i1 + unskew, y0 - j1 + unskew, i1, j1),
+        (x0 - 1 + 2 * unskew, y0 - 1 + 2 * unskew, 1, 1),
+    ]
+    total = 0.0
+    for dx, dy, ci, cj in corners:
+        falloff = 0.5 - dx * dx - dy * dy
+        if falloff > 0:
+            gx, gy = _GRADIENTS[
+                _PERMUTATION[(i + ci + _PERMUTATION[(j + cj) & 255]) & 255] % 8
+            ]
+            total += falloff**4 * (gx * dx + gy * dy)
+    return 70 * total
+
+
+def num(value) -> float:
+    """
+    Numeric value of a processor value: null is 0, any other object 1
+    """
+    if isinstance(value, (int, float)):
+        return value
+    return 0 if value is None else 1
+
+
+def text(value) -> str:
+    """
+    The way print shows a processor value
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, Building):
+        return value.type
+    if isinstance(value, (int, float)):
+        if abs(value - round(value)) < 0.00001:
+            return str(int(round(value)))
+        return str(value)
+    return str(value)
+
+
+def _is_object(value) -> bool:
+    return not isinstance(value, (int, float))
+
+
+def compare(name: str, left, right) -> int:
+    """
+    Evaluate a comparison, objects (null included) compare by identity
+    """
+    if name == "strictEqual":
+        same = _is_object(left) == _is_object(right) and left == right
+        return 1 if same else 0
+    if name in ("equal", "notEqual") and _is_object(left) and _is_object(right):
+        return int((left == right) == (name == "equal"))
+    return evaluate(name, num(left), num(right))  # type: ignore
+
+
+class Processor:
+    """
+    Runs a compiled program the way a logic processor does: ``ipt``
+    instructions every tick, ``wait`` and ``stop`` give up the rest of
+    the tick. There is no world, unit instructions only take their time.
+    ``kind`` is the BuildingType of the processor or its value.
+    """
+
+    def __init__(
+        self,
+        instructions: Sequence[MetaInstruction],
+        kind: str = DEFAULT_PROCESSOR,
+        links: Sequence[Building] = (),
+        ipt: Optional[int] = None,
+        seed: int = 0,
+    ):
+        self.instructions = list(instructions)
+        self.kind = kind
+        self.ipt = IPT[kind] if ipt is None else ipt
+        self.links = list(links)
+        self._by_name = {link.name: link for link in self.links}
+        self.random = random.Random(seed)
+        self.variables: Dict[str, object] = {}
+        self.counter = 0
+        self.text_buffer = ""
+        self.graphics_buffer: List[tuple] = []
+        self.stopped = False
+        self._yield = False
+        self._waited = 0  # ticks spent in the current wait
+        # statistics
+        self.executed = 0
+        self.ticks = 0
+        self.counts = [0] * len(self.instructions)
+        self.taken = [0] * len(self.instructions)  # times every jump jumped
+        self._handlers: Dict[type, Callable] = {
+            Set: self._set,
+            Operation: self._op,
+            Jump: self._jump,
+            JumpTable: self._jump_table,
+            Print: self._print,
+            PrintFlush: self._print_flush,
+            Read: self._read,
+            Write: self._write,
+            Draw: self._draw,
+            DrawFlush: self._draw_flush,
+            GetLink: self._get_link,
+            LookUp: self._lookup,
+            PackColor: self._pack_color,
+            Wait: self._wait,
+            End: self._end,
+            Stop: self._stop,
+            UnitBind: self._no_world,
+            UnitControl: self._no_world,
+            UnitRadar: self._no_world,
+            UnitLocate: self._no_world,
+        }
+
+    # values
+    def value(self, operand):
+        """
+        Value of an instruction operand: a literal, a constant or a variable
+        """
+        if not isinstance(operand, str):
+            return operand
+        number = to_number(operand)
+        if number is not None:
+            return number
+        if len(operand) > 1 and operand[0] == operand[-1] == '"':
+            return operand[1:-1]
+        if operand in ("null", "true", "false"):
+            return {"null": None, "true": 1, "false": 0}[operand]
+        if operand.startswith("@"):
+            return self._builtin(operand)
+        if operand in self._by_name:
+            return self._by_name[operand]
+        return self.variables.get(operand)
+
+    def _builtin(self, name: str):
+        seconds = self.ticks / TICKS_PER_SECOND
+        values = {
+            COUNTER: self.counter,
+            "@ipt": self.ipt,
+            "@links": len(self.links),
+            "@this": self,
+            "@tick": self.ticks,
+            "@second": seconds,
+            "@time": seconds * 1000,
+            "@unit": None,
+        }
+        # other names are content (@copper, @flare, ...)
+        return values.get(name, name[1:])
+
+    def assign(self, name: str, value):
+        if name == COUNTER:
+            self.counter = int(num(value))
+        elif not name.startswith("@") and name not in self._by_name:
+            self.variables[name] = value
+
+    def __getitem__(self, name: str):
+        return self.value(name)
+
+    # execution
+    def step(self):
+        """
+        Execute the instruction at @counter
+        """
+        if not 0 <= self.counter < len(self.instructions):
+            self.counter = 0  # running off the end restarts the program
+        if not self.instructions:
+            return
+        index = self.counter
+        inst = self.instructions[index]
+        self.counter += 1
+        self.executed += 1
+        self.counts[index] += 1
+        handler = self._handlers.get(type(inst))
+        if handler is None:
+            raise NotImplementedError(
+                f"{type(inst).__name__} is not supported by the emulator"
+            )
+        handler(inst)
+
+    def tick(self) -> int:
+        """
+        Run one game tick, return the number of instructions executed
+        """
+        before = self.executed
+        for _ in range(self.ipt):
+            self.step()
+            if self._yield:
+                self._yield = False
+                break
+        self.ticks += 1
+        return self.executed - before
+
+    def run(self, ticks: int) -> int:
+        """
+        Run ``ticks`` game ticks (fewer if the program stops), return the
+        number of instructions executed
+        """
+        before = self.executed
+        for _ in range(ticks):
+            if self.stopped:
+                break
+            self.tick()
+        return self.executed - before
+
+    def run_until(self, condition: Callable[["Processor"], bool], max_ticks: int):
+        """
+        Run until ``condition(processor)`` holds after a tick, return the
+        number of ticks it took
+        """
+        start = self.ticks
+        while not condition(self):
+            if self.stopped or self.ticks - start >= max_ticks:
+                raise TimeoutError(f"Condition not met after {max_ticks} ticks")
+            self.tick()
+        return self.ticks - start
+
+    # instructions
+    def _set(self, inst: Set):
+        self.assign(inst.dest, self.value(inst.src))
+
+    def _op(self, inst: Operation):
+        name = op_name(inst.op)
+        left, right = self.value(inst.left), self.value(inst.right)
+        result: float
+        if name in ("equal", "notEqual", "strictEqual"):
+            result = compare(name, left, right)
+        elif name == "rand":
+            result = self.random.random() * num(left)
+        elif name == "noise":
+            result = noise(num(left), num(right))
+        elif name is None:
+            raise ValueError(f"Invalid operator: {inst.op}")
+        else:
+            result = evaluate(name, float(num(left)), float(num(right)))
+        self.assign(inst.dest, result)
+
+    def _jump(self, inst: Jump):
+        ops = condition_ops_inverse if inst.reverse else condition_ops
+        name = ops.get(inst.op, inst.op)
+        if compare(name, self.value(inst.left), self.value(inst.right)):
+            self.taken[self.counter - 1] += 1
+            self.counter = int(num(self.value(inst.to)))
+
+    def _jump_table(self, inst: JumpTable):
+        self.counter = inst.targets[int(num(self.value(inst.index)))]
+
+    def _print(self, inst: Print):
+        value = text(self.value(inst.val)) if inst.is_var else str(inst.val)
+        self.text_buffer = (self.text_buffer + value)[:MAX_TEXT_BUFFER]
+
+    def _print_flush(self, inst: PrintFlush):
+        target = self.value(inst.message)
+        if isinstance(target, Message):
+            target.text = self.text_buffer
+        self.text_buffer = ""
+
+    def _read(self, inst: Read):
+        cell = self.value(inst.src)
+        if isinstance(cell, MemoryCell):
+            address = int(num(self.value(inst.index)))
+            inside = 0 <= address < cell.size
+            self.assign(inst.dest, cell.memory[address] if inside else 0)
+
+    def _write(self, inst: Write):
+        cell = self.value(inst.dest)
+        if isinstance(cell, MemoryCell):
+            address = int(num(self.value(inst.index)))
+            if 0 <= address < cell.size:
+                cell.memory[address] = num(self.value(inst.src))
+
+    def _draw(self, inst: Draw):
+        if len(self.graphics_buffer) < MAX_GRAPHICS_BUFFER:
+            args = tuple(num(self.value(arg)) for arg in inst.args)
+            self.graphics_buffer.append((inst.cmd,) + args)
+
+    def _draw_flush(self, inst: DrawFlush):
+        target = self.value(inst.display)
+        if isinstance(target, Display):
+            target.flush(self.graphics_buffer)
+        self.graphics_buffer = []
+
+    def _get_link(self, inst: GetLink):
+        index = int(num(self.value(inst.src)))
+        inside = 0 <= index < len(self.links)
+        self.assign(inst.dest, self.links[index] if inside else None)
+
+    def _lookup(self, inst: LookUp):
+        values = content(MetaType(inst.type))
+        index = int(num(self.value(inst.index)))
+        inside = 0 <= index < len(values)
+        self.assign(inst.dest, values[index] if inside else None)
+
+    def _pack_color(self, inst: PackColor):
+        rgba = 0
+        for channel in (inst.r, inst.g, inst.b, inst.a):
+            rgba = (rgba << 8) | int(num(self.value(channel)) * 255)
+        packed = struct.unpack("<d", struct.pack("<Q", rgba))[0]
+        self.assign(inst.dest, packed)
+
+    def _wait(self, inst: Wait):
+        if self._waited / TICKS_PER_SECOND >= num(self.value(inst.time)):
+            self._waited = 0
+            return
+        # run the wait again next tick
+        self._waited += 1
+        self.counter -= 1
+        self._yield = True
+
+    def _end(self, inst: End):
+        self.counter = len(self.instructions)
+
+    def _stop(self, inst: Stop):
+        self.counter -= 1
+        self._yield = True
+        self.stopped = True
+
+    def _no_world(self, inst: MetaInstruction):
+        for field in DEST_FIELDS.get(type(inst), ()):
+            self.assign(getattr(inst, field), None)
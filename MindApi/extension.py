@@ -1,9 +1,12 @@
 import math
 from ast import Constant, Name, expr
-from typing import List, Union
+from typing import TYPE_CHECKING, List, Union
 
 from MindApi.builtin import Operation, Print, Set
-from MindApi.types import OperationType, UnitType
+from MindApi.types import OperationType
+
+if TYPE_CHECKING:
+    from MindApi.types import UnitType
 
 
 class PythonBuiltIn(object):
@@ -191,6 +194,6 @@ class PythonBuiltIn(object):
 
 
 class Unit:
-    def __init__(self, unitType: UnitType, unitNum: int = 1) -> None:
+    def __init__(self, unitType: "UnitType", unitNum: int = 1) -> None:
         self.unitType = unitType
         self.unitNum = unitNum
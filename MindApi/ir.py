@@ -0,0 +1,266 @@
+from typing import Dict, List, Optional, Sequence
+
+from MindApi.analysis import (
+    COUNTER,
+    condition,
+    defs,
+    inherit,
+    leaders,
+    map_addresses,
+    return_addresses,
+    successors,
+    uses,
+)
+from MindApi.builtin import End, Jump, JumpTable, MetaInstruction, Stop
+
+
+class BasicBlock:
+    """
+    A straight run of instructions only entered at the top.
+    Code addresses inside the block (jump targets, return addresses) refer
+    to other blocks until the graph is lowered again.
+    """
+
+    def __init__(self, index: int, instructions: List[MetaInstruction]):
+        self.index = index
+        self.instructions = instructions
+        self.successors: List["BasicBlock"] = []
+        self.predecessors: List["BasicBlock"] = []
+        # the block control falls into when it reaches the end of this one
+        self.fallthrough: Optional["BasicBlock"] = None
+        self.live_in: set[str] = set()
+        self.live_out: set[str] = set()
+
+    @property
+    def terminator(self) -> Optional[MetaInstruction]:
+        return self.instructions[-1] if self.instructions else None
+
+    def uses(self) -> set[str]:
+        """
+        Variables read before the block writes them
+        """
+        result: set[str] = set()
+        written: set[str] = set()
+        for inst in self.instructions:
+            result.update(var for var in uses(inst) if var not in written)
+            written.update(defs(inst))
+        return result
+
+    def defs(self) -> set[str]:
+        return {var for inst in self.instructions for var in defs(inst)}
+
+    def live_after(self) -> List[set[str]]:
+        """
+        Variables live right after each instruction of the block
+        (valid once ``ControlFlowGraph.liveness`` ran)
+        """
+        live = set(self.live_out)
+        result = []
+        for inst in reversed(self.instructions):
+            result.append(set(live))
+            live.difference_update(defs(inst))
+            live.update(uses(inst))
+        result.reverse()
+        return result
+
+    def __repr__(self):
+        return f"<block {self.index}>"
+
+
+def _falls_through(inst: Optional[MetaInstruction]) -> bool:
+    if inst is None:
+        return True
+    if isinstance(inst, Jump):
+        return condition(inst) is not True
+    return not isinstance(inst, (End, JumpTable, Stop)) and COUNTER not in defs(inst)
+
+
+class ControlFlowGraph:
+    """
+    Basic blocks of a flat instruction list with their edges.
+    ``lower()`` turns the graph back into a flat list.
+    """
+
+    def __init__(self, instructions: List[MetaInstruction]):
+        self.blocks: List[BasicBlock] = []
+        if not instructions:
+            return
+        starts = sorted(leaders(instructions))
+        by_start: Dict[int, BasicBlock] = {}
+        for number, (start, end) in enumerate(
+            zip(starts, starts[1:] + [len(instructions)])
+        ):
+            block = BasicBlock(number, list(instructions[start:end]))
+            by_start[start] = block
+            self.blocks.append(block)
+
+        returns = return_addresses(instructions)
+        for start, block in by_start.items():
+            last = start + len(block.instructions) - 1
+            for succ in successors(instructions, last, returns):
+                if by_start[succ] not in block.successors:
+                    block.successors.append(by_start[succ])
+            if _falls_through(block.terminator):
+                block.fallthrough = by_start[(last + 1) % len(instructions)]
+        for block in self.blocks:
+            for successor in block.successors:
+                successor.predecessors.append(block)
+
+        # code addresses point at blocks from now on
+        end = len(instructions)
+        for block in self.blocks:
+            for inst in block.instructions:
+                map_addresses(
+                    inst, lambda address: by_start[address if address < end else 0]
+                )
+
+    @property
+    def entry(self) -> Optional[BasicBlock]:
+        return self.blocks[0] if self.blocks else None
+
+    def reverse_postorder(self) -> List[BasicBlock]:
+        order: List[BasicBlock] = []
+        seen = set()
+        if self.entry is None:
+            return order
+        stack = [(self.entry, iter(self.entry.successors))]
+        seen.add(self.entry)
+        while stack:
+            block, children = stack[-1]
+            for child in children:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append((child, iter(child.successors)))
+                    break
+            else:
+                stack.pop()
+                order.append(block)
+        order.reverse()
+        return order
+
+    def dominators(self) -> Dict[BasicBlock, BasicBlock]:
+        """
+        Immediate dominator of every reachable block (the entry maps to itself)
+        """
+        order = self.reverse_postorder()
+        position = {block: i for i, block in enumerate(order)}
+        idom: Dict[BasicBlock, BasicBlock] = {}
+        if not order:
+            return idom
+        idom[order[0]] = order[0]
+
+        def intersect(a: BasicBlock, b: BasicBlock) -> BasicBlock:
+            while a is not b:
+                while position[a] > position[b]:
+                    a = idom[a]
+                while position[b] > position[a]:
+                    b = idom[b]
+            return a
+
+        changed = True
+        while changed:
+            changed = False
+            for block in order[1:]:
+                preds = [p for p in block.predecessors if p in idom]
+                new = preds[0]
+                for pred in preds[1:]:
+                    new = intersect(pred, new)
+                if idom.get(block) is not new:
+                    idom[block] = new
+                    changed = True
+        return idom
+
+    def dominates(
+        self, a: BasicBlock, b: BasicBlock, idom: Optional[Dict] = None
+    ) -> bool:
+        idom = self.dominators() if idom is None else idom
+        if b not in idom:
+            return False
+        while True:
+            if a is b:
+                return True
+            if idom[b] is b:
+                return False
+            b = idom[b]
+
+    def natural_loops(
+        self, idom: Optional[Dict] = None
+    ) -> Dict[BasicBlock, set[BasicBlock]]:
+        """
+        Blocks of every loop by header. A loop is made of the blocks that
+        reach one of its back edges (an edge to a block dominating its
+        source) without passing through the header.
+        """
+        idom = self.dominators() if idom is None else idom
+        loops: Dict[BasicBlock, set[BasicBlock]] = {}
+        for block in idom:
+            for header in block.successors:
+                if not self.dominates(header, block, idom):
+                    continue
+                body = loops.setdefault(header, {header})
+                pending = [block]
+                while pending:
+                    member = pending.pop()
+                    if member not in body:
+                        body.add(member)
+                        pending += [p for p in member.predecessors if p in idom]
+        return loops
+
+    def liveness(self):
+        """
+        Fill ``live_in``/``live_out`` of every block. Variables keep their
+        value when the program restarts, so the edge from the end of the
+        program back to the entry carries liveness too.
+        """
+        gen = {block: block.uses() for block in self.blocks}
+        kill = {block: block.defs() for block in self.blocks}
+        for block in self.blocks:
+            block.live_in = set()
+            block.live_out = set()
+        changed = True
+        while changed:
+            changed = False
+            for block in reversed(self.blocks):
+                live_out: set[str] = set()
+                for succ in block.successors:
+                    live_out |= succ.live_in
+                live_in = gen[block] | (live_out - kill[block])
+                if live_in != block.live_in or live_out != block.live_out:
+                    block.live_in, block.live_out = live_in, live_out
+                    changed = True
+
+    def lower(
+        self, order: Optional[Sequence[BasicBlock]] = None
+    ) -> List[MetaInstruction]:
+        """
+        Lay the blocks out in ``order`` (the current order by default, the
+        entry block always first) and resolve block references to indices.
+        A jump is added where a block no longer sits before its fallthrough.
+        """
+        order = list(self.blocks if order is None else order)
+        if order and order[0] is not self.entry:
+            raise ValueError("The entry block must be laid out first")
+        layout: List[List[MetaInstruction]] = []
+        for i, block in enumerate(order):
+            code = list(block.instructions)
+            following = order[(i + 1) % len(order)]
+            if block.fallthrough is not None and block.fallthrough is not following:
+                code.append(
+                    inherit(Jump.always(block.fallthrough), block.terminator)  # type: ignore
+                )
+            layout.append(code)
+
+        start: Dict[BasicBlock, int] = {}
+        index = 0
+        for block, code in zip(order, layout):
+            start[block] = index
+            index += len(code)
+        result = [inst for code in layout for inst in code]
+        for inst in result:
+            map_addresses(
+                inst,
+                lambda address: start[address]
+                if isinstance(address, BasicBlock)
+                else address,
+            )
+        return result
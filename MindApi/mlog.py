@@ -0,0 +1,54 @@
+"""
+Emit compiled programs as mlog text: line by line, into a file or as one
+string. Nothing is printed unless a listing is asked for.
+"""
+import sys
+from typing import Iterable, Iterator, List, Optional, TextIO
+
+from MindApi.builtin import Label, MetaInstruction
+
+
+def emit(instructions: Iterable[MetaInstruction]) -> Iterator[str]:
+    """
+    The mlog lines of ``instructions``, one at a time. Labels a program
+    still holds become mlog labels.
+    """
+    for inst in instructions:
+        yield f"{inst}:" if isinstance(inst, Label) else str(inst)
+
+
+def lines(instructions: Iterable[MetaInstruction]) -> List[str]:
+    """
+    The mlog lines of ``instructions`` at once
+    """
+    return list(emit(instructions))
+
+
+def dump(instructions: Iterable[MetaInstruction], file: TextIO) -> int:
+    """
+    Write the mlog of ``instructions`` to ``file`` in one go, return the
+    number of lines written
+    """
+    text = lines(instructions)
+    if text:
+        file.write("\n".join(text))
+        file.write("\n")
+    return len(text)
+
+
+def dumps(instructions: Iterable[MetaInstruction]) -> str:
+    """
+    The mlog of ``instructions`` as one string, a line per instruction
+    """
+    text = lines(instructions)
+    text.append("")
+    return "\n".join(text)
+
+
+def listing(instructions: Iterable[MetaInstruction], file: Optional[TextIO] = None):
+    """
+    Print every instruction after its index, to stdout by default
+    """
+    file = sys.stdout if file is None else file
+    for index, line in enumerate(emit(instructions)):
+        file.write(f"{index}: {line}\n")
@@ -0,0 +1,25 @@
+from MindApi.passes.copies import coalesce_variables, propagate_copies
+from MindApi.passes.dse import eliminate_dead_stores
+from MindApi.passes.fold import fold_constants
+from MindApi.passes.jumps import thread_jumps
+from MindApi.passes.licm import hoist_invariants
+from MindApi.passes.manager import PassManager, PeepholePass, PeepholeRule, Program
+from MindApi.passes.peephole import PEEPHOLE_RULES
+from MindApi.passes.pipeline import DEFAULT_OPT_LEVEL, optimize, pipeline
+
+__all__ = [
+    "DEFAULT_OPT_LEVEL",
+    "PEEPHOLE_RULES",
+    "PassManager",
+    "PeepholePass",
+    "PeepholeRule",
+    "Program",
+    "coalesce_variables",
+    "eliminate_dead_stores",
+    "fold_constants",
+    "hoist_invariants",
+    "optimize",
+    "pipeline",
+    "propagate_copies",
+    "thread_jumps",
+]
@@ -0,0 +1,136 @@
+from typing import Dict, FrozenSet, List, Tuple
+
+from MindApi.analysis import defs, is_return_register, operand_fields, rename
+from MindApi.builtin import MetaInstruction, Set
+from MindApi.ir import BasicBlock, ControlFlowGraph
+from MindApi.semantics import is_constant, is_variable
+
+Copies = FrozenSet[Tuple[str, object]]
+
+
+def _copy(inst: MetaInstruction):
+    """
+    ``(dest, src)`` if ``inst`` is a plain copy of a variable or a constant
+    """
+    if (
+        isinstance(inst, Set)
+        and is_variable(inst.dest)
+        and not inst.dest.startswith("@")
+        and not is_return_register(inst.dest)
+        and (
+            is_constant(inst.src)
+            or (is_variable(inst.src) and not inst.src.startswith("@"))
+        )
+        and inst.dest != inst.src
+    ):
+        return inst.dest, inst.src
+    return None
+
+
+def _transfer(inst: MetaInstruction, copies: set):
+    for dest in defs(inst):
+        copies.difference_update([(d, s) for d, s in copies if d == dest or s == dest])
+    copy = _copy(inst)
+    if copy is not None:
+        copies.add(copy)
+
+
+def _available(cfg: ControlFlowGraph) -> Dict[BasicBlock, Copies]:
+    """
+    Copies that hold on entry of each block, on every path reaching it
+    """
+    order = cfg.reverse_postorder()
+    universe = frozenset(
+        copy
+        for block in cfg.blocks
+        for copy in map(_copy, block.instructions)
+        if copy is not None
+    )
+    reached = set(order)
+    available_in: Dict[BasicBlock, Copies] = {
+        block: frozenset() for block in cfg.blocks
+    }
+    available_out: Dict[BasicBlock, Copies] = {block: universe for block in order}
+    changed = True
+    while changed:
+        changed = False
+        for block in order:
+            preds = [p for p in block.predecessors if p in reached]
+            if block is cfg.entry:
+                # nothing holds when the program starts
+                incoming: Copies = frozenset()
+            else:
+                incoming = frozenset.intersection(*[available_out[p] for p in preds])
+            copies = set(incoming)
+            for inst in block.instructions:
+                _transfer(inst, copies)
+            available_in[block] = incoming
+            if frozenset(copies) != available_out[block]:
+                available_out[block] = frozenset(copies)
+                changed = True
+    return available_in
+
+
+def propagate_copies(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Read the source of a copy (``set a b``) instead of its destination
+    wherever the copy holds on every path, including constants
+    """
+    cfg = ControlFlowGraph(instructions)
+    available = _available(cfg)
+    for block in cfg.blocks:
+        copies = set(available[block])
+        for inst in block.instructions:
+            values = dict(copies)
+            for field in operand_fields(inst):
+                value = getattr(inst, field)
+                if isinstance(value, str) and value in values:
+                    setattr(inst, field, values[value])
+            _transfer(inst, copies)
+    return cfg.lower()
+
+
+def coalesce_variables(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Give the two sides of a copy the same name when their lifetimes never
+    overlap, which turns the copy into ``set a a`` for the peephole rules
+    """
+    cfg = ControlFlowGraph(instructions)
+    cfg.liveness()
+    written = {var for block in cfg.blocks for var in block.defs()}
+    interference: Dict[str, set] = {var: set() for var in written}
+    moves = []
+    for block in cfg.blocks:
+        for inst, live in zip(block.instructions, block.live_after()):
+            copy = _copy(inst)
+            for dest in defs(inst):
+                for var in live:
+                    if var != dest and not (copy is not None and var == copy[1]):
+                        interference[dest].add(var)
+                        interference.setdefault(var, set()).add(dest)
+            if copy is not None and is_variable(copy[1]) and copy[1] in written:
+                moves.append(copy)
+
+    parent = {var: var for var in interference}
+    members = {var: {var} for var in interference}
+    neighbours = {var: set(interference[var]) for var in interference}
+
+    def find(var: str) -> str:
+        while parent[var] != var:
+            var = parent[var]
+        return var
+
+    for dest, src in moves:
+        a, b = find(dest), find(src)
+        if a == b or members[a] & neighbours[b]:
+            continue
+        parent[a] = b
+        members[b] |= members.pop(a)
+        neighbours[b] |= neighbours.pop(a)
+
+    names = {var: find(var) for var in parent if find(var) != var}
+    if names:
+        for block in cfg.blocks:
+            for inst in block.instructions:
+                rename(inst, names)
+    return cfg.lower()
@@ -0,0 +1,45 @@
+from typing import List
+
+from MindApi.analysis import defs
+from MindApi.builtin import (
+    GetLink,
+    LookUp,
+    MetaInstruction,
+    Operation,
+    PackColor,
+    Read,
+    Set,
+)
+from MindApi.ir import ControlFlowGraph
+
+# instructions whose only effect is writing their destination
+PURE = (Set, Operation, Read, GetLink, LookUp, PackColor)
+
+
+def eliminate_dead_stores(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Remove every pure instruction whose result is overwritten (or the
+    program restarts and overwrites it) before anything reads it.
+    Instructions with effects beyond their destination, like print, write
+    or ucontrol, are always kept.
+    """
+    cfg = ControlFlowGraph(instructions)
+    changed = True
+    while changed:
+        changed = False
+        cfg.liveness()
+        for block in cfg.blocks:
+            kept = []
+            for inst, live in zip(block.instructions, block.live_after()):
+                dests = defs(inst)
+                if (
+                    isinstance(inst, PURE)
+                    and dests
+                    and not any(dest.startswith("@") for dest in dests)
+                    and not any(dest in live for dest in dests)
+                ):
+                    changed = True
+                    continue
+                kept.append(inst)
+            block.instructions = kept
+    return cfg.lower()
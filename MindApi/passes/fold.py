@@ -0,0 +1,39 @@
+from typing import Dict, List
+
+from MindApi.analysis import address_field, defs, inherit, leaders, operand_fields
+from MindApi.builtin import MetaInstruction, Operation, Set
+from MindApi.semantics import Number, fold, is_constant, to_number
+
+
+def fold_constants(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Evaluate every operation whose operands are known at compile time and
+    replace it with a ``set``. Known values are propagated forward into the
+    operands of later instructions until the next basic block starts, since
+    another path may reach a jump target with different values.
+    """
+    block_starts = leaders(instructions)
+    known: Dict[str, Number] = {}
+    result: List[MetaInstruction] = []
+    for i, inst in enumerate(instructions):
+        if i in block_starts:
+            known.clear()
+        for field in operand_fields(inst):
+            value = getattr(inst, field)
+            if isinstance(value, str) and value in known:
+                setattr(inst, field, known[value])
+        if isinstance(inst, Operation):
+            value = fold(inst.op, inst.left, inst.right)
+            if value is not None:
+                inst = inherit(Set(inst.dest, value), inst)
+        for dest in defs(inst):
+            known.pop(dest, None)
+        if (
+            isinstance(inst, Set)
+            and is_constant(inst.src)
+            and not inst.dest.startswith("@")
+            and address_field(inst) is None  # code addresses move around
+        ):
+            known[inst.dest] = to_number(inst.src)  # type: ignore
+        result.append(inst)
+    return result
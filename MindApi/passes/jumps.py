@@ -0,0 +1,94 @@
+from typing import List
+
+from MindApi.analysis import condition, inherit, jump_targets, reachable, relocate
+from MindApi.builtin import Jump, JumpTable, MetaInstruction
+from MindApi.semantics import to_number
+
+
+def _destination(instructions: List[MetaInstruction], target: int) -> int:
+    """
+    Follow unconditional jumps (and skip never taken ones) from ``target``
+    to the first instruction that does real work
+    """
+    seen = set()
+    while target not in seen:
+        seen.add(target)
+        if target >= len(instructions):
+            target = 0  # running off the end restarts the program
+            continue
+        inst = instructions[target]
+        if not isinstance(inst, Jump):
+            break
+        taken = condition(inst)
+        if taken is True and isinstance(inst.to, int):
+            target = inst.to
+        elif taken is False:
+            target += 1
+        else:
+            break
+    return target
+
+
+def thread_jumps(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Retarget every jump (and jump table entry) to the end of the jump chain
+    it starts, turn jumps with a constant condition into unconditional jumps
+    (or drop them) and delete the instructions no path reaches anymore.
+    """
+    if not instructions:
+        return instructions
+    removed = set()
+    for i, inst in enumerate(instructions):
+        if isinstance(inst, JumpTable):
+            inst.targets = [_destination(instructions, t) for t in inst.targets]
+            index = to_number(inst.index)
+            if index is not None and 0 <= index < len(inst.targets):
+                # the case is known at compile time
+                instructions[i] = inherit(Jump.always(inst.targets[int(index)]), inst)
+            continue
+        if not isinstance(inst, Jump):
+            continue
+        taken = condition(inst)
+        if taken is False:
+            removed.add(i)
+            continue
+        if not isinstance(inst.to, int):
+            continue
+        target = _destination(instructions, inst.to)
+        if taken is True:
+            instructions[i] = inst = inherit(Jump.always(target), inst)
+        inst.to = target
+
+    # "jump L1 if c" + "jump L2" + "L1:" is "jump L2 unless c"
+    targets = jump_targets(instructions)
+    for i, inst in enumerate(instructions[:-1]):
+        following = instructions[i + 1]
+        if (
+            isinstance(inst, Jump)
+            and condition(inst) is None
+            and inst.to == i + 2
+            and i not in removed
+            and i + 1 not in targets
+            and isinstance(following, Jump)
+            and condition(following) is True
+            and isinstance(following.to, int)
+        ):
+            inst.to = following.to
+            inst.reverse = not inst.reverse
+            removed.add(i + 1)
+
+    live = reachable(
+        [
+            Jump.always(i + 1) if i in removed else inst
+            for i, inst in enumerate(instructions)
+        ]
+    )
+    result: List[MetaInstruction] = []
+    index_map: List[int] = []
+    for i, inst in enumerate(instructions):
+        index_map.append(len(result))
+        if i in live and i not in removed:
+            result.append(inst)
+    index_map.append(len(result))
+    relocate(result, index_map)
+    return result
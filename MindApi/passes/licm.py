@@ -0,0 +1,162 @@
+from collections import Counter
+from typing import List, Tuple
+
+from MindApi.analysis import DEST_FIELDS, address_field, defs, map_addresses, uses
+from MindApi.builtin import (
+    Draw,
+    DrawFlush,
+    End,
+    GetLink,
+    Jump,
+    JumpTable,
+    LookUp,
+    MetaInstruction,
+    Operation,
+    Print,
+    PrintFlush,
+    Set,
+    Stop,
+    UnitBind,
+    Wait,
+    Write,
+)
+from MindApi.ir import BasicBlock, ControlFlowGraph
+from MindApi.semantics import op_name
+
+# instructions that compute the same value on every iteration when their
+# operands do, and have no other effect
+HOISTABLE = (Set, Operation, GetLink, LookUp)
+
+# instructions whose writes ``defs`` describes completely, anything else
+# (ucontrol getBlock, ...) may write every variable it mentions
+_DESCRIBED = tuple(DEST_FIELDS) + (
+    Draw,
+    DrawFlush,
+    End,
+    Jump,
+    JumpTable,
+    Print,
+    PrintFlush,
+    Stop,
+    UnitBind,
+    Wait,
+    Write,
+)
+
+
+def _written(inst: MetaInstruction) -> List[str]:
+    if isinstance(inst, _DESCRIBED):
+        return defs(inst)
+    return defs(inst) + uses(inst)
+
+
+def _hoistable(inst: MetaInstruction) -> bool:
+    dests = defs(inst)
+    return (
+        isinstance(inst, HOISTABLE)
+        and address_field(inst) is None
+        and len(dests) == 1
+        and not dests[0].startswith("@")
+        and not (isinstance(inst, Operation) and op_name(inst.op) == "rand")
+    )
+
+
+def _invariants(
+    cfg: ControlFlowGraph, header: BasicBlock, body: set, idom: dict
+) -> List[Tuple[BasicBlock, MetaInstruction]]:
+    """
+    Instructions of the loop that compute the same value on every
+    iteration, in an order that computes operands before their uses
+    """
+    writes = Counter(
+        var for block in body for inst in block.instructions for var in _written(inst)
+    )
+    exits = [
+        (block, succ) for block in body for succ in block.successors if succ not in body
+    ]
+    found: List[Tuple[BasicBlock, MetaInstruction]] = []
+    moved: set = set()
+    changed = True
+    while changed:
+        changed = False
+        for block in sorted(body, key=lambda b: b.index):
+            for inst in block.instructions:
+                if not _hoistable(inst) or any(inst is i for _, i in found):
+                    continue
+                dest = defs(inst)[0]
+                if (
+                    # the only value the loop gives it, and the loop never
+                    # reads the value it had before
+                    writes[dest] != 1
+                    or dest in header.live_in
+                    # operands are set before the loop (or by hoisted code)
+                    or any(
+                        var.startswith("@") or (writes[var] and var not in moved)
+                        for var in uses(inst)
+                    )
+                    # leaving the loop without running it keeps the old value
+                    or any(
+                        dest in succ.live_in and not cfg.dominates(block, source, idom)
+                        for source, succ in exits
+                    )
+                ):
+                    continue
+                found.append((block, inst))
+                moved.add(dest)
+                changed = True
+    return found
+
+
+def _preheader(cfg: ControlFlowGraph, header: BasicBlock, body: set) -> BasicBlock:
+    """
+    Insert an empty block right before ``header`` that every way into the
+    loop goes through, except its back edges
+    """
+    preheader = BasicBlock(len(cfg.blocks), [])
+    preheader.fallthrough = header
+    for block in cfg.blocks:
+        if block in body:
+            continue
+        if block.fallthrough is header:
+            block.fallthrough = preheader
+        for inst in block.instructions:
+            map_addresses(
+                inst, lambda target: preheader if target is header else target
+            )
+    cfg.blocks.insert(cfg.blocks.index(header), preheader)
+    return preheader
+
+
+def _back_edge_jumps(cfg: ControlFlowGraph, header: BasicBlock, body: set) -> int:
+    """
+    Jumps the preheader adds to the loop: the block laid out before the
+    header can no longer fall into it
+    """
+    before = cfg.blocks[cfg.blocks.index(header) - 1]
+    return int(before in body and before.fallthrough is header)
+
+
+def hoist_invariants(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    Move the instructions of a loop that compute the same value on every
+    iteration into a preheader run once before the loop. For the processor
+    loop, that is the end of ``init``. Loops are handled innermost first,
+    so values hoisted out of an inner loop may leave the outer one too.
+    """
+    while True:
+        cfg = ControlFlowGraph(instructions)
+        cfg.liveness()
+        idom = cfg.dominators()
+        loops = sorted(cfg.natural_loops(idom).items(), key=lambda loop: len(loop[1]))
+        for header, body in loops:
+            code = _invariants(cfg, header, body, idom)
+            if len(code) <= _back_edge_jumps(cfg, header, body):
+                continue
+            preheader = _preheader(cfg, header, body)
+            for block, inst in code:
+                block.instructions = [i for i in block.instructions if i is not inst]
+                preheader.instructions.append(inst)
+            instructions = cfg.lower()
+            break
+        else:
+            return cfg.lower()
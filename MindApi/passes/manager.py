@@ -0,0 +1,107 @@
+import abc
+from collections import Counter
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from MindApi.analysis import jump_targets, relocate, uses
+from MindApi.builtin import LOCATION, MetaInstruction
+
+Pass = Callable[[List[MetaInstruction]], List[MetaInstruction]]
+
+
+class Program:
+    """
+    Whole-program facts a peephole rule may consult besides its window
+    """
+
+    def __init__(self, instructions: List[MetaInstruction]):
+        self.instructions = instructions
+        self.reads = Counter(var for inst in instructions for var in uses(inst))
+
+
+class PeepholeRule(metaclass=abc.ABCMeta):
+    # number of consecutive instructions the rule looks at
+    size = 1
+
+    @abc.abstractmethod
+    def rewrite(
+        self, window: Sequence[MetaInstruction], index: int, program: Program
+    ) -> Optional[List[MetaInstruction]]:
+        """
+        Return the replacement of ``window`` (which starts at ``index``),
+        or None if the rule does not apply.
+        A rule must not add reads of a variable.
+        """
+
+
+class PeepholePass:
+    """
+    Slide every rule over the program until none of them applies anymore.
+    Windows never span a jump target, so a rewrite can't change what a jump
+    into the middle of the window would observe.
+    """
+
+    def __init__(self, rules: Iterable[PeepholeRule]):
+        self.rules = list(rules)
+
+    def __call__(self, instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+        changed = True
+        while changed:
+            instructions, changed = self.sweep(instructions)
+        return instructions
+
+    def sweep(self, instructions: List[MetaInstruction]):
+        program = Program(instructions)
+        targets = jump_targets(instructions)
+        result: List[MetaInstruction] = []
+        index_map: List[int] = []
+        changed = False
+        i = 0
+        while i < len(instructions):
+            replacement = None
+            for rule in self.rules:
+                end = i + rule.size
+                if end > len(instructions) or any(
+                    j in targets for j in range(i + 1, end)
+                ):
+                    continue
+                replacement = rule.rewrite(instructions[i:end], i, program)
+                if replacement is not None:
+                    break
+            if replacement is None:
+                index_map.append(len(result))
+                result.append(instructions[i])
+                i += 1
+                continue
+            index_map.extend([len(result)] * rule.size)
+            result.extend(replacement)
+            i = end
+            changed = True
+        index_map.append(len(result))
+        relocate(result, index_map)
+        return result, changed
+
+
+def _signature(instructions: List[MetaInstruction]):
+    return [
+        (type(inst), [getattr(inst, name) for name in inst.fields + LOCATION])
+        for inst in instructions
+    ]
+
+
+class PassManager:
+    """
+    Run a pipeline of passes repeatedly until the program stops changing
+    """
+
+    def __init__(self, passes: Iterable[Pass], max_rounds: int = 16):
+        self.passes = list(passes)
+        self.max_rounds = max_rounds
+
+    def run(self, instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+        for _ in range(self.max_rounds):
+            before = _signature(instructions)
+            for optimization in self.passes:
+                instructions = optimization(instructions)
+            if _signature(instructions) == before:
+                break
+        return instructions
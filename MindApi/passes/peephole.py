@@ -0,0 +1,57 @@
+from MindApi.builtin import Jump, Operation, Set
+from MindApi.passes.manager import PeepholeRule
+
+
+def _is_plain(name) -> bool:
+    return isinstance(name, str) and not name.startswith("@")
+
+
+class SelfAssignment(PeepholeRule):
+    """
+    ``set a a`` does nothing
+    """
+
+    def rewrite(self, window, index, program):
+        inst = window[0]
+        if isinstance(inst, Set) and inst.dest == inst.src:
+            return []
+        return None
+
+
+class CopyChain(PeepholeRule):
+    """
+    ``set t x`` + ``set y t`` becomes ``set y x`` when nothing else reads ``t``
+    (the same holds for an ``op`` producing ``t``)
+    """
+
+    size = 2
+
+    def rewrite(self, window, index, program):
+        first, second = window
+        if (
+            isinstance(first, (Set, Operation))
+            and isinstance(second, Set)
+            and _is_plain(first.dest)
+            and _is_plain(second.dest)
+            and second.src == first.dest
+            and second.dest != first.dest
+            and program.reads[first.dest] == 1
+        ):
+            first.dest = second.dest
+            return [first]
+        return None
+
+
+class JumpToNext(PeepholeRule):
+    """
+    A jump to the following instruction lands there either way
+    """
+
+    def rewrite(self, window, index, program):
+        inst = window[0]
+        if isinstance(inst, Jump) and inst.to == index + 1:
+            return []
+        return None
+
+
+PEEPHOLE_RULES = [SelfAssignment(), CopyChain(), JumpToNext()]
@@ -0,0 +1,36 @@
+from typing import List
+
+from MindApi.builtin import MetaInstruction
+from MindApi.passes.copies import coalesce_variables, propagate_copies
+from MindApi.passes.dse import eliminate_dead_stores
+from MindApi.passes.fold import fold_constants
+from MindApi.passes.jumps import thread_jumps
+from MindApi.passes.licm import hoist_invariants
+from MindApi.passes.manager import Pass, PassManager, PeepholePass
+from MindApi.passes.peephole import PEEPHOLE_RULES
+
+# 0: emit the instructions as converted
+# 1: local optimizations (constant folding, peephole rules)
+# 2: every optimization
+DEFAULT_OPT_LEVEL = 2
+
+
+def pipeline(opt_level: int = DEFAULT_OPT_LEVEL) -> PassManager:
+    passes: List[Pass] = []
+    if opt_level >= 1:
+        passes += [fold_constants, PeepholePass(PEEPHOLE_RULES)]
+    if opt_level >= 2:
+        passes += [
+            thread_jumps,
+            propagate_copies,
+            hoist_invariants,
+            eliminate_dead_stores,
+            coalesce_variables,
+        ]
+    return PassManager(passes)
+
+
+def optimize(
+    instructions: List[MetaInstruction], opt_level: int = DEFAULT_OPT_LEVEL
+) -> List[MetaInstruction]:
+    return pipeline(opt_level).run(instructions)
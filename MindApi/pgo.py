@@ -0,0 +1,152 @@
+"""
+Profile guided optimization: run a program on recorded inputs in the
+emulator, keep how often methods are called and which way every if test
+went, and let ``compiler(cls, profile=...)`` lay the code out for the
+paths that are actually hot.
+"""
+import json
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from MindApi.analysis import condition
+from MindApi.builtin import Jump
+from MindApi.cost import call_site, loop_entry
+from MindApi.emulator import Processor
+
+PROFILE_VERSION = 1
+
+
+def branch_key(method: str, line: int) -> str:
+    return f"{method}:{line}"
+
+
+class Profile:
+    """
+    Execution counts of a program, keyed by python method and line so they
+    still apply when the program is compiled differently.
+    ``calls`` counts the calls of every method, ``branches`` how often the
+    test of every if held and failed, ``executed`` the instructions every
+    method ran, ``iterations`` the times ``loop`` started over.
+    """
+
+    def __init__(
+        self,
+        calls: Optional[Dict[str, int]] = None,
+        branches: Optional[Dict[str, List[int]]] = None,
+        executed: Optional[Dict[str, int]] = None,
+        iterations: int = 0,
+    ):
+        self.calls = dict(calls or {})
+        self.branches = {key: list(counts) for key, counts in (branches or {}).items()}
+        self.executed = dict(executed or {})
+        self.iterations = iterations
+
+    @classmethod
+    def from_processor(cls, processor: Processor) -> "Profile":
+        """
+        Profile of the run of a processor so far
+        """
+        profile = cls()
+        instructions = processor.instructions
+        for index, inst in enumerate(instructions):
+            count = processor.counts[index]
+            if inst.method is not None:
+                profile.executed[inst.method] = (
+                    profile.executed.get(inst.method, 0) + count
+                )
+            call = call_site(instructions, index)
+            if call is not None:
+                profile.calls[call[0]] = profile.calls.get(call[0], 0) + count
+            elif isinstance(inst, Jump) and inst.line is not None:
+                if condition(inst) is not None:
+                    continue  # no longer a test
+                taken = processor.taken[index]
+                # a reversed jump skips the body when the test fails
+                held = count - taken if inst.reverse else taken
+                counts = profile.branches.setdefault(
+                    branch_key(inst.method, inst.line), [0, 0]  # type: ignore
+                )
+                counts[0] += held
+                counts[1] += count - held
+        entry = loop_entry(instructions)
+        if entry is not None:
+            profile.iterations = processor.counts[entry]
+        return profile
+
+    def merge(self, other: "Profile") -> "Profile":
+        """
+        Add the counts of ``other`` to this profile
+        """
+        for method, count in other.calls.items():
+            self.calls[method] = self.calls.get(method, 0) + count
+        for method, count in other.executed.items():
+            self.executed[method] = self.executed.get(method, 0) + count
+        for key, (held, failed) in other.branches.items():
+            counts = self.branches.setdefault(key, [0, 0])
+            counts[0] += held
+            counts[1] += failed
+        self.iterations += other.iterations
+        return self
+
+    def branch(self, method: str, line: int) -> List[int]:
+        """
+        Times the if test at ``line`` of ``method`` held and failed
+        """
+        return self.branches.get(branch_key(method, line), [0, 0])
+
+    def hot(self, method: str) -> bool:
+        """
+        Whether ``method`` is called at least once per iteration of loop
+        """
+        return self.calls.get(method, 0) >= max(self.iterations, 1)
+
+    def cold(self, method: str) -> bool:
+        """
+        Whether ``method`` was never called
+        """
+        return self.calls.get(method, 0) == 0
+
+    def to_dict(self) -> dict:
+        return {
+            "version": PROFILE_VERSION,
+            "iterations": self.iterations,
+            "calls": self.calls,
+            "branches": self.branches,
+            "executed": self.executed,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "Profile":
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(f"Unsupported profile version: {data.get('version')}")
+        return cls(
+            data["calls"], data["branches"], data["executed"], data["iterations"]
+        )
+
+    def save(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2, sort_keys=True)
+
+    @classmethod
+    def load(cls, path: str) -> "Profile":
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
+
+
+def collect_profile(
+    cls, inputs: Iterable[Mapping[str, object]], ticks: int = 600, **kwargs
+) -> Profile:
+    """
+    Run ``cls`` compiled without optimization once per input for ``ticks``
+    ticks and add up the counts. Every input maps variables (``__p`` for
+    ``self.p``) to their initial value, ``kwargs`` go to the Processor.
+    """
+    from MindApi.core import compiler
+
+    instructions = compiler(cls, opt_level=0)
+    profile = Profile()
+    for values in inputs:
+        processor = Processor(instructions, **kwargs)
+        processor.variables.update(values)
+        processor.run(ticks)
+        profile.merge(Profile.from_processor(processor))
+    return profile
@@ -0,0 +1,224 @@
+"""
+Hot spot profiler: run a compiled program in the emulator and attribute
+the executed instructions to python methods and source lines.
+"""
+import json
+import linecache
+from typing import Dict, Iterable, List, Mapping, Optional, TextIO, Tuple
+
+from MindApi.analysis import condition
+from MindApi.builtin import Jump, MetaInstruction
+from MindApi.emulator import Processor
+from MindApi.passes import DEFAULT_OPT_LEVEL
+from MindApi.sourcemap import SourceMap
+
+BAR_WIDTH = 40
+
+# report columns ``Stats.report`` may sort by
+SORT_KEYS = {
+    "executed": lambda row: -row["executed"],
+    "instructions": lambda row: -row["instructions"],
+    "method": lambda row: (row["method"] or "", row["line"] or 0),
+    "line": lambda row: (row["file"] or "", row["line"] or 0),
+}
+
+
+class Stats:
+    """
+    Executed instructions per method, per source line and per instruction
+    of a program, with how often every conditional jump was taken
+    """
+
+    def __init__(
+        self,
+        instructions: List[MetaInstruction],
+        source_map: SourceMap,
+        counts: List[int],
+        taken: List[int],
+        ticks: int = 0,
+        runs: int = 0,
+    ):
+        self.instructions = instructions
+        self.source_map = source_map
+        self.counts = counts
+        self.taken = taken
+        self.ticks = ticks
+        self.runs = runs
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def methods(self) -> Dict[Optional[str], int]:
+        result: Dict[Optional[str], int] = {}
+        for inst, count in zip(self.instructions, self.counts):
+            result[inst.method] = result.get(inst.method, 0) + count
+        return result
+
+    def lines(self) -> List[dict]:
+        """
+        One row per source line: its method, file, line, instructions and
+        the instructions executed there
+        """
+        rows: Dict[Tuple[Optional[str], Optional[int]], dict] = {}
+        for index, inst in enumerate(self.instructions):
+            origin = self.source_map[index]
+            line = origin[1] if origin is not None else None
+            row = rows.setdefault(
+                (inst.method, line),
+                {
+                    "method": inst.method,
+                    "file": self.source_map.files.get(inst.method),  # type: ignore
+                    "line": line,
+                    "instructions": 0,
+                    "executed": 0,
+                },
+            )
+            row["instructions"] += 1
+            row["executed"] += self.counts[index]
+        return list(rows.values())
+
+    def jumps(self) -> List[dict]:
+        """
+        One row per conditional jump: how often it ran and was taken
+        """
+        rows = []
+        for index, inst in enumerate(self.instructions):
+            if not isinstance(inst, Jump) or condition(inst) is not None:
+                continue
+            origin = self.source_map[index]
+            rows.append(
+                {
+                    "index": index,
+                    "method": inst.method,
+                    "line": origin[1] if origin is not None else None,
+                    "executed": self.counts[index],
+                    "taken": self.taken[index],
+                }
+            )
+        return rows
+
+    def _percent(self, count: int) -> float:
+        return 100 * count / self.total if self.total else 0.0
+
+    def _source(self, row: dict) -> str:
+        if row["file"] is None or row["line"] is None:
+            return "<compiler>"
+        return linecache.getline(row["file"], row["line"]).strip()
+
+    def flame(self) -> str:
+        """
+        Every method and, under it, every line of the method with a bar as
+        long as its share of the executed instructions
+        """
+        lines = []
+        by_method: Dict[Optional[str], List[dict]] = {}
+        for row in self.lines():
+            by_method.setdefault(row["method"], []).append(row)
+        methods = sorted(self.methods().items(), key=lambda item: -item[1])
+        for method, executed in methods:
+            share = self._percent(executed)
+            bar = "#" * round(share * BAR_WIDTH / 100)
+            lines.append(f"{method or '<none>':<24}{executed:>10}{share:>7.1f}%  {bar}")
+            for row in sorted(by_method[method], key=SORT_KEYS["executed"]):
+                share = self._percent(row["executed"])
+                bar = "#" * round(share * BAR_WIDTH / 100)
+                line = "-" if row["line"] is None else row["line"]
+                lines.append(
+                    f"  {line!s:<22}{row['executed']:>10}{share:>7.1f}%  {bar}"
+                    f"  {self._source(row)}"
+                )
+        return "\n".join(lines)
+
+    def report(self, sort: str = "executed", limit: Optional[int] = None) -> str:
+        """
+        Sorted table of the source lines in the manner of ``cProfile``
+        followed by the taken ratio of every conditional jump
+        """
+        rows = sorted(self.lines(), key=SORT_KEYS[sort])[:limit]
+        lines = [
+            f"{self.total} instructions executed in {self.ticks} ticks"
+            f" ({self.runs} runs)",
+            "",
+            f"Ordered by: {sort}",
+            "",
+            f"{'executed':>10}{'percent':>9}{'instrs':>8}  method:line(source)",
+        ]
+        for row in rows:
+            line = "-" if row["line"] is None else row["line"]
+            lines.append(
+                f"{row['executed']:>10}{self._percent(row['executed']):>8.1f}%"
+                f"{row['instructions']:>8}  {row['method']}:{line}"
+                f"({self._source(row)})"
+            )
+        lines += [
+            "",
+            f"{'jump':>6}{'executed':>10}{'taken':>10}{'ratio':>8}  method:line",
+        ]
+        for jump in self.jumps():
+            ratio = jump["taken"] / jump["executed"] if jump["executed"] else 0.0
+            line = "-" if jump["line"] is None else jump["line"]
+            lines.append(
+                f"{jump['index']:>6}{jump['executed']:>10}{jump['taken']:>10}"
+                f"{ratio:>8.2f}  {jump['method']}:{line}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "ticks": self.ticks,
+            "runs": self.runs,
+            "methods": self.methods(),
+            "lines": self.lines(),
+            "jumps": self.jumps(),
+            "instructions": [
+                {"index": index, "text": str(inst), "executed": count}
+                for index, (inst, count) in enumerate(
+                    zip(self.instructions, self.counts)
+                )
+            ],
+        }
+
+    def save(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+def profile(
+    cls,
+    ticks: int = 600,
+    inputs: Iterable[Mapping[str, object]] = ({},),
+    opt_level: int = DEFAULT_OPT_LEVEL,
+    sort: str = "executed",
+    file: Optional[TextIO] = None,
+    quiet: bool = False,
+    **kwargs,
+) -> Stats:
+    """
+    Run ``cls`` compiled at ``opt_level`` once per input for ``ticks``
+    ticks, print the flame breakdown and the sorted report to ``file``
+    (stdout by default) unless ``quiet`` and return the statistics. Every input maps
+    variables (``__p`` for ``self.p``) to their initial value, ``kwargs``
+    go to the Processor.
+    """
+    from MindApi.core import compiler
+
+    instructions = compiler(cls, opt_level=opt_level)
+    counts = [0] * len(instructions)
+    taken = [0] * len(instructions)
+    stats = Stats(instructions, SourceMap.of(instructions, cls), counts, taken)
+    for values in inputs:
+        processor = Processor(instructions, **kwargs)
+        processor.variables.update(values)
+        processor.run(ticks)
+        for index in range(len(instructions)):
+            counts[index] += processor.counts[index]
+            taken[index] += processor.taken[index]
+        stats.ticks += processor.ticks
+        stats.runs += 1
+    if not quiet:
+        print(stats.flame(), file=file)
+        print(file=file)
+        print(stats.report(sort), file=file)
+    return stats
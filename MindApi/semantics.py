@@ -0,0 +1,177 @@
+import math
+import re
+from typing import Callable, Dict, Optional, TypeGuard, Union
+
+from MindApi.types import OperationType
+from MindApi.utils import binary_ops
+
+Number = Union[int, float]
+
+_NUMBER = re.compile(r"^-?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?$")
+_OP_NAMES = {op.value for op in OperationType}
+
+_LONG_MIN = -(2**63)
+_LONG_MAX = 2**63 - 1
+
+
+def to_number(value) -> Optional[Number]:
+    """
+    Return the numeric value of an operand, or None if it names a variable
+    """
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str) and _NUMBER.match(value):
+        number = float(value)
+        return int(number) if number.is_integer() and "." not in value else number
+    return None
+
+
+def is_constant(value) -> bool:
+    return to_number(value) is not None
+
+
+def is_variable(value) -> TypeGuard[str]:
+    return isinstance(value, str) and not is_constant(value)
+
+
+def format_number(value: Number) -> Number:
+    """
+    Print integral doubles the way the processor does ("2" instead of "2.0")
+    """
+    if isinstance(value, float) and value.is_integer() and abs(value) < 2**53:
+        return int(value)
+    return value
+
+
+def op_name(op: Union[OperationType, str]) -> Optional[str]:
+    """
+    Map an ``Operation.op`` (ast operator name or OperationType) to its mlog name
+    """
+    if isinstance(op, OperationType):
+        return op.value
+    if op in binary_ops:
+        return binary_ops[op]
+    if op in _OP_NAMES:
+        return op
+    return None
+
+
+def _long(value: float) -> int:
+    # java (long) cast: truncate towards zero and saturate
+    if math.isnan(value):
+        return 0
+    if math.isinf(value):
+        return _LONG_MAX if value > 0 else _LONG_MIN
+    return max(_LONG_MIN, min(_LONG_MAX, int(value)))
+
+
+def _wrap(value: int) -> int:
+    value &= 2**64 - 1
+    return value - 2**64 if value >= 2**63 else value
+
+
+def _mod(a: float, b: float) -> float:
+    return math.fmod(a, b)
+
+
+def _angle(x: float, y: float) -> float:
+    result = math.degrees(math.atan2(y, x))
+    return result + 360 if result < 0 else result
+
+
+def _angle_diff(a: float, b: float) -> float:
+    a %= 360
+    b %= 360
+    return min((a - b) % 360, (b - a) % 360)
+
+
+binary_functions: Dict[str, Callable[[float, float], float]] = {
+    "add": lambda a, b: a + b,
+    "sub": lambda a, b: a - b,
+    "mul": lambda a, b: a * b,
+    "div": lambda a, b: a / b,
+    "idiv": lambda a, b: math.floor(a / b),
+    "mod": _mod,
+    "pow": math.pow,
+    "equal": lambda a, b: 1 if abs(a - b) < 0.000001 else 0,
+    "notEqual": lambda a, b: 0 if abs(a - b) < 0.000001 else 1,
+    "land": lambda a, b: 1 if a != 0 and b != 0 else 0,
+    "lessThan": lambda a, b: 1 if a < b else 0,
+    "lessThanEq": lambda a, b: 1 if a <= b else 0,
+    "greaterThan": lambda a, b: 1 if a > b else 0,
+    "greaterThanEq": lambda a, b: 1 if a >= b else 0,
+    "strictEqual": lambda a, b: 1 if a == b else 0,
+    "shl": lambda a, b: _wrap(_long(a) << (_long(b) & 63)),
+    "shr": lambda a, b: _long(a) >> (_long(b) & 63),
+    "or": lambda a, b: _long(a) | _long(b),
+    "and": lambda a, b: _long(a) & _long(b),
+    "xor": lambda a, b: _long(a) ^ _long(b),
+    "max": max,
+    "min": min,
+    "angle": _angle,
+    "angleDiff": _angle_diff,
+    "len": math.hypot,
+}
+
+unary_functions: Dict[str, Callable[[float], float]] = {
+    "not": lambda a: ~_long(a),
+    "abs": abs,
+    "log": math.log,
+    "log10": math.log10,
+    "floor": math.floor,
+    "ceil": math.ceil,
+    "sqrt": math.sqrt,
+    "sin": lambda a: math.sin(math.radians(a)),
+    "cos": lambda a: math.cos(math.radians(a)),
+    "tan": lambda a: math.tan(math.radians(a)),
+    "asin": lambda a: math.degrees(math.asin(a)),
+    "acos": lambda a: math.degrees(math.acos(a)),
+    "atan": lambda a: math.degrees(math.atan(a)),
+}
+
+# the processor computes these with float approximations (or randomness),
+# folding them at compile time would not reproduce the in-game result
+NOT_FOLDABLE = {"angle", "angleDiff", "len", "noise", "rand"}
+
+
+def is_unary(op: Union[OperationType, str]) -> bool:
+    return op_name(op) in unary_functions or op_name(op) == "rand"
+
+
+def evaluate(op: Union[OperationType, str], left: Number, right: Number = 0):
+    """
+    Evaluate ``op`` the way a processor does.
+    Return None if the result would be NaN/Infinity (the processor stores null)
+    or the operation is unknown.
+    """
+    name = op_name(op)
+    try:
+        if name in unary_functions:
+            result = unary_functions[name](left)
+        elif name in binary_functions:
+            result = binary_functions[name](left, right)
+        else:
+            return None
+    except (ArithmeticError, ValueError):
+        return None
+    if isinstance(result, float) and (math.isnan(result) or math.isinf(result)):
+        return None
+    return format_number(result)
+
+
+def fold(op: Union[OperationType, str], left, right) -> Optional[Number]:
+    """
+    Compile-time evaluation of ``op left right``, None if it can't be folded
+    """
+    name = op_name(op)
+    if name is None or name in NOT_FOLDABLE:
+        return None
+    a = to_number(left)
+    if a is None:
+        return None
+    if name in unary_functions:
+        return evaluate(name, a)
+    b = to_number(right)
+    if b is None:
+        return None
+    return evaluate(name, a, b)
@@ -0,0 +1,232 @@
+"""
+Compile server: a long lived process that compiles python source sent
+over a local socket, keeping what it learned between requests. The same
+source is answered from memory, a new version of a class only converts
+the methods that changed (see ``MindApi.watch``).
+
+The protocol is one JSON object per line each way. A request holds the
+``source`` of a module and optionally ``class`` (default: every processor
+class of the module), ``opt_level``, ``stack``, ``document`` (a name for
+the file the source comes from, versions of it share their caches) and
+``id``, which is sent back. The answer holds ``ok``, ``programs`` (the
+mlog of every class) and ``seconds``, or ``error``. ``{"op": "stats"}``
+returns the request counts.
+
+The server runs the source it is sent, it is meant for local tools and
+only listens on a unix socket or a local address.
+"""
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import hashlib
+import ipaddress
+import json
+import linecache
+import socket
+import time
+import traceback
+import types
+from typing import Optional, Tuple
+
+from MindApi.build import is_processor
+from MindApi.core import STACK
+from MindApi.mlog import dumps
+from MindApi.passes import DEFAULT_OPT_LEVEL
+from MindApi.watch import Recompiler
+
+CACHE_SIZE = 256  # results and classes kept in memory
+LINE_LIMIT = 16 * 1024 * 1024  # longest request, in bytes
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Whether every address ``host`` stands for is a loopback address
+    """
+    try:
+        addresses = {str(info[4][0]) for info in socket.getaddrinfo(host, None)}
+    except (OSError, UnicodeError):
+        return False
+    # scoped IPv6 addresses end with %interface
+    return bool(addresses) and all(
+        ipaddress.ip_address(address.split("%")[0]).is_loopback for address in addresses
+    )
+
+
+class CompileServer:
+    """
+    Answers compile requests, see the module documentation. ``handle``
+    serves one connection, ``compile`` one request.
+    """
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.cache_size = cache_size
+        # answers by request digest and recompilers by document and class,
+        # least recently used first
+        self.results: collections.OrderedDict = collections.OrderedDict()
+        self.recompilers: collections.OrderedDict = collections.OrderedDict()
+        # file names the sources sent are registered with linecache under
+        self.files: collections.OrderedDict = collections.OrderedDict()
+        # runs the requests, one after the other
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mindapi-compile"
+        )
+        self.requests = 0
+        self.hits = 0
+
+    @staticmethod
+    def _use(table: collections.OrderedDict, key, value, size: int):
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > size:
+            table.popitem(last=False)
+
+    def load(self, source: str, document: str, digest: str) -> types.ModuleType:
+        """
+        Run ``source`` as a module whose methods ``inspect`` finds the
+        source of
+        """
+        filename = f"<mindapi:{document or digest[:16]}>"
+        lines = source.splitlines(keepends=True)
+        # no modification time, linecache keeps the lines until the file
+        # is the least recently used one of more than cache_size
+        linecache.cache[filename] = (len(source), None, lines, filename)
+        self.files[filename] = None
+        self.files.move_to_end(filename)
+        while len(self.files) > self.cache_size:
+            linecache.cache.pop(self.files.popitem(last=False)[0], None)
+        module = types.ModuleType(f"mindapi_{digest[:16]}")
+        module.__file__ = filename
+        exec(compile(source, filename, "exec"), module.__dict__)
+        return module
+
+    def compile(self, request: dict) -> dict:
+        """
+        Answer to a compile request
+        """
+        self.requests += 1
+        options = {
+            "source": request["source"],
+            "class": request.get("class"),
+            "opt_level": request.get("opt_level", DEFAULT_OPT_LEVEL),
+            "stack": request.get("stack", STACK),
+            "document": request.get("document", ""),
+        }
+        digest = hashlib.sha256(
+            json.dumps(options, sort_keys=True).encode()
+        ).hexdigest()
+        if digest in self.results:
+            self.hits += 1
+            self.results.move_to_end(digest)
+            return self.results[digest]
+        start = time.perf_counter()
+        try:
+            module = self.load(options["source"], options["document"], digest)
+            names = [
+                name
+                for name, value in vars(module).items()
+                if is_processor(value) and value.__module__ == module.__name__
+            ]
+            if options["class"] is not None:
+                if options["class"] not in names:
+                    raise ValueError(f"No processor class {options['class']}")
+                names = [options["class"]]
+            programs = {}
+            for name in names:
+                key: Tuple = (options["document"], name)
+                key += (options["opt_level"], options["stack"])
+                recompiler = self.recompilers.get(key)
+                if recompiler is None:
+                    recompiler = Recompiler(options["opt_level"], options["stack"])
+                self._use(self.recompilers, key, recompiler, self.cache_size)
+                programs[name] = dumps(recompiler.compile(getattr(module, name)))
+            result: dict = {"ok": True, "programs": programs}
+        except Exception as error:
+            result = {
+                "ok": False,
+                "error": "".join(traceback.format_exception_only(type(error), error)),
+            }
+        result["seconds"] = time.perf_counter() - start
+        if result["ok"]:
+            self._use(self.results, digest, result, self.cache_size)
+        return result
+
+    def answer(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+            if request.get("op") == "stats":
+                result = {
+                    "ok": True,
+                    "requests": self.requests,
+                    "hits": self.hits,
+                    "classes": len(self.recompilers),
+                }
+            else:
+                result = self.compile(request)
+        except Exception as error:
+            return {"ok": False, "error": f"Invalid request: {error}"}
+        if "id" in request:
+            result = dict(result, id=request["id"])
+        return result
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Answer the requests of one client until it disconnects. Requests
+        run the source they send, which may take any time: they are
+        answered on the compile thread, the requests of all clients one
+        after the other, while the event loop keeps serving connections.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                result = await loop.run_in_executor(self.executor, self.answer, line)
+                writer.write(json.dumps(result).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass  # the client went away or sent more than a request may hold
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(
+        self,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> asyncio.AbstractServer:
+        """
+        Listen on the unix socket ``path``, or on ``host`` and ``port``.
+        The server runs the source it is sent: ``host`` must be a loopback
+        address.
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path, limit=LINE_LIMIT)
+        if not is_loopback(host):
+            raise ValueError(f"Not a loopback address: {host!r}")
+        return await asyncio.start_server(self.handle, host, port, limit=LINE_LIMIT)
+
+
+def serve(
+    path: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    cache_size: int = CACHE_SIZE,
+    ready=None,
+):
+    """
+    Run a compile server until interrupted. ``ready`` is called with the
+    addresses it listens on.
+    """
+
+    async def main():
+        server = await CompileServer(cache_size).start(path, host, port)
+        if ready is not None:
+            ready([listener.getsockname() for listener in server.sockets])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""
+Source maps: the python method, line and column every instruction of a
+compiled program was converted from.
+"""
+import inspect
+import json
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from MindApi.builtin import MetaInstruction
+
+SOURCE_MAP_VERSION = 1
+
+Origin = Tuple[str, int, int]  # method, line, column
+
+
+class SourceMap:
+    """
+    Origin of every instruction by index, None for the instructions the
+    compiler adds on its own (the loop jump, the return at the end of a
+    method). ``files`` is the file every method is defined in.
+    """
+
+    def __init__(self, origins: List[Optional[Origin]], files: Dict[str, str]):
+        self.origins = origins
+        self.files = files
+
+    @classmethod
+    def of(cls, instructions: Sequence[MetaInstruction], program=None) -> "SourceMap":
+        """
+        Source map of ``instructions`` compiled from the class ``program``
+        """
+        origins: List[Optional[Origin]] = [
+            (inst.method, inst.line, inst.column)  # type: ignore
+            if inst.method is not None and inst.line is not None
+            else None
+            for inst in instructions
+        ]
+        files = {}
+        for inst in instructions:
+            method = inst.method
+            if program is None or method is None or method in files:
+                continue
+            if hasattr(program, method):
+                files[method] = inspect.getsourcefile(getattr(program, method))
+        return cls(origins, files)  # type: ignore
+
+    def __len__(self):
+        return len(self.origins)
+
+    def __getitem__(self, index: int) -> Optional[Origin]:
+        return self.origins[index]
+
+    def attribute(
+        self, counts: Optional[Sequence[int]] = None
+    ) -> Dict[Tuple[Optional[str], Optional[int]], int]:
+        """
+        Add up a count per instruction (the instructions themselves by
+        default, or the counts of an emulator run) per method and line.
+        Instructions the compiler added count for line None.
+        """
+        result: Dict[Tuple[Optional[str], Optional[int]], int] = {}
+        for index, origin in enumerate(self.origins):
+            key = (origin[0], origin[1]) if origin is not None else (None, None)
+            count = 1 if counts is None else counts[index]
+            result[key] = result.get(key, 0) + count
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            "version": SOURCE_MAP_VERSION,
+            "files": self.files,
+            "mappings": [
+                list(origin) if origin is not None else None for origin in self.origins
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "SourceMap":
+        if data.get("version") != SOURCE_MAP_VERSION:
+            raise ValueError(f"Unsupported source map version: {data.get('version')}")
+        origins = [
+            tuple(origin) if origin is not None else None  # type: ignore
+            for origin in data["mappings"]
+        ]
+        return cls(origins, dict(data["files"]))  # type: ignore
+
+    def save(self, path: str):
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "SourceMap":
+        with open(path) as file:
+            return cls.from_dict(json.load(file))
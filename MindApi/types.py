@@ -1,496 +1,524 @@
+"""
+Enums of the names mlog uses. The catalogs of buildings, units, liquids
+and items are long, each is built from ``MindApi.catalog`` the first time
+it is used rather than on import.
+"""
 from enum import Enum
+from typing import TYPE_CHECKING, Any, List
 
 
 class StrEnum(str, Enum):
     pass
 
 
-class BuildingType(StrEnum):
-    Parallax = "parallax"  # 差扰
-    Cliff = "cliff"  # 悬崖
-    SandBoulder = "sand-boulder"  # 砂岩
-    BasaltBoulder = "basalt-boulder"  # 玄武岩石块
-    Grass = "grass"  # 草地
-    MoltenSlag = "molten-slag"  # 矿渣液
-    PooledCryofluid = "pooled-cryofluid"  # 冷冻液
-    Space = "space"  # 太空
-    Salt = "salt"  # 盐碱地
-    SaltWall = "salt-wall"  # 盐墙
-    Pebbles = "pebbles"  # 鹅卵石
-    Tendrils = "tendrils"  # 卷须
-    SandWall = "sand-wall"  # 沙墙
-    SporePine = "spore-pine"  # 孢子树
-    SporeWall = "spore-wall"  # 孢子墙
-    Boulder = "boulder"  # 石块
-    SnowBoulder = "snow-boulder"  # 雪石块
-    SnowPine = "snow-pine"  # 雪树
-    Shale = "shale"  # 页岩地
-    ShaleBoulder = "shale-boulder"  # 页岩石块
-    Moss = "moss"  # 苔藓地
-    Shrubs = "shrubs"  # 灌木丛
-    SporeMoss = "spore-moss"  # 孢子苔藓地
-    ShaleWall = "shale-wall"  # 页岩墙
-    ScrapWall = "scrap-wall"  # 废墙
-    ScrapWallLarge = "scrap-wall-large"  # 大型废墙
-    ScrapWallHuge = "scrap-wall-huge"  # 巨型废墙
-    ScrapWallGigantic = "scrap-wall-gigantic"  # 超巨型废墙
-    Thruster = "thruster"  # 推进器残骸
-    Kiln = "kiln"  # 窑炉
-    GraphitePress = "graphite-press"  # 石墨压缩机
-    MultiPress = "multi-press"  # 多重压缩机
-    Spawn = "spawn"  # 敌人出生点
-    CoreShard = "core-shard"  # 初代核心
-    CoreFoundation = "core-foundation"  # 次代核心
-    CoreNucleus = "core-nucleus"  # 终代核心
-    DeepWater = "deep-water"  # 深水
-    ShallowWater = "shallow-water"  # 水
-    TaintedWater = "tainted-water"  # 污水
-    DeepTaintedWater = "deep-tainted-water"  # 深污水
-    DarksandTaintedWater = "darksand-tainted-water"  # 黑沙污水
-    Tar = "tar"  # 石油
-    Stone = "stone"  # 石头
-    SandFloor = "sand-floor"  # 沙子
-    Darksand = "darksand"  # 黑沙
-    Ice = "ice"  # 冰
-    Snow = "snow"  # 雪
-    CraterStone = "crater-stone"  # 陨石坑
-    SandWater = "sand-water"  # 浅滩
-    DarksandWater = "darksand-water"  # 黑沙浅滩
-    Char = "char"  # 焦土
-    Dacite = "dacite"  # 安山岩
-    Rhyolite = "rhyolite"  # 流纹岩
-    DaciteWall = "dacite-wall"  # 安山岩墙
-    DaciteBoulder = "dacite-boulder"  # 安山石块
-    IceSnow = "ice-snow"  # 冰雪地
-    StoneWall = "stone-wall"  # 石墙
-    IceWall = "ice-wall"  # 冰墙
-    SnowWall = "snow-wall"  # 雪墙
-    DuneWall = "dune-wall"  # 沙丘岩
-    Pine = "pine"  # 松树
-    Dirt = "dirt"  # 泥土
-    DirtWall = "dirt-wall"  # 泥土墙
-    Mud = "mud"  # 泥巴
-    WhiteTreeDead = "white-tree-dead"  # 枯萎的白树
-    WhiteTree = "white-tree"  # 白树
-    SporeCluster = "spore-cluster"  # 孢子簇
-    MetalFloor = "metal-floor"  # 金属地板1
-    MetalFloor2 = "metal-floor-2"  # 金属地板2
-    MetalFloor3 = "metal-floor-3"  # 金属地板3
-    MetalFloor4 = "metal-floor-4"  # 金属地板4
-    MetalFloor5 = "metal-floor-5"  # 金属地板5
-    MetalFloorDamaged = "metal-floor-damaged"  # 损坏的金属地板
-    DarkPanel1 = "dark-panel-1"  # 暗面板1
-    DarkPanel2 = "dark-panel-2"  # 暗面板2
-    DarkPanel3 = "dark-panel-3"  # 暗面板3
-    DarkPanel4 = "dark-panel-4"  # 暗面板4
-    DarkPanel5 = "dark-panel-5"  # 暗面板5
-    DarkPanel6 = "dark-panel-6"  # 暗面板6
-    DarkMetal = "dark-metal"  # 暗金属
-    Basalt = "basalt"  # 玄武岩
-    Hotrock = "hotrock"  # 灼热岩石
-    Magmarock = "magmarock"  # 熔融岩石
-    CopperWall = "copper-wall"  # 铜墙
-    CopperWallLarge = "copper-wall-large"  # 大型铜墙
-    TitaniumWall = "titanium-wall"  # 钛墙
-    TitaniumWallLarge = "titanium-wall-large"  # 大型钛墙
-    PlastaniumWall = "plastanium-wall"  # 塑钢墙
-    PlastaniumWallLarge = "plastanium-wall-large"  # 大型塑钢墙
-    PhaseWall = "phase-wall"  # 相织布墙
-    PhaseWallLarge = "phase-wall-large"  # 大型相织布墙
-    ThoriumWall = "thorium-wall"  # 钍墙
-    ThoriumWallLarge = "thorium-wall-large"  # 大型钍墙
-    Door = "door"  # 门
-    DoorLarge = "door-large"  # 大门
-    Duo = "duo"  # 双管
-    Scorch = "scorch"  # 火焰
-    Scatter = "scatter"  # 分裂
-    Hail = "hail"  # 冰雹
-    Lancer = "lancer"  # 蓝瑟
-    Conveyor = "conveyor"  # 传送带
-    TitaniumConveyor = "titanium-conveyor"  # 钛传送带
-    PlastaniumConveyor = "plastanium-conveyor"  # 塑钢传送带
-    ArmoredConveyor = "armored-conveyor"  # 装甲传送带
-    Junction = "junction"  # 交叉器
-    Router = "router"  # 路由器
-    Distributor = "distributor"  # 分配器
-    Sorter = "sorter"  # 分类器
-    InvertedSorter = "inverted-sorter"  # 反向分类器
-    Message = "message"  # 信息板
-    ReinforcedMessage = "reinforced-message"  # 强化信息板
-    WorldMessage = "world-message"  # 世界信息板
-    Illuminator = "illuminator"  # 照明器
-    OverflowGate = "overflow-gate"  # 溢流门
-    UnderflowGate = "underflow-gate"  # 反向溢流门
-    SiliconSmelter = "silicon-smelter"  # 硅冶炼厂
-    PhaseWeaver = "phase-weaver"  # 相织布编织器
-    Pulverizer = "pulverizer"  # 粉碎机
-    CryofluidMixer = "cryofluid-mixer"  # 冷冻液混合器
-    Melter = "melter"  # 熔炉
-    Incinerator = "incinerator"  # 焚化炉
-    SporePress = "spore-press"  # 孢子压缩机
-    Separator = "separator"  # 分离机
-    CoalCentrifuge = "coal-centrifuge"  # 煤炭离心机
-    PowerNode = "power-node"  # 电力节点
-    PowerNodeLarge = "power-node-large"  # 大型电力节点
-    SurgeTower = "surge-tower"  # 巨浪电力塔
-    Diode = "diode"  # 二极管
-    Battery = "battery"  # 电池
-    BatteryLarge = "battery-large"  # 大型电池
-    CombustionGenerator = "combustion-generator"  # 火力发电机
-    SteamGenerator = "steam-generator"  # 涡轮发电机
-    DifferentialGenerator = "differential-generator"  # 温差发电机
-    ImpactReactor = "impact-reactor"  # 冲击反应堆
-    MechanicalDrill = "mechanical-drill"  # 机械钻头
-    PneumaticDrill = "pneumatic-drill"  # 气动钻头
-    LaserDrill = "laser-drill"  # 激光钻头
-    WaterExtractor = "water-extractor"  # 抽水机
-    Cultivator = "cultivator"  # 培养机
-    Conduit = "conduit"  # 导管
-    MechanicalPump = "mechanical-pump"  # 机械泵
-    ItemSource = "item-source"  # 物品源
-    ItemVoid = "item-void"  # 物品黑洞
-    LiquidSource = "liquid-source"  # 液体源
-    LiquidVoid = "liquid-void"  # 液体黑洞
-    PowerVoid = "power-void"  # 电力黑洞
-    PowerSource = "power-source"  # 电力源
-    Unloader = "unloader"  # 装卸器
-    Vault = "vault"  # 仓库
-    Wave = "wave"  # 波浪
-    Tsunami = "tsunami"  # 海啸
-    Swarmer = "swarmer"  # 蜂群
-    Salvo = "salvo"  # 齐射
-    Ripple = "ripple"  # 浪涌
-    PhaseConveyor = "phase-conveyor"  # 相织布传送带桥
-    BridgeConveyor = "bridge-conveyor"  # 传送带桥
-    PlastaniumCompressor = "plastanium-compressor"  # 塑钢压缩机
-    PyratiteMixer = "pyratite-mixer"  # 硫化物混合器
-    BlastMixer = "blast-mixer"  # 爆炸物混合器
-    SolarPanel = "solar-panel"  # 太阳能板
-    SolarPanelLarge = "solar-panel-large"  # 大型太阳能板
-    OilExtractor = "oil-extractor"  # 石油钻井
-    RepairPoint = "repair-point"  # 维修点
-    RepairTurret = "repair-turret"  # 维修塔
-    PulseConduit = "pulse-conduit"  # 脉冲导管
-    PlatedConduit = "plated-conduit"  # 电镀导管
-    PhaseConduit = "phase-conduit"  # 相织布导管桥
-    LiquidRouter = "liquid-router"  # 流体路由器
-    LiquidTank = "liquid-tank"  # 流体储罐
-    LiquidContainer = "liquid-container"  # 流体容器
-    LiquidJunction = "liquid-junction"  # 流体交叉器
-    BridgeConduit = "bridge-conduit"  # 导管桥
-    RotaryPump = "rotary-pump"  # 回转泵
-    ThoriumReactor = "thorium-reactor"  # 钍反应堆
-    MassDriver = "mass-driver"  # 质量驱动器
-    BlastDrill = "blast-drill"  # 爆破钻头
-    ImpulsePump = "impulse-pump"  # 脉冲泵
-    ThermalGenerator = "thermal-generator"  # 热能发电机
-    SurgeSmelter = "surge-smelter"  # 合金冶炼厂
-    Mender = "mender"  # 修理器
-    MendProjector = "mend-projector"  # 修理投影
-    SurgeWall = "surge-wall"  # 合金墙
-    SurgeWallLarge = "surge-wall-large"  # 大型合金墙
-    Cyclone = "cyclone"  # 气旋
-    Fuse = "fuse"  # 雷光
-    ShockMine = "shock-mine"  # 脉冲地雷
-    OverdriveProjector = "overdrive-projector"  # 超速投影
-    ForceProjector = "force-projector"  # 力墙投影
-    Arc = "arc"  # 电弧
-    RtgGenerator = "rtg-generator"  # RTG
-    Spectre = "spectre"  # 幽灵
-    Meltdown = "meltdown"  # 熔毁
-    Foreshadow = "foreshadow"  # 厄兆
-    Container = "container"  # 容器
-    LaunchPad = "launch-pad"  # 发射台
-    Segment = "segment"  # 裂解
-    GroundFactory = "ground-factory"  # 陆军工厂
-    AirFactory = "air-factory"  # 空军工厂
-    NavalFactory = "naval-factory"  # 海军工厂
-    AdditiveReconstructor = "additive-reconstructor"  # 数增级单位重构工厂
-    MultiplicativeReconstructor = "multiplicative-reconstructor"  # 倍乘级单位重构工厂
-    ExponentialReconstructor = "exponential-reconstructor"  # 多幂级单位重构工厂
-    TetrativeReconstructor = "tetrative-reconstructor"  # 无量级单位重构工厂
-    PayloadConveyor = "payload-conveyor"  # 载荷传送带
-    PayloadRouter = "payload-router"  # 载荷路由器
-    Duct = "duct"  # 物品管道
-    DuctRouter = "duct-router"  # 物品管道路由器
-    DuctBridge = "duct-bridge"  # 物品管道桥
-    LargePayloadMassDriver = "large-payload-mass-driver"  # 大型载荷质量驱动器
-    PayloadVoid = "payload-void"  # 载荷黑洞
-    PayloadSource = "payload-source"  # 载荷源
-    Disassembler = "disassembler"  # 解离机
-    SiliconCrucible = "silicon-crucible"  # 热能坩埚
-    OverdriveDome = "overdrive-dome"  # 超速穹顶
-    InterplanetaryAccelerator = "interplanetary-accelerator"  # 行星际加速器
-    Constructor = "constructor"  # 构筑器
-    LargeConstructor = "large-constructor"  # 大型构筑器
-    Deconstructor = "deconstructor"  # 大型解构器
-    PayloadLoader = "payload-loader"  # 载荷装载器
-    PayloadUnloader = "payload-unloader"  # 载荷卸载器
-    HeatSource = "heat-source"  # 热量源
+# catalog enum and the table of ``MindApi.catalog`` it is built from
+_CATALOGS = {
+    "BuildingType": "BUILDINGS",
+    "UnitType": "UNITS",
+    "LiquidType": "LIQUIDS",
+    "ItemType": "ITEMS",
+}
 
-    # 埃里克尔
-    Empty = "empty"  # 空
-    RhyoliteCrater = "rhyolite-crater"  # 流纹岩坑
-    RoughRhyolite = "rough-rhyolite"  # 粗糙流纹岩
-    Regolith = "regolith"  # 流纹岩
-    YellowStone = "yellow-stone"  # 黄石
-    CarbonStone = "carbon-stone"  # 碳石
-    FerricStone = "ferric-stone"  # 铁石
-    FerricCraters = "ferric-craters"  # 铁陨石坑
-    BeryllicStone = "beryllic-stone"  # 铍石
-    CrystallineStone = "crystalline-stone"  # 晶石
-    CrystalFloor = "crystal-floor"  # 晶石地板
-    YellowStonePlates = "yellow-stone-plates"  # 黄石地板
-    RedStone = "red-stone"  # 红石
-    DenseRedStone = "dense-red-stone"  # 高密红石
-    RedIce = "red-ice"  # 红冰
-    ArkyciteFloor = "arkycite-floor"  # 芳油
-    ArkyicStone = "arkyic-stone"  # 芳石
-    RhyoliteVent = "rhyolite-vent"  # 流纹石喷口
-    CarbonVent = "carbon-vent"  # 碳石喷口
-    ArkyicVent = "arkyic-vent"  # 芳石喷口
-    YellowStoneVent = "yellow-stone-vent"  # 黄石喷口
-    RedStoneVent = "red-stone-vent"  # 红石喷口
-    CrystallineVent = "crystalline-vent"  # 晶石喷口
-    Redmat = "redmat"  # 红地垫
-    Bluemat = "bluemat"  # 蓝地垫
-    CoreZone = "core-zone"  # 核心区
-    RegolithWall = "regolith-wall"  # 风化墙
-    YellowStoneWall = "yellow-stone-wall"  # 黄石墙
-    RhyoliteWall = "rhyolite-wall"  # 流纹岩墙
-    CarbonWall = "carbon-wall"  # 碳石墙
-    FerricStoneWall = "ferric-stone-wall"  # 铁石墙
-    BeryllicStoneWall = "beryllic-stone-wall"  # 铍石墙
-    ArkyicWall = "arkyic-wall"  # 芳石墙
-    CrystallineStoneWall = "crystalline-stone-wall"  # 晶石墙
-    RedIceWall = "red-ice-wall"  # 红冰墙
-    RedStoneWall = "red-stone-wall"  # 红石墙
-    RedDiamondWall = "red-diamond-wall"  # 红钻墙
-    Redweed = "redweed"  # 赤藻
-    PurBush = "pur-bush"  # 紫灌木丛
-    Yellowcoral = "yellowcoral"  # 黄珊瑚
-    CarbonBoulder = "carbon-boulder"  # 碳石块
-    FerricBoulder = "ferric-boulder"  # 铁石块
-    BeryllicBoulder = "beryllic-boulder"  # 铍石块
-    YellowStoneBoulder = "yellow-stone-boulder"  # 黄石块
-    ArkyicBoulder = "arkyic-boulder"  # 芳石块
-    CrystalCluster = "crystal-cluster"  # 水晶簇
-    VibrantCrystalCluster = "vibrant-crystal-cluster"  # 鲜艳水晶簇
-    CrystalBlocks = "crystal-blocks"  # 风化晶体
-    CrystalOrbs = "crystal-orbs"  # 晶石球
-    CrystallineBoulder = "crystalline-boulder"  # 晶石块
-    RedIceBoulder = "red-ice-boulder"  # 红冰石块
-    RhyoliteBoulder = "rhyolite-boulder"  # 流纹石块
-    RedStoneBoulder = "red-stone-boulder"  # 红石块
-    GraphiticWall = "graphitic-wall"  # 石墨墙
-    SiliconArcFurnace = "silicon-arc-furnace"  # 电弧硅炉
-    Electrolyzer = "electrolyzer"  # 电解机
-    AtmosphericConcentrator = "atmospheric-concentrator"  # 大气收集器
-    OxidationChamber = "oxidation-chamber"  # 氧化室
-    ElectricHeater = "electric-heater"  # 电制热机
-    SlagHeater = "slag-heater"  # 矿渣制热机
-    PhaseHeater = "phase-heater"  # 相织制热机
-    HeatRedirector = "heat-redirector"  # 热量传输机
-    HeatRouter = "heat-router"  # 热量路由器
-    SlagIncinerator = "slag-incinerator"  # 矿渣焚化炉
-    CarbideCrucible = "carbide-crucible"  # 碳化物坩埚
-    SlagCentrifuge = "slag-centrifuge"  # 矿渣离心机
-    SurgeCrucible = "surge-crucible"  # 合金坩埚
-    CyanogenSynthesizer = "cyanogen-synthesizer"  # 氰合成机
-    PhaseSynthesizer = "phase-synthesizer"  # 相织布合成机
-    HeatReactor = "heat-reactor"  # 热量反应堆
-    BerylliumWall = "beryllium-wall"  # 铍墙
-    BerylliumWallLarge = "beryllium-wall-large"  # 大型铍墙
-    TungstenWall = "tungsten-wall"  # 钨墙
-    TungstenWallLarge = "tungsten-wall-large"  # 大型钨墙
-    BlastDoor = "blast-door"  # 防爆闸门
-    CarbideWall = "carbide-wall"  # 碳化物墙
-    CarbideWallLarge = "carbide-wall-large"  # 大型碳化物墙
-    ReinforcedSurgeWall = "reinforced-surge-wall"  # 强化合金墙
-    ReinforcedSurgeWallLarge = "reinforced-surge-wall-large"  # 大型强化合金墙
-    ShieldedWall = "shielded-wall"  # 盾墙
-    Radar = "radar"  # 雷达
-    BuildTower = "build-tower"  # 建造塔
-    RegenProjector = "regen-projector"  # 再生投影器
-    ShockwaveTower = "shockwave-tower"  # 震爆塔
-    ShieldProjector = "shield-projector"  # 护盾投影器
-    LargeShieldProjector = "large-shield-projector"  # 大型护盾投影器
-    ArmoredDuct = "armored-duct"  # 装甲管道
-    OverflowDuct = "overflow-duct"  # 溢流管道
-    UnderflowDuct = "underflow-duct"  # 反向溢流管
-    DuctUnloader = "duct-unloader"  # 管道装卸器
-    SurgeConveyor = "surge-conveyor"  # 合金传送带
-    SurgeRouter = "surge-router"  # 合金路由器
-    UnitCargoLoader = "unit-cargo-loader"  # 单位物流装载器
-    UnitCargoUnloadPoint = "unit-cargo-unload-point"  # 单位物流卸载点
-    ReinforcedPump = "reinforced-pump"  # 强化泵
-    ReinforcedConduit = "reinforced-conduit"  # 强化导管
-    ReinforcedLiquidJunction = "reinforced-liquid-junction"  # 强化流体交叉器
-    ReinforcedBridgeConduit = "reinforced-bridge-conduit"  # 强化流体带桥
-    ReinforcedLiquidRouter = "reinforced-liquid-router"  # 强化流体路由器
-    ReinforcedLiquidContainer = "reinforced-liquid-container"  # 强化流体容器
-    ReinforcedLiquidTank = "reinforced-liquid-tank"  # 强化流体储罐
-    BeamNode = "beam-node"  # 激光节点
-    BeamTower = "beam-tower"  # 激光塔
-    BeamLink = "beam-link"  # 激光连接器
-    TurbineCondenser = "turbine-condenser"  # 涡轮冷凝器
-    ChemicalCombustionChamber = "chemical-combustion-chamber"  # 化学燃烧室
-    PyrolysisGenerator = "pyrolysis-generator"  # 热解发生器
-    VentCondenser = "vent-condenser"  # 排气冷凝器
-    CliffCrusher = "cliff-crusher"  # 墙壁粉碎机
-    PlasmaBore = "plasma-bore"  # 等离子钻机
-    LargePlasmaBore = "large-plasma-bore"  # 大型等离子钻机
-    ImpactDrill = "impact-drill"  # 冲击钻头
-    EruptionDrill = "eruption-drill"  # 爆裂钻头
-    CoreBastion = "core-bastion"  # 城堡核心
-    CoreCitadel = "core-citadel"  # 堡垒核心
-    CoreAcropolis = "core-acropolis"  # 卫城核心
-    ReinforcedContainer = "reinforced-container"  # 强化容器
-    ReinforcedVault = "reinforced-vault"  # 强化仓库
-    Breach = "breach"  # 撕裂
-    Sublimate = "sublimate"  # 升华
-    Titan = "titan"  # 泰坦
-    Disperse = "disperse"  # 驱离
-    Afflict = "afflict"  # 劫难
-    Lustre = "lustre"  # 光辉
-    Scathe = "scathe"  # 创伤
-    Fabricator = "fabricator"  # 重构厂
-    TankRefabricator = "tank-refabricator"  # 坦克重构厂
-    MechRefabricator = "mech-refabricator"  # 机甲重构厂
-    ShipRefabricator = "ship-refabricator"  # 飞船重构厂
-    TankAssembler = "tank-assembler"  # 坦克组装厂
-    ShipAssembler = "ship-assembler"  # 飞船组装厂
-    MechAssembler = "mech-assembler"  # 机甲组装厂
-    ReinforcedPayloadConveyor = "reinforced-payload-conveyor"  # 强化载荷传送带
-    ReinforcedPayloadRouter = "reinforced-payload-router"  # 强化载荷路由器
-    PayloadMassDriver = "payload-mass-driver"  # 载荷质量驱动器
-    SmallDeconstructor = "small-deconstructor"  # 解构器
-    Canvas = "canvas"  # 画板
-    WorldProcessor = "world-processor"  # 世界处理器
-    WorldCell = "world-cell"  # 世界内存元
-    TankFabricator = "tank-fabricator"  # 坦克制造厂
-    MechFabricator = "mech-fabricator"  # 机甲制造厂
-    ShipFabricator = "ship-fabricator"  # 飞船制造厂
-    PrimeRefabricator = "prime-refabricator"  # 高级再重构工厂
-    UnitRepairTower = "unit-repair-tower"  # 单位维修塔
-    Diffuse = "diffuse"  # 扩散
-    BasicAssemblerModule = "basic-assembler-module"  # 基本装配厂模块
-    Smite = "smite"  # 天谴
-    Malign = "malign"  # 魔灵
-    FluxReactor = "flux-reactor"  # 通量反应堆
-    NeoplasiaReactor = "neoplasia-reactor"  # 瘤变反应堆
 
-    Switch = "switch"  # 开关
-    MicroProcessor = "micro-processor"  # 微型处理器
-    LogicProcessor = "logic-processor"  # 逻辑处理器
-    HyperProcessor = "hyper-processor"  # 超核处理器
-    LogicDisplay = "logic-display"  # 逻辑显示屏
-    LargeLogicDisplay = "large-logic-display"  # 大型逻辑显示屏
-    MemoryCell = "memory-cell"  # 内存元
-    MemoryBank = "memory-bank"  # 内存库
+def __getattr__(name: str) -> Any:
+    if name not in _CATALOGS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from MindApi import catalog
 
+    members = getattr(catalog, _CATALOGS[name])
+    enum = StrEnum(name, members, module=__name__, qualname=name)  # type: ignore
+    globals()[name] = enum  # built once, later lookups do not get here
+    return enum
 
-class UnitType(StrEnum):
-    Dagger = "dagger"  # 尖刀
-    Mace = "mace"  # 战锤
-    Fortress = "fortress"  # 堡垒
-    Nova = "nova"  # 新星
-    Pulsar = "pulsar"  # 恒星
-    Quasar = "quasar"  # 耀星
-    Crawler = "crawler"  # 爬虫
-    Atrax = "atrax"  # 毒蛛
-    Spiroct = "spiroct"  # 血蛭
-    Arkyid = "arkyid"  # 毒蛊
-    Toxopid = "toxopid"  # 天蝎
-    Flare = "flare"  # 星辉
-    Horizon = "horizon"  # 天垠
-    Zenith = "zenith"  # 苍穹
-    Antumbra = "antumbra"  # 月影
-    Eclipse = "eclipse"  # 日蚀
-    Mono = "mono"  # 独影
-    Poly = "poly"  # 幻型
-    Mega = "mega"  # 巨像
-    Quad = "quad"  # 雷霆
-    Oct = "oct"  # 要塞
-    Risso = "risso"  # 梭鱼
-    Minke = "minke"  # 飞鲨
-    Bryde = "bryde"  # 戟鲸
-    Sei = "sei"  # 蛟龙
-    Omura = "omura"  # 海神
-    Retusa = "retusa"  # 潜螺
-    Oxynoe = "oxynoe"  # 电鳗
-    Cyerce = "cyerce"  # 江豚
-    Aegires = "aegires"  # 玄武
-    Navanax = "navanax"  # 龙王
-    Alpha = "alpha"  # 阿尔法
-    Beta = "beta"  # 贝塔
-    Gamma = "gamma"  # 伽马
-    Scepter = "scepter"  # 权杖
-    Reign = "reign"  # 王座
-    Vela = "vela"  # 灾星
-    Corvus = "corvus"  # 死星
 
-    Stell = "stell"  # 围护
-    Locus = "locus"  # 循迹
-    Precept = "precept"  # 准绳
-    Vanquish = "vanquish"  # 征服
-    Conquer = "conquer"  # 领主
-    Merui = "merui"  # 天守
-    Cleroi = "cleroi"  # 天赐
-    Anthicus = "anthicus"  # 天灾
-    Tecta = "tecta"  # 天理
-    Collaris = "collaris"  # 天帝
-    Elude = "elude"  # 挣脱
-    Avert = "avert"  # 遮蔽
-    Obviate = "obviate"  # 消散
-    Quell = "quell"  # 遏止
-    Disrupt = "disrupt"  # 悲怆
-    Evoke = "evoke"  # 苏醒
-    Incite = "incite"  # 策动
-    Emanate = "emanate"  # 发散
-    Manifold = "manifold"  # 货运无人机
-    AssemblyDrone = "assembly-drone"  # 装配无人机
-    Latum = "latum"  # Latum
-    Renale = "renale"  # Renale
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_CATALOGS))
 
 
-class LiquidType(StrEnum):
-    Water = "water"  # 水
-    Slag = "slag"  # 矿渣
-    Oil = "oil"  # 石油
-    Cryofluid = "cryofluid"  # 冷冻液
-    Neoplasm = "neoplasm"  # 瘤液
-    Arkycite = "arkycite"  # 芳油
-    Gallium = "gallium"  # 镓
-    Ozone = "ozone"  # 臭氧
-    Hydrogen = "hydrogen"  # 氢气
-    Nitrogen = "nitrogen"  # 氮气
-    Cyanogen = "cyanogen"  # 氰气
+if TYPE_CHECKING:
+    # the catalog enums as declared to type checkers, in step with the
+    # tables of ``MindApi.catalog`` they are built from at run time
 
+    class BuildingType(StrEnum):
+        Parallax = "parallax"  # 差扰
+        Cliff = "cliff"  # 悬崖
+        SandBoulder = "sand-boulder"  # 砂岩
+        BasaltBoulder = "basalt-boulder"  # 玄武岩石块
+        Grass = "grass"  # 草地
+        MoltenSlag = "molten-slag"  # 矿渣液
+        PooledCryofluid = "pooled-cryofluid"  # 冷冻液
+        Space = "space"  # 太空
+        Salt = "salt"  # 盐碱地
+        SaltWall = "salt-wall"  # 盐墙
+        Pebbles = "pebbles"  # 鹅卵石
+        Tendrils = "tendrils"  # 卷须
+        SandWall = "sand-wall"  # 沙墙
+        SporePine = "spore-pine"  # 孢子树
+        SporeWall = "spore-wall"  # 孢子墙
+        Boulder = "boulder"  # 石块
+        SnowBoulder = "snow-boulder"  # 雪石块
+        SnowPine = "snow-pine"  # 雪树
+        Shale = "shale"  # 页岩地
+        ShaleBoulder = "shale-boulder"  # 页岩石块
+        Moss = "moss"  # 苔藓地
+        Shrubs = "shrubs"  # 灌木丛
+        SporeMoss = "spore-moss"  # 孢子苔藓地
+        ShaleWall = "shale-wall"  # 页岩墙
+        ScrapWall = "scrap-wall"  # 废墙
+        ScrapWallLarge = "scrap-wall-large"  # 大型废墙
+        ScrapWallHuge = "scrap-wall-huge"  # 巨型废墙
+        ScrapWallGigantic = "scrap-wall-gigantic"  # 超巨型废墙
+        Thruster = "thruster"  # 推进器残骸
+        Kiln = "kiln"  # 窑炉
+        GraphitePress = "graphite-press"  # 石墨压缩机
+        MultiPress = "multi-press"  # 多重压缩机
+        Spawn = "spawn"  # 敌人出生点
+        CoreShard = "core-shard"  # 初代核心
+        CoreFoundation = "core-foundation"  # 次代核心
+        CoreNucleus = "core-nucleus"  # 终代核心
+        DeepWater = "deep-water"  # 深水
+        ShallowWater = "shallow-water"  # 水
+        TaintedWater = "tainted-water"  # 污水
+        DeepTaintedWater = "deep-tainted-water"  # 深污水
+        DarksandTaintedWater = "darksand-tainted-water"  # 黑沙污水
+        Tar = "tar"  # 石油
+        Stone = "stone"  # 石头
+        SandFloor = "sand-floor"  # 沙子
+        Darksand = "darksand"  # 黑沙
+        Ice = "ice"  # 冰
+        Snow = "snow"  # 雪
+        CraterStone = "crater-stone"  # 陨石坑
+        SandWater = "sand-water"  # 浅滩
+        DarksandWater = "darksand-water"  # 黑沙浅滩
+        Char = "char"  # 焦土
+        Dacite = "dacite"  # 安山岩
+        Rhyolite = "rhyolite"  # 流纹岩
+        DaciteWall = "dacite-wall"  # 安山岩墙
+        DaciteBoulder = "dacite-boulder"  # 安山石块
+        IceSnow = "ice-snow"  # 冰雪地
+        StoneWall = "stone-wall"  # 石墙
+        IceWall = "ice-wall"  # 冰墙
+        SnowWall = "snow-wall"  # 雪墙
+        DuneWall = "dune-wall"  # 沙丘岩
+        Pine = "pine"  # 松树
+        Dirt = "dirt"  # 泥土
+        DirtWall = "dirt-wall"  # 泥土墙
+        Mud = "mud"  # 泥巴
+        WhiteTreeDead = "white-tree-dead"  # 枯萎的白树
+        WhiteTree = "white-tree"  # 白树
+        SporeCluster = "spore-cluster"  # 孢子簇
+        MetalFloor = "metal-floor"  # 金属地板1
+        MetalFloor2 = "metal-floor-2"  # 金属地板2
+        MetalFloor3 = "metal-floor-3"  # 金属地板3
+        MetalFloor4 = "metal-floor-4"  # 金属地板4
+        MetalFloor5 = "metal-floor-5"  # 金属地板5
+        MetalFloorDamaged = "metal-floor-damaged"  # 损坏的金属地板
+        DarkPanel1 = "dark-panel-1"  # 暗面板1
+        DarkPanel2 = "dark-panel-2"  # 暗面板2
+        DarkPanel3 = "dark-panel-3"  # 暗面板3
+        DarkPanel4 = "dark-panel-4"  # 暗面板4
+        DarkPanel5 = "dark-panel-5"  # 暗面板5
+        DarkPanel6 = "dark-panel-6"  # 暗面板6
+        DarkMetal = "dark-metal"  # 暗金属
+        Basalt = "basalt"  # 玄武岩
+        Hotrock = "hotrock"  # 灼热岩石
+        Magmarock = "magmarock"  # 熔融岩石
+        CopperWall = "copper-wall"  # 铜墙
+        CopperWallLarge = "copper-wall-large"  # 大型铜墙
+        TitaniumWall = "titanium-wall"  # 钛墙
+        TitaniumWallLarge = "titanium-wall-large"  # 大型钛墙
+        PlastaniumWall = "plastanium-wall"  # 塑钢墙
+        PlastaniumWallLarge = "plastanium-wall-large"  # 大型塑钢墙
+        PhaseWall = "phase-wall"  # 相织布墙
+        PhaseWallLarge = "phase-wall-large"  # 大型相织布墙
+        ThoriumWall = "thorium-wall"  # 钍墙
+        ThoriumWallLarge = "thorium-wall-large"  # 大型钍墙
+        Door = "door"  # 门
+        DoorLarge = "door-large"  # 大门
+        Duo = "duo"  # 双管
+        Scorch = "scorch"  # 火焰
+        Scatter = "scatter"  # 分裂
+        Hail = "hail"  # 冰雹
+        Lancer = "lancer"  # 蓝瑟
+        Conveyor = "conveyor"  # 传送带
+        TitaniumConveyor = "titanium-conveyor"  # 钛传送带
+        PlastaniumConveyor = "plastanium-conveyor"  # 塑钢传送带
+        ArmoredConveyor = "armored-conveyor"  # 装甲传送带
+        Junction = "junction"  # 交叉器
+        Router = "router"  # 路由器
+        Distributor = "distributor"  # 分配器
+        Sorter = "sorter"  # 分类器
+        InvertedSorter = "inverted-sorter"  # 反向分类器
+        Message = "message"  # 信息板
+        ReinforcedMessage = "reinforced-message"  # 强化信息板
+        WorldMessage = "world-message"  # 世界信息板
+        Illuminator = "illuminator"  # 照明器
+        OverflowGate = "overflow-gate"  # 溢流门
+        UnderflowGate = "underflow-gate"  # 反向溢流门
+        SiliconSmelter = "silicon-smelter"  # 硅冶炼厂
+        PhaseWeaver = "phase-weaver"  # 相织布编织器
+        Pulverizer = "pulverizer"  # 粉碎机
+        CryofluidMixer = "cryofluid-mixer"  # 冷冻液混合器
+        Melter = "melter"  # 熔炉
+        Incinerator = "incinerator"  # 焚化炉
+        SporePress = "spore-press"  # 孢子压缩机
+        Separator = "separator"  # 分离机
+        CoalCentrifuge = "coal-centrifuge"  # 煤炭离心机
+        PowerNode = "power-node"  # 电力节点
+        PowerNodeLarge = "power-node-large"  # 大型电力节点
+        SurgeTower = "surge-tower"  # 巨浪电力塔
+        Diode = "diode"  # 二极管
+        Battery = "battery"  # 电池
+        BatteryLarge = "battery-large"  # 大型电池
+        CombustionGenerator = "combustion-generator"  # 火力发电机
+        SteamGenerator = "steam-generator"  # 涡轮发电机
+        DifferentialGenerator = "differential-generator"  # 温差发电机
+        ImpactReactor = "impact-reactor"  # 冲击反应堆
+        MechanicalDrill = "mechanical-drill"  # 机械钻头
+        PneumaticDrill = "pneumatic-drill"  # 气动钻头
+        LaserDrill = "laser-drill"  # 激光钻头
+        WaterExtractor = "water-extractor"  # 抽水机
+        Cultivator = "cultivator"  # 培养机
+        Conduit = "conduit"  # 导管
+        MechanicalPump = "mechanical-pump"  # 机械泵
+        ItemSource = "item-source"  # 物品源
+        ItemVoid = "item-void"  # 物品黑洞
+        LiquidSource = "liquid-source"  # 液体源
+        LiquidVoid = "liquid-void"  # 液体黑洞
+        PowerVoid = "power-void"  # 电力黑洞
+        PowerSource = "power-source"  # 电力源
+        Unloader = "unloader"  # 装卸器
+        Vault = "vault"  # 仓库
+        Wave = "wave"  # 波浪
+        Tsunami = "tsunami"  # 海啸
+        Swarmer = "swarmer"  # 蜂群
+        Salvo = "salvo"  # 齐射
+        Ripple = "ripple"  # 浪涌
+        PhaseConveyor = "phase-conveyor"  # 相织布传送带桥
+        BridgeConveyor = "bridge-conveyor"  # 传送带桥
+        PlastaniumCompressor = "plastanium-compressor"  # 塑钢压缩机
+        PyratiteMixer = "pyratite-mixer"  # 硫化物混合器
+        BlastMixer = "blast-mixer"  # 爆炸物混合器
+        SolarPanel = "solar-panel"  # 太阳能板
+        SolarPanelLarge = "solar-panel-large"  # 大型太阳能板
+        OilExtractor = "oil-extractor"  # 石油钻井
+        RepairPoint = "repair-point"  # 维修点
+        RepairTurret = "repair-turret"  # 维修塔
+        PulseConduit = "pulse-conduit"  # 脉冲导管
+        PlatedConduit = "plated-conduit"  # 电镀导管
+        PhaseConduit = "phase-conduit"  # 相织布导管桥
+        LiquidRouter = "liquid-router"  # 流体路由器
+        LiquidTank = "liquid-tank"  # 流体储罐
+        LiquidContainer = "liquid-container"  # 流体容器
+        LiquidJunction = "liquid-junction"  # 流体交叉器
+        BridgeConduit = "bridge-conduit"  # 导管桥
+        RotaryPump = "rotary-pump"  # 回转泵
+        ThoriumReactor = "thorium-reactor"  # 钍反应堆
+        MassDriver = "mass-driver"  # 质量驱动器
+        BlastDrill = "blast-drill"  # 爆破钻头
+        ImpulsePump = "impulse-pump"  # 脉冲泵
+        ThermalGenerator = "thermal-generator"  # 热能发电机
+        SurgeSmelter = "surge-smelter"  # 合金冶炼厂
+        Mender = "mender"  # 修理器
+        MendProjector = "mend-projector"  # 修理投影
+        SurgeWall = "surge-wall"  # 合金墙
+        SurgeWallLarge = "surge-wall-large"  # 大型合金墙
+        Cyclone = "cyclone"  # 气旋
+        Fuse = "fuse"  # 雷光
+        ShockMine = "shock-mine"  # 脉冲地雷
+        OverdriveProjector = "overdrive-projector"  # 超速投影
+        ForceProjector = "force-projector"  # 力墙投影
+        Arc = "arc"  # 电弧
+        RtgGenerator = "rtg-generator"  # RTG
+        Spectre = "spectre"  # 幽灵
+        Meltdown = "meltdown"  # 熔毁
+        Foreshadow = "foreshadow"  # 厄兆
+        Container = "container"  # 容器
+        LaunchPad = "launch-pad"  # 发射台
+        Segment = "segment"  # 裂解
+        GroundFactory = "ground-factory"  # 陆军工厂
+        AirFactory = "air-factory"  # 空军工厂
+        NavalFactory = "naval-factory"  # 海军工厂
+        AdditiveReconstructor = "additive-reconstructor"  # 数增级单位重构工厂
+        MultiplicativeReconstructor = "multiplicative-reconstructor"  # 倍乘级单位重构工厂
+        ExponentialReconstructor = "exponential-reconstructor"  # 多幂级单位重构工厂
+        TetrativeReconstructor = "tetrative-reconstructor"  # 无量级单位重构工厂
+        PayloadConveyor = "payload-conveyor"  # 载荷传送带
+        PayloadRouter = "payload-router"  # 载荷路由器
+        Duct = "duct"  # 物品管道
+        DuctRouter = "duct-router"  # 物品管道路由器
+        DuctBridge = "duct-bridge"  # 物品管道桥
+        LargePayloadMassDriver = "large-payload-mass-driver"  # 大型载荷质量驱动器
+        PayloadVoid = "payload-void"  # 载荷黑洞
+        PayloadSource = "payload-source"  # 载荷源
+        Disassembler = "disassembler"  # 解离机
+        SiliconCrucible = "silicon-crucible"  # 热能坩埚
+        OverdriveDome = "overdrive-dome"  # 超速穹顶
+        InterplanetaryAccelerator = "interplanetary-accelerator"  # 行星际加速器
+        Constructor = "constructor"  # 构筑器
+        LargeConstructor = "large-constructor"  # 大型构筑器
+        Deconstructor = "deconstructor"  # 大型解构器
+        PayloadLoader = "payload-loader"  # 载荷装载器
+        PayloadUnloader = "payload-unloader"  # 载荷卸载器
+        HeatSource = "heat-source"  # 热量源
+        # 埃里克尔
+        Empty = "empty"  # 空
+        RhyoliteCrater = "rhyolite-crater"  # 流纹岩坑
+        RoughRhyolite = "rough-rhyolite"  # 粗糙流纹岩
+        Regolith = "regolith"  # 流纹岩
+        YellowStone = "yellow-stone"  # 黄石
+        CarbonStone = "carbon-stone"  # 碳石
+        FerricStone = "ferric-stone"  # 铁石
+        FerricCraters = "ferric-craters"  # 铁陨石坑
+        BeryllicStone = "beryllic-stone"  # 铍石
+        CrystallineStone = "crystalline-stone"  # 晶石
+        CrystalFloor = "crystal-floor"  # 晶石地板
+        YellowStonePlates = "yellow-stone-plates"  # 黄石地板
+        RedStone = "red-stone"  # 红石
+        DenseRedStone = "dense-red-stone"  # 高密红石
+        RedIce = "red-ice"  # 红冰
+        ArkyciteFloor = "arkycite-floor"  # 芳油
+        ArkyicStone = "arkyic-stone"  # 芳石
+        RhyoliteVent = "rhyolite-vent"  # 流纹石喷口
+        CarbonVent = "carbon-vent"  # 碳石喷口
+        ArkyicVent = "arkyic-vent"  # 芳石喷口
+        YellowStoneVent = "yellow-stone-vent"  # 黄石喷口
+        RedStoneVent = "red-stone-vent"  # 红石喷口
+        CrystallineVent = "crystalline-vent"  # 晶石喷口
+        Redmat = "redmat"  # 红地垫
+        Bluemat = "bluemat"  # 蓝地垫
+        CoreZone = "core-zone"  # 核心区
+        RegolithWall = "regolith-wall"  # 风化墙
+        YellowStoneWall = "yellow-stone-wall"  # 黄石墙
+        RhyoliteWall = "rhyolite-wall"  # 流纹岩墙
+        CarbonWall = "carbon-wall"  # 碳石墙
+        FerricStoneWall = "ferric-stone-wall"  # 铁石墙
+        BeryllicStoneWall = "beryllic-stone-wall"  # 铍石墙
+        ArkyicWall = "arkyic-wall"  # 芳石墙
+        CrystallineStoneWall = "crystalline-stone-wall"  # 晶石墙
+        RedIceWall = "red-ice-wall"  # 红冰墙
+        RedStoneWall = "red-stone-wall"  # 红石墙
+        RedDiamondWall = "red-diamond-wall"  # 红钻墙
+        Redweed = "redweed"  # 赤藻
+        PurBush = "pur-bush"  # 紫灌木丛
+        Yellowcoral = "yellowcoral"  # 黄珊瑚
+        CarbonBoulder = "carbon-boulder"  # 碳石块
+        FerricBoulder = "ferric-boulder"  # 铁石块
+        BeryllicBoulder = "beryllic-boulder"  # 铍石块
+        YellowStoneBoulder = "yellow-stone-boulder"  # 黄石块
+        ArkyicBoulder = "arkyic-boulder"  # 芳石块
+        CrystalCluster = "crystal-cluster"  # 水晶簇
+        VibrantCrystalCluster = "vibrant-crystal-cluster"  # 鲜艳水晶簇
+        CrystalBlocks = "crystal-blocks"  # 风化晶体
+        CrystalOrbs = "crystal-orbs"  # 晶石球
+        CrystallineBoulder = "crystalline-boulder"  # 晶石块
+        RedIceBoulder = "red-ice-boulder"  # 红冰石块
+        RhyoliteBoulder = "rhyolite-boulder"  # 流纹石块
+        RedStoneBoulder = "red-stone-boulder"  # 红石块
+        GraphiticWall = "graphitic-wall"  # 石墨墙
+        SiliconArcFurnace = "silicon-arc-furnace"  # 电弧硅炉
+        Electrolyzer = "electrolyzer"  # 电解机
+        AtmosphericConcentrator = "atmospheric-concentrator"  # 大气收集器
+        OxidationChamber = "oxidation-chamber"  # 氧化室
+        ElectricHeater = "electric-heater"  # 电制热机
+        SlagHeater = "slag-heater"  # 矿渣制热机
+        PhaseHeater = "phase-heater"  # 相织制热机
+        HeatRedirector = "heat-redirector"  # 热量传输机
+        HeatRouter = "heat-router"  # 热量路由器
+        SlagIncinerator = "slag-incinerator"  # 矿渣焚化炉
+        CarbideCrucible = "carbide-crucible"  # 碳化物坩埚
+        SlagCentrifuge = "slag-centrifuge"  # 矿渣离心机
+        SurgeCrucible = "surge-crucible"  # 合金坩埚
+        CyanogenSynthesizer = "cyanogen-synthesizer"  # 氰合成机
+        PhaseSynthesizer = "phase-synthesizer"  # 相织布合成机
+        HeatReactor = "heat-reactor"  # 热量反应堆
+        BerylliumWall = "beryllium-wall"  # 铍墙
+        BerylliumWallLarge = "beryllium-wall-large"  # 大型铍墙
+        TungstenWall = "tungsten-wall"  # 钨墙
+        TungstenWallLarge = "tungsten-wall-large"  # 大型钨墙
+        BlastDoor = "blast-door"  # 防爆闸门
+        CarbideWall = "carbide-wall"  # 碳化物墙
+        CarbideWallLarge = "carbide-wall-large"  # 大型碳化物墙
+        ReinforcedSurgeWall = "reinforced-surge-wall"  # 强化合金墙
+        ReinforcedSurgeWallLarge = "reinforced-surge-wall-large"  # 大型强化合金墙
+        ShieldedWall = "shielded-wall"  # 盾墙
+        Radar = "radar"  # 雷达
+        BuildTower = "build-tower"  # 建造塔
+        RegenProjector = "regen-projector"  # 再生投影器
+        ShockwaveTower = "shockwave-tower"  # 震爆塔
+        ShieldProjector = "shield-projector"  # 护盾投影器
+        LargeShieldProjector = "large-shield-projector"  # 大型护盾投影器
+        ArmoredDuct = "armored-duct"  # 装甲管道
+        OverflowDuct = "overflow-duct"  # 溢流管道
+        UnderflowDuct = "underflow-duct"  # 反向溢流管
+        DuctUnloader = "duct-unloader"  # 管道装卸器
+        SurgeConveyor = "surge-conveyor"  # 合金传送带
+        SurgeRouter = "surge-router"  # 合金路由器
+        UnitCargoLoader = "unit-cargo-loader"  # 单位物流装载器
+        UnitCargoUnloadPoint = "unit-cargo-unload-point"  # 单位物流卸载点
+        ReinforcedPump = "reinforced-pump"  # 强化泵
+        ReinforcedConduit = "reinforced-conduit"  # 强化导管
+        ReinforcedLiquidJunction = "reinforced-liquid-junction"  # 强化流体交叉器
+        ReinforcedBridgeConduit = "reinforced-bridge-conduit"  # 强化流体带桥
+        ReinforcedLiquidRouter = "reinforced-liquid-router"  # 强化流体路由器
+        ReinforcedLiquidContainer = "reinforced-liquid-container"  # 强化流体容器
+        ReinforcedLiquidTank = "reinforced-liquid-tank"  # 强化流体储罐
+        BeamNode = "beam-node"  # 激光节点
+        BeamTower = "beam-tower"  # 激光塔
+        BeamLink = "beam-link"  # 激光连接器
+        TurbineCondenser = "turbine-condenser"  # 涡轮冷凝器
+        ChemicalCombustionChamber = "chemical-combustion-chamber"  # 化学燃烧室
+        PyrolysisGenerator = "pyrolysis-generator"  # 热解发生器
+        VentCondenser = "vent-condenser"  # 排气冷凝器
+        CliffCrusher = "cliff-crusher"  # 墙壁粉碎机
+        PlasmaBore = "plasma-bore"  # 等离子钻机
+        LargePlasmaBore = "large-plasma-bore"  # 大型等离子钻机
+        ImpactDrill = "impact-drill"  # 冲击钻头
+        EruptionDrill = "eruption-drill"  # 爆裂钻头
+        CoreBastion = "core-bastion"  # 城堡核心
+        CoreCitadel = "core-citadel"  # 堡垒核心
+        CoreAcropolis = "core-acropolis"  # 卫城核心
+        ReinforcedContainer = "reinforced-container"  # 强化容器
+        ReinforcedVault = "reinforced-vault"  # 强化仓库
+        Breach = "breach"  # 撕裂
+        Sublimate = "sublimate"  # 升华
+        Titan = "titan"  # 泰坦
+        Disperse = "disperse"  # 驱离
+        Afflict = "afflict"  # 劫难
+        Lustre = "lustre"  # 光辉
+        Scathe = "scathe"  # 创伤
+        Fabricator = "fabricator"  # 重构厂
+        TankRefabricator = "tank-refabricator"  # 坦克重构厂
+        MechRefabricator = "mech-refabricator"  # 机甲重构厂
+        ShipRefabricator = "ship-refabricator"  # 飞船重构厂
+        TankAssembler = "tank-assembler"  # 坦克组装厂
+        ShipAssembler = "ship-assembler"  # 飞船组装厂
+        MechAssembler = "mech-assembler"  # 机甲组装厂
+        ReinforcedPayloadConveyor = "reinforced-payload-conveyor"  # 强化载荷传送带
+        ReinforcedPayloadRouter = "reinforced-payload-router"  # 强化载荷路由器
+        PayloadMassDriver = "payload-mass-driver"  # 载荷质量驱动器
+        SmallDeconstructor = "small-deconstructor"  # 解构器
+        Canvas = "canvas"  # 画板
+        WorldProcessor = "world-processor"  # 世界处理器
+        WorldCell = "world-cell"  # 世界内存元
+        TankFabricator = "tank-fabricator"  # 坦克制造厂
+        MechFabricator = "mech-fabricator"  # 机甲制造厂
+        ShipFabricator = "ship-fabricator"  # 飞船制造厂
+        PrimeRefabricator = "prime-refabricator"  # 高级再重构工厂
+        UnitRepairTower = "unit-repair-tower"  # 单位维修塔
+        Diffuse = "diffuse"  # 扩散
+        BasicAssemblerModule = "basic-assembler-module"  # 基本装配厂模块
+        Smite = "smite"  # 天谴
+        Malign = "malign"  # 魔灵
+        FluxReactor = "flux-reactor"  # 通量反应堆
+        NeoplasiaReactor = "neoplasia-reactor"  # 瘤变反应堆
+        Switch = "switch"  # 开关
+        MicroProcessor = "micro-processor"  # 微型处理器
+        LogicProcessor = "logic-processor"  # 逻辑处理器
+        HyperProcessor = "hyper-processor"  # 超核处理器
+        LogicDisplay = "logic-display"  # 逻辑显示屏
+        LargeLogicDisplay = "large-logic-display"  # 大型逻辑显示屏
+        MemoryCell = "memory-cell"  # 内存元
+        MemoryBank = "memory-bank"  # 内存库
 
-class ItemType(StrEnum):
-    Copper = "copper"  # 铜
-    Lead = "lead"  # 铅
-    Coal = "coal"  # 煤炭
-    Graphite = "graphite"  # 石墨
-    Titanium = "titanium"  # 钛
-    Thorium = "thorium"  # 钍
-    Silicon = "silicon"  # 硅
-    Plastanium = "plastanium"  # 塑钢
-    PhaseFabric = "phase-fabric"  # 相织布
-    SurgeAlloy = "surge-alloy"  # 巨浪合金
-    SporePod = "spore-pod"  # 孢子荚
-    Sand = "sand"  # 沙
-    BlastCompound = "blast-compound"  # 爆炸混合物
-    Pyratite = "pyratite"  # 硫化物
-    Metaglass = "metaglass"  # 钢化玻璃
-    Scrap = "scrap"  # 废料
-    FissileMatter = "fissile-matter"  # 裂变产物
-    Beryllium = "beryllium"  # 铍
-    Tungsten = "tungsten"  # 钨
-    Oxide = "oxide"  # 氧化物
-    Carbide = "carbide"  # 碳化物
-    DormantCyst = "dormant-cyst"  # 休眠囊肿
+    class UnitType(StrEnum):
+        Dagger = "dagger"  # 尖刀
+        Mace = "mace"  # 战锤
+        Fortress = "fortress"  # 堡垒
+        Nova = "nova"  # 新星
+        Pulsar = "pulsar"  # 恒星
+        Quasar = "quasar"  # 耀星
+        Crawler = "crawler"  # 爬虫
+        Atrax = "atrax"  # 毒蛛
+        Spiroct = "spiroct"  # 血蛭
+        Arkyid = "arkyid"  # 毒蛊
+        Toxopid = "toxopid"  # 天蝎
+        Flare = "flare"  # 星辉
+        Horizon = "horizon"  # 天垠
+        Zenith = "zenith"  # 苍穹
+        Antumbra = "antumbra"  # 月影
+        Eclipse = "eclipse"  # 日蚀
+        Mono = "mono"  # 独影
+        Poly = "poly"  # 幻型
+        Mega = "mega"  # 巨像
+        Quad = "quad"  # 雷霆
+        Oct = "oct"  # 要塞
+        Risso = "risso"  # 梭鱼
+        Minke = "minke"  # 飞鲨
+        Bryde = "bryde"  # 戟鲸
+        Sei = "sei"  # 蛟龙
+        Omura = "omura"  # 海神
+        Retusa = "retusa"  # 潜螺
+        Oxynoe = "oxynoe"  # 电鳗
+        Cyerce = "cyerce"  # 江豚
+        Aegires = "aegires"  # 玄武
+        Navanax = "navanax"  # 龙王
+        Alpha = "alpha"  # 阿尔法
+        Beta = "beta"  # 贝塔
+        Gamma = "gamma"  # 伽马
+        Scepter = "scepter"  # 权杖
+        Reign = "reign"  # 王座
+        Vela = "vela"  # 灾星
+        Corvus = "corvus"  # 死星
+        Stell = "stell"  # 围护
+        Locus = "locus"  # 循迹
+        Precept = "precept"  # 准绳
+        Vanquish = "vanquish"  # 征服
+        Conquer = "conquer"  # 领主
+        Merui = "merui"  # 天守
+        Cleroi = "cleroi"  # 天赐
+        Anthicus = "anthicus"  # 天灾
+        Tecta = "tecta"  # 天理
+        Collaris = "collaris"  # 天帝
+        Elude = "elude"  # 挣脱
+        Avert = "avert"  # 遮蔽
+        Obviate = "obviate"  # 消散
+        Quell = "quell"  # 遏止
+        Disrupt = "disrupt"  # 悲怆
+        Evoke = "evoke"  # 苏醒
+        Incite = "incite"  # 策动
+        Emanate = "emanate"  # 发散
+        Manifold = "manifold"  # 货运无人机
+        AssemblyDrone = "assembly-drone"  # 装配无人机
+        Latum = "latum"  # Latum
+        Renale = "renale"  # Renale
+
+    class LiquidType(StrEnum):
+        Water = "water"  # 水
+        Slag = "slag"  # 矿渣
+        Oil = "oil"  # 石油
+        Cryofluid = "cryofluid"  # 冷冻液
+        Neoplasm = "neoplasm"  # 瘤液
+        Arkycite = "arkycite"  # 芳油
+        Gallium = "gallium"  # 镓
+        Ozone = "ozone"  # 臭氧
+        Hydrogen = "hydrogen"  # 氢气
+        Nitrogen = "nitrogen"  # 氮气
+        Cyanogen = "cyanogen"  # 氰气
+
+    class ItemType(StrEnum):
+        Copper = "copper"  # 铜
+        Lead = "lead"  # 铅
+        Coal = "coal"  # 煤炭
+        Graphite = "graphite"  # 石墨
+        Titanium = "titanium"  # 钛
+        Thorium = "thorium"  # 钍
+        Silicon = "silicon"  # 硅
+        Plastanium = "plastanium"  # 塑钢
+        PhaseFabric = "phase-fabric"  # 相织布
+        SurgeAlloy = "surge-alloy"  # 巨浪合金
+        SporePod = "spore-pod"  # 孢子荚
+        Sand = "sand"  # 沙
+        BlastCompound = "blast-compound"  # 爆炸混合物
+        Pyratite = "pyratite"  # 硫化物
+        Metaglass = "metaglass"  # 钢化玻璃
+        Scrap = "scrap"  # 废料
+        FissileMatter = "fissile-matter"  # 裂变产物
+        Beryllium = "beryllium"  # 铍
+        Tungsten = "tungsten"  # 钨
+        Oxide = "oxide"  # 氧化物
+        Carbide = "carbide"  # 碳化物
+        DormantCyst = "dormant-cyst"  # 休眠囊肿
 
 
 class MetaType(StrEnum):
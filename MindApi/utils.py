@@ -16,6 +16,10 @@ binary_ops = {
 condition_ops_inverse = {
     "Eq": "notEqual",
     "NotEq": "equal",
+    "Lt": "greaterThanEq",
+    "LtE": "greaterThan",
+    "Gt": "lessThanEq",
+    "GtE": "lessThan",
 }
 
 condition_ops = {
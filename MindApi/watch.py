@@ -0,0 +1,191 @@
+"""
+Watch mode: rebuild the processor classes of packages or files whenever
+their source changes. Only the methods whose code changed, and the ones
+depending on them, are converted again, the rest is linked as it was.
+"""
+import contextlib
+import importlib
+import importlib.util
+import inspect
+import os
+import sys
+import time
+import traceback
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from MindApi.build import Target, discover, is_processor, output_name
+from MindApi.builtin import MetaInstruction
+from MindApi.core import STACK, MethodCache, _compile, signature
+from MindApi.mlog import dump
+from MindApi.passes import DEFAULT_OPT_LEVEL
+
+
+def signatures(cls) -> Dict[str, Tuple[str, int]]:
+    """
+    Code and first line of every method of ``cls``
+    """
+    result = {}
+    for name in dir(cls):
+        value = getattr(cls, name)
+        if inspect.isfunction(value):
+            try:
+                result[name] = signature(value)
+            except (OSError, TypeError):
+                continue
+    return result
+
+
+class Recompiler:
+    """
+    Compiles the successive versions of a processor class, converting
+    again only the methods whose code changed since the last one.
+    ``converted`` holds the methods the last compilation converted.
+    """
+
+    def __init__(self, opt_level: int = DEFAULT_OPT_LEVEL, stack: str = STACK):
+        self.opt_level = opt_level
+        self.stack = stack
+        self.methods: Optional[MethodCache] = None
+        self.signatures: Dict[str, Tuple[str, int]] = {}
+        self.converted: set = set()
+
+    def compile(self, cls) -> List[MetaInstruction]:
+        current = signatures(cls)
+        if self.methods is None:
+            self.methods = MethodCache(cls)
+            stale = set(self.methods.graph)
+        else:
+            names = set(current) | set(self.signatures)
+            changed = {
+                name
+                for name in names
+                if current.get(name, ("",))[0] != self.signatures.get(name, ("",))[0]
+            }
+            moved = {
+                name: current[name][1] - self.signatures[name][1]
+                for name in names - changed
+                if current[name][1] != self.signatures[name][1]
+            }
+            stale = self.methods.update(cls, changed, moved)
+        self.signatures = current
+        self.converted = stale & set(self.methods.graph)
+        instructions, _ = _compile(
+            cls, self.opt_level, self.stack, False, None, self.methods
+        )
+        return instructions
+
+
+class Watcher:
+    """
+    Keeps ``output`` up to date with the processor classes of ``sources``.
+    ``poll`` rebuilds the classes of the modules saved since the last
+    call, ``run`` polls until interrupted.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[str],
+        output: str,
+        opt_level: int = DEFAULT_OPT_LEVEL,
+        file: Optional[TextIO] = None,
+    ):
+        self.output = output
+        self.opt_level = opt_level
+        self.file = file
+        os.makedirs(output, exist_ok=True)
+        targets, _, errors = discover(sources)
+        for name, error in errors.items():
+            self.report(f"{name}: import failed\n{error}")
+        self.recompilers: Dict[Target, Recompiler] = {}
+        self.stamps: Dict[str, Tuple[int, int]] = {}
+        for target in targets:
+            self.recompilers[target] = Recompiler(opt_level)
+            self.stamps.setdefault(target[0], self.stamp(target[0]))
+
+    def report(self, message: str):
+        print(message, file=sys.stderr if self.file is None else self.file)
+
+    @staticmethod
+    def stamp(module: str) -> Tuple[int, int]:
+        path = getattr(sys.modules[module], "__file__", None)
+        try:
+            stat = os.stat(path)  # type: ignore
+        except (OSError, TypeError):
+            return 0, 0
+        return stat.st_mtime_ns, stat.st_size
+
+    def build(self, target: Target) -> dict:
+        """
+        Compile ``target`` again and write its mlog
+        """
+        result: dict = {"module": target[0], "class": target[1], "error": None}
+        start = time.perf_counter()
+        try:
+            cls = getattr(sys.modules[target[0]], target[1])
+            recompiler = self.recompilers[target]
+            instructions = recompiler.compile(cls)
+            result["output"] = os.path.join(self.output, output_name(target))
+            with open(result["output"], "w") as file:
+                dump(instructions, file)
+            result["instructions"] = len(instructions)
+            result["converted"] = sorted(recompiler.converted)
+        except Exception:
+            result["error"] = traceback.format_exc()
+        result["seconds"] = time.perf_counter() - start
+        name = f"{target[0]}.{target[1]}"
+        if result["error"] is not None:
+            self.report(f"{name}: failed\n{result['error']}")
+        else:
+            self.report(
+                f"{name}: {result['instructions']} instructions in"
+                f" {result['seconds'] * 1000:.1f} ms,"
+                f" converted {', '.join(result['converted']) or 'nothing'}"
+            )
+        return result
+
+    def build_all(self) -> List[dict]:
+        return [self.build(target) for target in self.recompilers]
+
+    def poll(self) -> List[dict]:
+        """
+        Reload the modules saved since the last poll and rebuild their
+        classes, new ones included
+        """
+        results = []
+        for module, stamp in list(self.stamps.items()):
+            current = self.stamp(module)
+            if current == stamp:
+                continue
+            self.stamps[module] = current
+            path = getattr(sys.modules[module], "__file__", None) or ""
+            if path.endswith(".py"):
+                # the bytecode of a save in the same second as the last one
+                # would still pass for up to date
+                with contextlib.suppress(OSError):
+                    os.unlink(importlib.util.cache_from_source(path))
+            try:
+                reloaded = importlib.reload(sys.modules[module])
+            except Exception:
+                self.report(f"{module}: import failed\n{traceback.format_exc()}")
+                continue
+            for qualname, value in vars(reloaded).items():
+                target = (module, qualname)
+                if is_processor(value) and value.__module__ == module:
+                    self.recompilers.setdefault(target, Recompiler(self.opt_level))
+            for target in list(self.recompilers):
+                if target[0] != module:
+                    continue
+                if not hasattr(reloaded, target[1]):
+                    del self.recompilers[target]  # removed from the module
+                    continue
+                results.append(self.build(target))
+        return results
+
+    def run(self, interval: float = 0.1, stop: Callable[[], bool] = lambda: False):
+        """
+        Build everything, then poll every ``interval`` seconds until ``stop``
+        """
+        self.build_all()
+        while not stop():
+            time.sleep(interval)
+            self.poll()
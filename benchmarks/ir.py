@@ -0,0 +1,129 @@
+"""
+Instruction benchmark: memory held by a large program and how fast it is
+turned into mlog, for the slotted instructions against the same classes
+with a ``__dict__``, and for ``dumps`` against a line per ``str``.
+
+    python benchmarks/ir.py [--instructions N] [--runs N]
+"""
+import argparse
+import copy
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from MindApi import compiler, dumps  # noqa: E402
+from MindApi.builtin import LOCATION, MetaInstruction  # noqa: E402
+
+
+class Program:
+    def mix(self, a, b):
+        a = a * 31
+        a = a + b
+        return a % 1024
+
+    def draw(self, x):
+        if x > 512:
+            print(x)
+        else:
+            print(self.low)
+
+    def init(self):
+        self.seed = 7
+        self.low = 0
+
+    def loop(self):
+        i = 0
+        while i < 16:
+            self.seed = self.mix(self.seed, i)
+            self.draw(self.seed)
+            i += 1
+        if self.seed < self.low:
+            self.low = self.seed
+
+
+def program(size: int) -> List[MetaInstruction]:
+    """
+    ``size`` instructions, copies of the compiled ``Program`` one after
+    the other, as a program unrolled and inlined at length would be
+    """
+    body = compiler(Program)
+    return [copy.copy(body[i % len(body)]) for i in range(size)]
+
+
+def unslotted(instructions: List[MetaInstruction]) -> List[MetaInstruction]:
+    """
+    The same instructions as instances of subclasses holding a ``__dict__``
+    """
+    classes: Dict[type, type] = {}
+    result = []
+    for inst in instructions:
+        cls = type(inst)
+        if cls not in classes:
+            classes[cls] = type(cls.__name__, (cls,), {})
+        new = object.__new__(classes[cls])
+        for name in cls.fields + LOCATION:
+            setattr(new, name, getattr(inst, name))
+        result.append(new)
+    return result
+
+
+def allocated(build: Callable[[], List[MetaInstruction]]) -> float:
+    """
+    Bytes allocated per instruction by ``build``
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        instructions = build()
+        return (tracemalloc.get_traced_memory()[0] - before) / len(instructions)
+    finally:
+        tracemalloc.stop()
+
+
+def throughput(serialize: Callable[[], str], count: int, runs: int) -> float:
+    """
+    Median instructions serialized per second
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        serialize()
+        times.append(time.perf_counter() - start)
+    return count / statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--instructions", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    slotted = program(args.instructions)
+    plain = unslotted(slotted)
+    # the operands are shared by both, only the instructions are counted
+    memory = {
+        "slots": allocated(lambda: [copy.copy(inst) for inst in slotted]),
+        "__dict__": allocated(lambda: [copy.copy(inst) for inst in plain]),
+    }
+    speed = {
+        "dumps, slots": throughput(lambda: dumps(slotted), len(slotted), args.runs),
+        "dumps, __dict__": throughput(lambda: dumps(plain), len(plain), args.runs),
+        "str per line": throughput(
+            lambda: "".join(f"{inst}\n" for inst in slotted), len(slotted), args.runs
+        ),
+    }
+    print(f"{len(slotted)} instructions")
+    for name, size in memory.items():
+        print(f"  {name:<16} {size:8.1f} bytes per instruction")
+    for name, rate in speed.items():
+        print(f"  {name:<16} {rate / 1e6:8.2f} M instructions/s")
+
+
+if __name__ == "__main__":
+    main()
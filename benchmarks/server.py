@@ -0,0 +1,106 @@
+"""
+Compile server benchmark: requests per second and latency of a server
+started with ``python -m MindApi serve``, for the same source sent again
+and for a new version of it every time.
+
+    python benchmarks/server.py [--clients N] [--requests N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from MindApi.client import Client  # noqa: E402
+
+SOURCE = """
+class Sorter:
+    def scale(self, a):
+        return a * {factor}
+
+    def report(self, a):
+        print(a)
+        print(self.low)
+        print(self.high)
+        print(self.count)
+
+    def init(self):
+        self.count = 0
+
+    def loop(self):
+        value = self.scale(self.count)
+        if value > 10:
+            self.report(value)
+        else:
+            self.report(self.count)
+        self.count += 1
+"""
+
+
+def run(path: str, clients: int, requests: int, source: Callable[[int], str]):
+    """
+    Send ``requests`` requests from each of ``clients`` connections at once,
+    return the wall time and the latency of every request
+    """
+    latencies: List[float] = []
+
+    def work(client_index: int):
+        with Client(path) as client:
+            for index in range(requests):
+                start = time.perf_counter()
+                client.compile(source(client_index * requests + index), "Sorter")
+                latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "compile.sock")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "MindApi", "serve", "--socket", path],
+            cwd=ROOT,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+            cases = {
+                "same source": lambda index: SOURCE.format(factor=2),
+                "new version": lambda index: SOURCE.format(factor=index + 3),
+            }
+            for name, source in cases.items():
+                run(path, 1, 5, source)  # warm up
+                seconds, latencies = run(path, args.clients, args.requests, source)
+                latencies.sort()
+                print(
+                    f"{name:<12}{len(latencies) / seconds:>10.0f} requests/s"
+                    f"  p50 {statistics.median(latencies) * 1000:.2f} ms"
+                    f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms"
+                )
+        finally:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
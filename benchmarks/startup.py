@@ -0,0 +1,72 @@
+"""
+Startup benchmark: time ``import MindApi`` and a first compile in fresh
+interpreters, less the time the interpreter alone takes to start.
+
+    python benchmarks/startup.py [--runs N] [--limit MS]
+
+With ``--limit`` it fails when the median import takes longer than that.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT = "import MindApi"
+COMPILE = """
+import MindApi
+
+class Program:
+    def init(self):
+        self.x = 1
+
+    def loop(self):
+        print(self.x)
+
+MindApi.compiler(Program)
+"""
+
+
+def measure(code: str, runs: int) -> float:
+    """
+    Median milliseconds a fresh interpreter takes to run ``code``
+    """
+    # run from a file, the compiler reads the source of the methods
+    with tempfile.NamedTemporaryFile("w", suffix=".py") as script:
+        script.write(code)
+        script.flush()
+        environment = dict(os.environ, PYTHONPATH=ROOT)
+        times = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, script.name], env=environment, check=True)
+            times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--limit", type=float, help="largest median import, in ms")
+    args = parser.parse_args(argv)
+
+    measure("pass", 2)  # warm the file cache and the bytecode
+    measure(COMPILE, 2)
+    baseline = measure("pass", args.runs)
+    imported = measure(IMPORT, args.runs) - baseline
+    compiled = measure(COMPILE, args.runs) - baseline
+    print(f"interpreter      {baseline:8.1f} ms")
+    print(f"import MindApi   {imported:8.1f} ms")
+    print(f"+ first compile  {compiled:8.1f} ms")
+    if args.limit is not None and imported > args.limit:
+        print(f"import takes longer than {args.limit} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Operation, Print, Stop, Wait
+from MindApi.emulator import MemoryCell, Processor
+from MindApi.types import OperationType
+
+from .test_emulator import Factorial, States
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+if numpy is not None:
+    from MindApi.batch import BatchProcessor, sweep
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestBatchProcessor(unittest.TestCase):
+    def test_matches_emulator(self):
+        instructions = compiler(Factorial)
+        batch = sweep(instructions, {"__p": range(8)}, ticks=40, links=[MemoryCell()])
+        for p in range(8):
+            processor = Processor(instructions, links=[MemoryCell()])
+            processor.variables["__p"] = p
+            processor.run(40)
+            self.assertEqual(batch.text[p], processor.text_buffer)
+            self.assertEqual(batch.executed[p], processor.executed)
+
+    def test_operations(self):
+        values = [-7.5, -1, 0, 0.5, 3, 1e20, None]
+        ops = ["Add", "Sub", "Mult", "Div", "FloorDiv", "Mod", "Pow", "LShift"]
+        ops += [OperationType.Max, OperationType.Angle, OperationType.Eq]
+        ops += [OperationType.StrictEq, OperationType.BitNot, OperationType.Sqrt]
+        for op in ops:
+            with self.subTest(op=op):
+                program = [Operation("r", "a", op, "b"), Stop()]
+                pairs = [(a, b) for a in values for b in values]
+                batch = BatchProcessor(program, len(pairs))
+                batch["a"] = [numpy.nan if a is None else a for a, _ in pairs]
+                batch["b"] = [numpy.nan if b is None else b for _, b in pairs]
+                batch.run(1)
+                for i, (a, b) in enumerate(pairs):
+                    processor = Processor(program)
+                    processor.variables.update(a=a, b=b)
+                    processor.run(1)
+                    expected = processor["r"]
+                    if expected is None:
+                        self.assertTrue(numpy.isnan(batch["r"][i]), (a, b))
+                    else:
+                        self.assertAlmostEqual(batch["r"][i], expected, msg=(a, b))
+
+    def test_divergent_branches(self):
+        program = [
+            Jump("x", "Gt", 0, 3, reverse=False),
+            Print("negative"),
+            Stop(),
+            Wait(0.1),
+            Print("positive"),
+            Stop(),
+        ]
+        batch = sweep(program, {"x": [-1, 1, -1]}, ticks=20)
+        self.assertEqual(batch.text, ["negative", "positive", "negative"])
+        # waiting takes ticks, not instructions
+        self.assertEqual(list(batch.executed), [3, 10, 3])
+        self.assertTrue(batch.stopped.all())
+
+    def test_jump_table(self):
+        batch = BatchProcessor(compiler(States), 2)
+        batch["__state"] = [0, 2]
+        batch.run(20)
+        self.assertTrue(batch.text[0].startswith("abcd??"))
+        self.assertTrue(batch.text[1].startswith("cd??"))
@@ -0,0 +1,118 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import textwrap
+import unittest
+
+from MindApi.build import MANIFEST, build, discover
+from MindApi.cli import main
+
+PACKAGE = {
+    "__init__.py": "",
+    "alpha/__init__.py": "raise RuntimeError('broken package')\n",
+    "alpha/inner.py": "",
+    "blink.py": """
+        class Blink:
+            def init(self):
+                self.on = 0
+
+            def loop(self):
+                self.on = 1 - self.on
+                print(self.on)
+
+
+        class Helper:
+            pass
+        """,
+    "broken.py": """
+        from mindapi_build_fixture.blink import Blink
+
+
+        class Broken:
+            def loop(self):
+                self.x = [1, 2]
+        """,
+    "sub/__init__.py": "",
+    "sub/counter.py": """
+        class Counter:
+            def loop(self):
+                self.n += 1
+        """,
+    "sub/missing.py": "import mindapi_no_such_module\n",
+}
+
+
+class TestBuild(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.package = os.path.join(cls.directory.name, "mindapi_build_fixture")
+        for name, source in PACKAGE.items():
+            path = os.path.join(cls.package, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as file:
+                file.write(textwrap.dedent(source))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_discover(self):
+        targets, roots, errors = discover([self.package])
+        self.assertEqual(
+            sorted(targets),
+            [
+                ("mindapi_build_fixture.blink", "Blink"),
+                ("mindapi_build_fixture.broken", "Broken"),
+                ("mindapi_build_fixture.sub.counter", "Counter"),
+            ],
+        )
+        self.assertEqual(roots, [self.directory.name])
+        # a package that fails to import does not stop the others
+        self.assertEqual(
+            sorted(errors),
+            ["mindapi_build_fixture.alpha", "mindapi_build_fixture.sub.missing"],
+        )
+        self.assertIn("broken package", errors["mindapi_build_fixture.alpha"])
+
+    def check(self, manifest: dict, output: str):
+        self.assertEqual((manifest["built"], manifest["failed"]), (2, 3))
+        results = {result["class"]: result for result in manifest["classes"]}
+        self.assertIn("NotImplementedError", results["Broken"]["error"])
+        blink = results["Blink"]
+        self.assertIsNone(blink["error"])
+        with open(blink["output"]) as file:
+            self.assertEqual(len(file.read().splitlines()), blink["instructions"])
+        self.assertEqual(
+            os.path.basename(blink["output"]), "mindapi_build_fixture.blink.Blink.mlog"
+        )
+        with open(os.path.join(output, MANIFEST)) as file:
+            self.assertEqual(json.load(file)["classes"], manifest["classes"])
+
+    def test_build(self):
+        for jobs in (1, 2):
+            with self.subTest(jobs=jobs), tempfile.TemporaryDirectory() as output:
+                self.check(build([self.package], output, jobs), output)
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as output:
+            errors = io.StringIO()
+            with contextlib.redirect_stderr(errors):
+                status = main(["build", self.package, "-o", output, "-j", "2"])
+            self.assertEqual(status, 1)
+            self.assertIn("built 2, failed 3", errors.getvalue())
+            with open(os.path.join(output, MANIFEST)) as file:
+                self.check(json.load(file), output)
+
+    def test_cli_jobs(self):
+        for jobs in ("0", "-2", "many"):
+            with self.subTest(jobs=jobs), contextlib.redirect_stderr(io.StringIO()):
+                with self.assertRaises(SystemExit) as exit:
+                    main(["build", self.package, "-j", jobs])
+                self.assertEqual(exit.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import copy
+import pickle
+import unittest
+
+from MindApi.builtin import LOCATION, Jump, Set, Stop, UnitLocate
+
+
+class TestInstructions(unittest.TestCase):
+    def test_slots(self):
+        inst = Set("a", 1)
+        self.assertFalse(hasattr(inst, "__dict__"))
+        with self.assertRaises(AttributeError):
+            inst.other = 1
+        with self.assertRaises(AttributeError):
+            inst.other
+        self.assertEqual(Set.fields, ("dest", "src"))
+        self.assertEqual(Stop.fields, ())
+        self.assertEqual(
+            UnitLocate.fields,
+            ("outX", "outY", "Found", "building", "find", "group", "enemy"),
+        )
+
+    def test_location(self):
+        inst = Jump("a", "Lt", "b", 3)
+        self.assertEqual([getattr(inst, name) for name in LOCATION], [None] * 3)
+        inst.method, inst.line = "loop", 4
+        for copied in (copy.copy(inst), pickle.loads(pickle.dumps(inst))):
+            with self.subTest(copied=copied):
+                self.assertEqual(str(copied), str(inst))
+                self.assertEqual((copied.method, copied.line), ("loop", 4))
+                self.assertIsNone(copied.column)
+
+
+if __name__ == "__main__":
+    unittest.main()
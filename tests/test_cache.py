@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+
+from MindApi import compiler, inline
+from MindApi.builtin import Jump, Label, Print
+from MindApi.core import MethodCache, clone, convert, isolate
+from MindApi.emulator import Processor
+
+
+class Shared:
+    def big(self, a):
+        print(a)
+        print(self.x)
+        print(self.y)
+        print(self.z)
+        print(self.w)
+
+    @inline
+    def twice(self, a):
+        if a > 1:
+            print(a)
+        print(a)
+
+    def init(self):
+        pass
+
+    def loop(self):
+        self.big(self.p)
+        self.big(self.q)
+        self.big(self.p)
+        self.twice(self.p)
+        self.twice(self.q)
+
+
+class TestMethodCache(unittest.TestCase):
+    def test_methods_converted_once(self):
+        calls = []
+
+        def counting(fn):
+            calls.append(fn.__name__)
+            return isolate(fn)
+
+        with mock.patch("MindApi.core.isolate", counting):
+            compiler(Shared, opt_level=2)
+        self.assertEqual(sorted(calls), ["big", "twice"])
+
+    def test_cache_keeps_conversions(self):
+        cache = MethodCache(Shared)
+        convert(Shared.loop, Shared, True, cache)
+        self.assertEqual(set(cache.converted), {"big", "twice"})
+        self.assertEqual(cache.inlined, {"big": False, "twice": True})
+        self.assertEqual(cache.graph["loop"], ["big"] * 3 + ["twice"] * 2)
+        self.assertIs(cache.source("loop"), cache.source("loop"))
+
+    def test_inlined_copies_are_independent(self):
+        nulls = "null" * 4
+        expected = f"2{nulls}0{nulls}2{nulls}220"
+        for opt_level in (0, 2):
+            processor = Processor(compiler(Shared, opt_level=opt_level))
+            processor.variables.update({"__p": 2, "__q": 0})
+            processor.run(20)
+            self.assertTrue(processor.text_buffer.startswith(expected))
+
+    def test_clone(self):
+        end, exit, other = Label("end"), Label("return"), Label("other")
+        body = [Jump("a", "Eq", 1, end), Print("a"), end, Jump.always(exit)]
+        body.append(Jump.always(other))
+        copied = clone(body, {exit: Label("return")})
+        self.assertIsNot(copied[2], end)
+        self.assertIs(copied[0].to, copied[2])
+        self.assertIsNot(copied[3].to, exit)
+        self.assertIs(copied[4].to, other)
+        self.assertIs(body[0].to, end)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import importlib.util
+import os
+import pickle
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from MindApi import CompileCache, compiler
+from MindApi.cache import SUFFIX, cache_key
+from MindApi.pgo import Profile
+
+
+class Program:
+    def double(self, a):
+        return a * 2
+
+    def init(self):
+        self.x = 1
+
+    def loop(self):
+        y = self.double(self.x)
+        print(y)
+
+
+class Changed(Program):
+    def double(self, a):
+        return a * 3
+
+
+class TestCompileCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = CompileCache(self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_hit(self):
+        expected = list(map(str, compiler(Program)))
+        first = compiler(Program, cache=self.cache)
+        with mock.patch("MindApi.core._compile") as compile:
+            second = compiler(Program, cache=self.cache)
+        compile.assert_not_called()
+        self.assertEqual(list(map(str, first)), expected)
+        self.assertEqual(list(map(str, second)), expected)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key(self):
+        key = cache_key(Program, {"opt_level": 2})
+        self.assertEqual(key, cache_key(Program, {"opt_level": 2}))
+        self.assertNotEqual(key, cache_key(Program, {"opt_level": 1}))
+        # an inherited method changed
+        self.assertNotEqual(key, cache_key(Changed, {"opt_level": 2}))
+
+    def load(self, source: str):
+        path = os.path.join(self.directory.name, "mindapi_moved.py")
+        with open(path, "w") as file:
+            file.write(textwrap.dedent(source))
+        spec = importlib.util.spec_from_file_location("mindapi_moved", path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.Moved
+
+    def test_moved(self):
+        source = """
+            class Moved:
+                def loop(self):
+                    x = self.y + 1
+                    print(x)
+            """
+        first = compiler(self.load(source), cache=self.cache)
+        # the same code further down the file
+        moved = self.load("\n" * 5 + source)
+        expected = compiler(moved)
+        second = compiler(moved, cache=self.cache)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual([i.line for i in second], [i.line for i in expected])
+        self.assertNotEqual([i.line for i in second], [i.line for i in first])
+
+    def test_options(self):
+        compiler(Program, opt_level=0, cache=self.cache)
+        compiler(Program, opt_level=2, cache=self.cache)
+        compiler(Program, cache=self.cache, profile=Profile(iterations=1))
+        self.assertEqual(self.cache.misses, 3)
+        instructions, cost = compiler(Program, report=True, cache=self.cache)
+        self.assertIsNotNone(cost)
+        _, cached = compiler(Program, report=True, cache=self.cache)
+        self.assertEqual(str(cached), str(cost))
+
+    def test_unreadable_entry(self):
+        expected = list(map(str, compiler(Program)))
+        contents = [
+            b"garbage",
+            b"cmindapi_no_such_module\nThing\n.",  # ModuleNotFoundError
+            pickle.dumps(42),
+            pickle.dumps(([1, 2], None)),
+        ]
+        for content in contents:
+            with self.subTest(content=content):
+                compiler(Program, cache=self.cache)
+                (_, _, path), *_ = self.cache.entries()
+                with open(path, "wb") as file:
+                    file.write(content)
+                misses = self.cache.misses
+                compiled = compiler(Program, cache=self.cache)
+                self.assertEqual(list(map(str, compiled)), expected)
+                self.assertEqual(self.cache.misses, misses + 1)
+
+    def test_lru_eviction(self):
+        for index, key in enumerate("abc"):
+            self.cache.put(key, ([], None))
+            os.utime(self.cache.path(key), (index, index))
+        os.utime(self.cache.path("a"), (10, 10))  # used last
+        self.cache.max_size = 2 * os.path.getsize(self.cache.path("a"))
+        self.cache.evict()
+        names = sorted(os.listdir(self.directory.name))
+        self.assertEqual(names, ["a" + SUFFIX, "c" + SUFFIX])
+        self.assertLessEqual(self.cache.size, self.cache.max_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.analysis import relative_return, return_addresses, successors
+from MindApi.builtin import Jump, Operation, Print, Read, Set, Write
+from MindApi.emulator import MemoryCell, Processor
+
+from .test_emulator import Factorial
+
+
+class Nested:
+    def inner(self, a):
+        print(a)
+
+    def outer(self, a):
+        self.inner(a)
+        self.inner(self.b)
+        print(a)
+
+    def init(self):
+        pass
+
+    def loop(self):
+        self.outer(self.p)
+        self.outer(self.q)
+
+
+class Walk:
+    def walk(self, n):
+        i = 0
+        total = 0
+        while i < 2:
+            if n > 0:
+                m = n - 1
+                r = self.walk(m)
+                total = total + r
+            i += 1
+        total = total + 1
+        return total
+
+    def init(self):
+        pass
+
+    def loop(self):
+        x = self.walk(self.p)
+        print(x)
+
+
+class TestCallingConvention(unittest.TestCase):
+    def test_returns(self):
+        for opt_level in (0, 2):
+            instructions = compiler(Nested, opt_level=opt_level)
+            self.assertFalse(
+                any(isinstance(i, Jump) and isinstance(i.to, str) for i in instructions)
+            )
+        returns = {
+            i.src
+            for i in compiler(Nested, opt_level=0)
+            if isinstance(i, Set) and i.dest == "@counter"
+        }
+        # nested calls do not share the return register
+        self.assertEqual(returns, {"__jumpback_inner", "__jumpback_outer"})
+
+    def test_relative_return_addresses(self):
+        instructions = compiler(Nested, opt_level=0)
+        calls = [
+            i for i in range(len(instructions)) if relative_return(instructions, i)
+        ]
+        self.assertEqual(len(calls), 4)
+        for i in calls:
+            # the call jump sits between the return address and the return point
+            self.assertEqual(relative_return(instructions, i), i + 2)
+            self.assertIsInstance(instructions[i + 1], Jump)
+
+    def test_no_stack_without_recursion(self):
+        instructions = compiler(Nested)
+        self.assertFalse(any(isinstance(i, (Read, Write)) for i in instructions))
+
+    def test_recursion_spills(self):
+        instructions = compiler(Factorial, stack="bank1")
+        saved = [i.src for i in instructions if isinstance(i, Write)]
+        self.assertEqual(saved[0], "__jumpback_fact")
+        self.assertIn("__fact__n", saved)
+        # the argument is only read before the recursive call
+        self.assertNotIn("__fact__m", saved)
+        # the result is assigned as soon as the call returns
+        self.assertNotIn("__fact__r", saved)
+        self.assertTrue(
+            all(i.dest == "bank1" for i in instructions if isinstance(i, Write))
+        )
+        restored = [i.dest for i in instructions if isinstance(i, Read)]
+        self.assertIn("__jumpback_fact", restored)
+
+    def test_loop_spills(self):
+        for opt_level in (0, 2):
+            with self.subTest(opt_level=opt_level):
+                instructions = compiler(Walk, opt_level=opt_level)
+                saved = {i.src for i in instructions if isinstance(i, Write)}
+                # read again by the next iteration, unlike m and r
+                self.assertEqual(
+                    saved,
+                    {"__jumpback_walk", "__walk__i", "__walk__n", "__walk__total"},
+                )
+                processor = Processor(instructions, links=[MemoryCell()])
+                processor.variables["__p"] = 2
+                processor.run_until(lambda p: p.text_buffer, max_ticks=400)
+                self.assertEqual(processor.text_buffer, "7")
+
+    def test_return_successors(self):
+        instructions = [
+            Operation("__jumpback_f", "@counter", "Add", 1),
+            Jump.always(3),
+            Jump.always(0),
+            Print("a", True),
+            Set("@counter", "__jumpback_f"),
+        ]
+        returns = return_addresses(instructions)
+        self.assertEqual(returns, {"__jumpback_f": [2]})
+        self.assertEqual(successors(instructions, 4, returns), [2])
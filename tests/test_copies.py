@@ -0,0 +1,89 @@
+import unittest
+
+from MindApi import compiler, optimization_report
+from MindApi.builtin import Jump, Operation, Print, Set
+from MindApi.passes import coalesce_variables, propagate_copies
+
+
+class Arguments:
+    def add(self, a, b):
+        return a + b
+
+    def init(self):
+        pass
+
+    def loop(self):
+        x = self.p
+        y = x
+        self.r = self.add(y, self.q)
+        print(self.r)
+
+
+class TestCopyPropagation(unittest.TestCase):
+    def test_across_blocks(self):
+        instructions = propagate_copies(
+            [
+                Set("a", "x"),
+                Jump("y", "Eq", 1, 3),
+                Set("y", 2),
+                Print("a", True),
+                Jump.always(0),
+            ]
+        )
+        self.assertEqual(str(instructions[3]), "print x")
+
+    def test_killed_on_one_path(self):
+        instructions = propagate_copies(
+            [
+                Set("a", "x"),
+                Jump("y", "Eq", 1, 3),
+                Set("x", 2),
+                Print("a", True),
+                Jump.always(0),
+            ]
+        )
+        self.assertEqual(str(instructions[3]), "print a")
+
+    def test_constants(self):
+        instructions = propagate_copies(
+            [Set("a", 3), Jump("y", "Eq", 1, 2), Operation("b", "a", "Add", "y")]
+        )
+        self.assertEqual(str(instructions[2]), "op b 3 add y")
+
+
+class TestCoalescing(unittest.TestCase):
+    def test_non_interfering(self):
+        instructions = coalesce_variables(
+            [Operation("t", "x", "Add", 1), Set("y", "t"), Print("y", True)]
+        )
+        self.assertEqual(
+            [str(i) for i in instructions], ["op t x add 1", "set t t", "print t"]
+        )
+
+    def test_interfering(self):
+        instructions = coalesce_variables(
+            [
+                Set("y", "t"),
+                Operation("t", "t", "Add", 1),
+                Print("y", True),
+                Print("t", True),
+            ]
+        )
+        self.assertEqual(str(instructions[0]), "set y t")
+
+
+class TestCompiledCopies(unittest.TestCase):
+    def test_no_argument_copies(self):
+        for inst in compiler(Arguments):
+            self.assertFalse(
+                isinstance(inst, Set)
+                and isinstance(inst.src, str)
+                and inst.src.startswith("__")
+                and inst.dest.startswith("__add")
+            )
+
+    def test_report(self):
+        report = optimization_report(Arguments)
+        self.assertEqual(set(report), {"loop", "add"})
+        before, after = report["loop"]
+        self.assertLess(after, before)
@@ -0,0 +1,78 @@
+import unittest
+
+from MindApi import BudgetExceeded, compiler
+from MindApi.builtin import End, Print
+from MindApi.cost import CostModel
+from MindApi.emulator import Processor
+from MindApi.types import BuildingType
+
+from .test_convention import Factorial
+from .test_emulator import States
+from .test_inline import Helpers
+
+
+class Branchy:
+    def init(self):
+        pass
+
+    def loop(self):
+        if self.p > 0:
+            print(self.a)
+            print(self.b)
+            print(self.c)
+        else:
+            print(self.d)
+
+
+class TestCost(unittest.TestCase):
+    def test_straight_line(self):
+        for opt_level in (0, 2):
+            instructions, report = compiler(Helpers, opt_level=opt_level, report=True)
+            init, _ = report.paths["init"]
+            loop, typical = report.paths["loop"]
+            self.assertEqual(loop, typical)
+            # the emulator agrees on the instructions run per iteration
+            processor = Processor(instructions)
+            for _ in range(init + 2 * loop):
+                processor.step()
+            entry = [i for i in instructions if i.method == "loop"][-1].to
+            self.assertEqual(processor.counter, entry)
+
+    def test_exits(self):
+        model = CostModel([Print("a"), Print("b"), Print("c"), End()])
+        self.assertEqual(model.path(0, {2}), (2, 2.0))
+        self.assertEqual(model.path(0), (4, 4.0))
+
+    def test_sizes(self):
+        for cls in (Helpers, States, Factorial):
+            instructions, report = compiler(cls, report=True)
+            self.assertEqual(sum(report.instructions.values()), len(instructions))
+
+    def test_branches(self):
+        _, report = compiler(Branchy, report=True)
+        self.assertGreater(report.worst, report.typical)
+        _, report = compiler(States, report=True)
+        self.assertGreater(report.worst, report.typical)
+
+    def test_calls(self):
+        _, report = compiler(Factorial, opt_level=0, report=True)
+        # the recursive call costs only the call itself
+        self.assertGreater(report.paths["loop"][0], report.paths["fact"][0])
+        self.assertIn("fact", str(report))
+
+    def test_ticks(self):
+        _, report = compiler(Helpers, report=True)
+        micro = report.ticks(BuildingType.MicroProcessor)
+        hyper = report.ticks(BuildingType.HyperProcessor)
+        self.assertAlmostEqual(micro, report.worst / 2)
+        self.assertAlmostEqual(hyper, report.worst / 25)
+
+    def test_budget(self):
+        _, report = compiler(Helpers, report=True)
+        compiler(Helpers, budget=report.ticks())
+        with self.assertRaises(BudgetExceeded):
+            compiler(Helpers, budget=report.ticks() - 0.1)
+        with self.assertRaises(ValueError):
+            compiler(
+                Helpers, budget=report.ticks(), processor=BuildingType.MicroProcessor
+            )
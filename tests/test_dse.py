@@ -0,0 +1,66 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Operation, Print, Set, UnitControl, Write
+from MindApi.passes import eliminate_dead_stores
+
+
+class Overwrites:
+    def init(self):
+        b = self.x
+        b = self.y + 1
+        b = self.z
+        print(b)
+
+    def loop(self):
+        self.fn()
+
+    def fn(self):
+        print(self.x)
+
+
+class TestDeadStores(unittest.TestCase):
+    def listing(self, instructions):
+        return [str(i) for i in eliminate_dead_stores(instructions)]
+
+    def test_overwritten(self):
+        self.assertEqual(
+            self.listing(
+                [Set("a", "x"), Set("a", "y"), Print("a", True), Jump.always(2)]
+            ),
+            ["set a y", "print a", "jump 1 1 equal 1"],
+        )
+
+    def test_live_across_restart(self):
+        # "a" is read at the top of the program after it restarts
+        instructions = [Print("a", True), Operation("a", "a", "Add", 1)]
+        self.assertEqual(len(self.listing(instructions)), 2)
+
+    def test_live_on_one_branch(self):
+        instructions = [
+            Set("a", "x"),
+            Jump("y", "Eq", 1, 3),
+            Print("a", True),
+            Set("a", 0),
+            Jump.always(3),
+        ]
+        self.assertEqual(self.listing(instructions)[0], "set a x")
+
+    def test_side_effects_kept(self):
+        instructions = [
+            Write("v", "cell1", 0),
+            UnitControl("move", "x", "y"),
+            Set("v", 1),
+            Jump.always(0),
+        ]
+        self.assertEqual(
+            self.listing(instructions)[:2],
+            ["write v cell1 0", "ucontrol move x y 0 0 0"],
+        )
+
+    def test_compiled(self):
+        instructions = [str(i) for i in compiler(Overwrites)]
+        self.assertNotIn("set b __x", instructions)
+        self.assertNotIn("op b __y add 1", instructions)
+        self.assertFalse(any("__remove" in i for i in instructions))
+        self.assertFalse(any("__return" in i for i in instructions))
@@ -0,0 +1,177 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import (
+    Draw,
+    DrawFlush,
+    End,
+    GetLink,
+    Jump,
+    Operation,
+    Print,
+    PrintFlush,
+    Read,
+    Set,
+    Stop,
+    Wait,
+    Write,
+)
+from MindApi.emulator import Display, MemoryCell, Message, Processor
+from MindApi.types import BuildingType, OperationType
+
+from .test_ir import processor_classes
+
+
+class Factorial:
+    def fact(self, n):
+        if n <= 1:
+            return 1
+        m = n - 1
+        r = self.fact(m)
+        r = r * n
+        return r
+
+    def init(self):
+        pass
+
+    def loop(self):
+        x = self.fact(self.p)
+        print(x)
+
+
+class States:
+    def init(self):
+        pass
+
+    def loop(self):
+        s = self.state
+        if s == 0:
+            print("a")
+        elif s == 1:
+            print("b")
+        elif s == 2:
+            print("c")
+        elif s == 3:
+            print("d")
+        else:
+            print("?")
+        self.state = s + 1
+
+
+class TestInstructions(unittest.TestCase):
+    def run_program(self, instructions, ticks=1, **kwargs):
+        processor = Processor(instructions, **kwargs)
+        processor.run(ticks)
+        return processor
+
+    def test_operations(self):
+        processor = self.run_program(
+            [
+                Set("a", 7),
+                Operation("b", "a", "FloorDiv", 2),
+                Operation("c", "a", OperationType.Sqrt, 0),
+                Operation("d", "a", "Div", 0),
+                Operation("e", "missing", "Add", 1),
+                Stop(),
+            ]
+        )
+        self.assertEqual(processor["b"], 3)
+        self.assertAlmostEqual(processor["c"], 7**0.5)
+        self.assertIsNone(processor["d"])  # division by zero gives null
+        self.assertEqual(processor["e"], 1)
+        self.assertTrue(processor.stopped)
+
+    def test_counter(self):
+        processor = self.run_program(
+            [
+                Operation("r", "@counter", "Add", 2),  # 0: r = 3
+                Set("@counter", "r"),  # 1
+                Print("skipped"),  # 2
+                Print("r", True),  # 3
+                Stop(),
+            ],
+            ipt=5,
+        )
+        self.assertEqual(processor.text_buffer, "3")
+
+    def test_jump(self):
+        processor = self.run_program(
+            [
+                Jump("x", "Eq", "null", 2, reverse=False),
+                Print("not taken"),
+                Print("taken"),
+                Stop(),
+            ]
+        )
+        self.assertEqual(processor.text_buffer, "taken")
+
+    def test_io(self):
+        cell, display, message = MemoryCell(), Display(), Message()
+        processor = self.run_program(
+            [
+                Write(1.5, "cell1", 3),
+                Read("v", "cell1", 3),
+                Print("v", True),
+                PrintFlush("message1"),
+                Draw("clear", "0", "0", "0"),
+                Draw("rect", "1", "2", "3", "4"),
+                DrawFlush("display1"),
+                GetLink("link", 1),
+                Stop(),
+            ],
+            ipt=10,
+            links=[cell, display, message],
+        )
+        self.assertEqual(cell.memory[3], 1.5)
+        self.assertEqual(message.text, "1.5")
+        self.assertEqual(display.commands, [("clear", 0, 0, 0), ("rect", 1, 2, 3, 4)])
+        self.assertIs(processor["link"], display)
+
+    def test_instructions_per_tick(self):
+        program = [Operation("i", "i", "Add", 1)]
+        for kind, ipt in (
+            (BuildingType.MicroProcessor, 2),
+            (BuildingType.LogicProcessor, 8),
+            (BuildingType.HyperProcessor, 25),
+        ):
+            processor = self.run_program(program, ticks=3, kind=kind)
+            self.assertEqual(processor.executed, 3 * ipt)
+            self.assertEqual(processor["i"], 3 * ipt)
+            self.assertEqual(processor.ticks, 3)
+
+    def test_wait(self):
+        processor = Processor([Wait(0.5), Print("x"), End()])
+        ticks = processor.run_until(lambda p: p.text_buffer, max_ticks=100)
+        self.assertEqual(ticks, 31)
+
+    def test_end(self):
+        processor = self.run_program([Print("x"), End(), Print("y")], ipt=4)
+        self.assertEqual(processor.text_buffer, "xx")
+        self.assertEqual(processor.counts, [2, 2, 0])
+
+
+class TestCompiledPrograms(unittest.TestCase):
+    def test_recursion(self):
+        for opt_level in (0, 2):
+            processor = Processor(
+                compiler(Factorial, opt_level=opt_level), links=[MemoryCell()]
+            )
+            processor.variables["__p"] = 5
+            processor.run_until(lambda p: p.text_buffer, max_ticks=100)
+            self.assertEqual(processor.text_buffer, "120")
+
+    def test_jump_table(self):
+        processor = Processor(compiler(States))
+        processor.run(20)
+        self.assertTrue(processor.text_buffer.startswith("abcd???"))
+
+    def test_optimizations_keep_output(self):
+        for cls in list(processor_classes()) + [States]:
+            with self.subTest(cls=cls.__name__):
+                outputs = []
+                for opt_level in (0, 2):
+                    processor = Processor(compiler(cls, opt_level=opt_level))
+                    processor.run(50)
+                    outputs.append(processor.text_buffer)
+                size = min(map(len, outputs))
+                self.assertEqual(outputs[0][:size], outputs[1][:size])
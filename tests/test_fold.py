@@ -0,0 +1,80 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Operation, Print, Set
+from MindApi.passes import fold_constants
+from MindApi.semantics import fold
+from MindApi.types import OperationType
+
+
+class Literals:
+    def init(self):
+        b = 1 + 2
+        b = 2 * 3
+        b = 1 < 2
+        print(b)
+
+    def loop(self):
+        self.a += 1
+
+
+class TestFoldSemantics(unittest.TestCase):
+    def test_arithmetic(self):
+        self.assertEqual(fold("Add", 1, 1), 2)
+        self.assertEqual(fold("Div", 2, 2), 1)
+        self.assertEqual(fold("FloorDiv", -3, 2), -2)
+        self.assertEqual(fold("Mod", -3, 2), -1)
+        self.assertEqual(fold("Pow", 2, 10), 1024)
+        self.assertEqual(fold("LShift", 2, 2), 8)
+        self.assertEqual(fold(OperationType.BitNot, 5, "__unused"), -6)
+
+    def test_comparison(self):
+        self.assertEqual(fold("Lt", 1, 2), 1)
+        self.assertEqual(fold("Eq", 1, 1.0000001), 1)
+        self.assertEqual(fold(OperationType.StrictEq, 1, 1.0000001), 0)
+        self.assertEqual(fold(OperationType.And, 1, 0), 0)
+
+    def test_degrees(self):
+        self.assertAlmostEqual(fold(OperationType.Sin, 90, "__unused"), 1)
+        self.assertAlmostEqual(fold(OperationType.Atan, 1, "__unused"), 45)
+
+    def test_not_foldable(self):
+        self.assertIsNone(fold("Add", "a", 1))
+        self.assertIsNone(fold("Div", 1, 0))
+        self.assertIsNone(fold(OperationType.Sqrt, -1, "__unused"))
+        self.assertIsNone(fold(OperationType.Random, 1, "__unused"))
+        self.assertIsNone(fold(OperationType.Angle, 1, 1))
+
+
+class TestFoldConstants(unittest.TestCase):
+    def test_propagation(self):
+        instructions = fold_constants(
+            [
+                Set("a", 2),
+                Operation("b", "a", "Mult", 3),
+                Operation("c", "b", "Add", "x"),
+                Print("b", True),
+            ]
+        )
+        self.assertEqual(
+            [str(i) for i in instructions],
+            ["set a 2", "set b 6", "op c 6 add x", "print 6"],
+        )
+
+    def test_jump_target_resets(self):
+        instructions = fold_constants(
+            [
+                Set("a", 2),
+                Operation("a", "a", "Add", 1),
+                Jump("1", "Eq", "1", 1),
+            ]
+        )
+        self.assertEqual(str(instructions[1]), "op a a add 1")
+
+    def test_no_literal_operations(self):
+        for inst in compiler(Literals):
+            if isinstance(inst, Operation):
+                self.assertFalse(
+                    isinstance(inst.left, (int, float))
+                    and isinstance(inst.right, (int, float))
+                )
@@ -0,0 +1,108 @@
+import unittest
+
+from MindApi import compiler, inline, noinline
+from MindApi.builtin import Set
+from MindApi.core import call_graph, recursive_methods
+
+
+class Helpers:
+    def once(self, a):
+        b = a * 2
+        print(b)
+        print(a)
+        print(self.x)
+        print(self.y)
+
+    def tiny(self, a):
+        return a + 1
+
+    def big(self, a):
+        print(a)
+        print(self.x)
+        print(self.y)
+        print(self.z)
+        print(self.w)
+
+    def init(self):
+        self.once(self.p)
+
+    def loop(self):
+        r = self.tiny(self.p)
+        print(r)
+        r = self.tiny(self.q)
+        print(r)
+        self.big(self.p)
+        self.big(self.q)
+
+
+class Forced:
+    @inline
+    def big(self, a):
+        print(a)
+        print(self.x)
+        print(self.y)
+        print(self.z)
+        print(self.w)
+
+    @noinline
+    def tiny(self, a):
+        print(a)
+
+    def init(self):
+        pass
+
+    def loop(self):
+        self.big(self.p)
+        self.big(self.q)
+        self.tiny(self.p)
+
+
+class Recursive:
+    def countdown(self, n):
+        if n > 0:
+            self.countdown(n)
+
+    def init(self):
+        pass
+
+    def loop(self):
+        self.countdown(self.p)
+
+
+class TestInline(unittest.TestCase):
+    def test_heuristic(self):
+        instructions = compiler(Helpers)
+        methods = {
+            i.method
+            for i in instructions
+            if isinstance(i, Set) and i.dest == "@counter"
+        }
+        # only the big method called twice keeps its own copy
+        self.assertEqual(methods, {"big"})
+        listing = [str(i).split(" ", 2)[2] for i in instructions if i.method == "tiny"]
+        self.assertEqual(listing, ["__p add 1", "__q add 1"])
+
+    def test_decorators(self):
+        instructions = compiler(Forced)
+        methods = {
+            i.method
+            for i in instructions
+            if isinstance(i, Set) and i.dest == "@counter"
+        }
+        self.assertEqual(methods, {"tiny"})
+
+    def test_not_inlined_without_optimization(self):
+        instructions = compiler(Helpers, opt_level=0)
+        methods = {
+            i.method
+            for i in instructions
+            if isinstance(i, Set) and i.dest == "@counter"
+        }
+        self.assertEqual(methods, {"once", "tiny", "big"})
+
+    def test_recursion(self):
+        graph = call_graph(Recursive)
+        self.assertEqual(graph["loop"], ["countdown"])
+        self.assertEqual(recursive_methods(graph), {"countdown"})
+        instructions = compiler(Recursive)
+        self.assertTrue(any(i.method == "countdown" for i in instructions))
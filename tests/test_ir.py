@@ -0,0 +1,92 @@
+import inspect
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Operation, Print, Set
+from MindApi.ir import ControlFlowGraph
+
+from . import test_call, test_if, test_math, test_while
+
+
+def processor_classes():
+    for module in (test_call, test_if, test_math, test_while):
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                yield cls
+
+
+class TestControlFlowGraph(unittest.TestCase):
+    def test_round_trip(self):
+        for cls in processor_classes():
+            for opt_level in (0, 2):
+                with self.subTest(cls=cls.__name__, opt_level=opt_level):
+                    instructions = compiler(cls, opt_level=opt_level)
+                    expected = [str(i) for i in instructions]
+                    lowered = ControlFlowGraph(instructions).lower()
+                    self.assertEqual([str(i) for i in lowered], expected)
+
+    def diamond(self):
+        return ControlFlowGraph(
+            [
+                Jump("a", "Eq", 1, 3),  # 0: if a == 1
+                Set("b", 1),  # 1
+                Jump.always(4),  # 2
+                Set("b", 2),  # 3: else
+                Print("b", True),  # 4
+            ]
+        )
+
+    def test_edges(self):
+        cfg = self.diamond()
+        first, then, orelse, join = cfg.blocks
+        self.assertEqual(first.successors, [then, orelse])
+        self.assertEqual(join.predecessors, [then, orelse])
+        self.assertIs(then.fallthrough, None)
+        self.assertIs(orelse.fallthrough, join)
+        # the end of the program restarts it
+        self.assertEqual(join.successors, [first])
+
+    def test_dominators(self):
+        cfg = self.diamond()
+        first, then, orelse, join = cfg.blocks
+        idom = cfg.dominators()
+        self.assertIs(idom[join], first)
+        self.assertTrue(cfg.dominates(first, then, idom))
+        self.assertFalse(cfg.dominates(then, join, idom))
+
+    def test_liveness(self):
+        cfg = self.diamond()
+        cfg.liveness()
+        first, then, orelse, join = cfg.blocks
+        self.assertEqual(first.live_in, {"a"})
+        self.assertEqual(then.live_out, {"a", "b"})
+        self.assertEqual(join.live_after(), [{"a"}])
+
+    def test_relayout(self):
+        cfg = self.diamond()
+        first, then, orelse, join = cfg.blocks
+        lowered = cfg.lower([first, orelse, join, then])
+        self.assertEqual(
+            [str(i) for i in lowered],
+            [
+                "jump 2 a notEqual 1",
+                "jump 5 1 equal 1",  # the first block no longer falls into then
+                "set b 2",
+                "print b",
+                "jump 0 1 equal 1",
+                "set b 1",
+                "jump 3 1 equal 1",
+            ],
+        )
+
+    def test_loop_back_edge(self):
+        cfg = ControlFlowGraph(
+            [
+                Set("i", 0),
+                Operation("i", "i", "Add", 1),
+                Jump("i", "GtE", 10, 1),
+            ]
+        )
+        entry, body = cfg.blocks
+        self.assertIn(body, body.successors)
+        self.assertIs(cfg.dominators()[body], entry)
@@ -0,0 +1,86 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Print, Set
+from MindApi.passes import thread_jumps
+
+
+class NestedLoops:
+    def init(self):
+        pass
+
+    def loop(self):
+        while self.a < 10:
+            self.a += 1
+            while self.b < 10:
+                self.b += 1
+                if self.b == 5:
+                    break
+        print(self.a)
+
+
+class TestThreadJumps(unittest.TestCase):
+    def listing(self, instructions):
+        return [str(i) for i in thread_jumps(instructions)]
+
+    def test_chain(self):
+        self.assertEqual(
+            self.listing(
+                [
+                    Jump("a", "Eq", 1, 2),
+                    Print("a", True),
+                    Jump.always(3),
+                    Jump.always(4),
+                    Print("b", True),
+                ]
+            ),
+            ["jump 3 a notEqual 1", "print a", "jump 3 1 equal 1", "print b"],
+        )
+
+    def test_constant_conditions(self):
+        self.assertEqual(
+            self.listing(
+                [
+                    Jump("1", "Eq", "1", 2),  # never taken
+                    Jump("0", "Eq", "1", 3),  # always taken
+                    Print("a", True),
+                    Print("b", True),
+                ]
+            ),
+            ["jump 1 1 equal 1", "print b"],
+        )
+
+    def test_inverted_branch(self):
+        self.assertEqual(
+            self.listing(
+                [
+                    Jump("a", "Lt", 1, 2),
+                    Jump.always(3),
+                    Print("a", True),
+                    Print("b", True),
+                ]
+            ),
+            ["jump 2 a lessThan 1", "print a", "print b"],
+        )
+
+    def test_return_addresses_stay_reachable(self):
+        instructions = thread_jumps(
+            [
+                Set("__jumpback_f", 2),
+                Jump.always(3),
+                Print("a", True),
+                Set("@counter", "__jumpback_f"),
+            ]
+        )
+        self.assertEqual(len(instructions), 4)
+
+    def test_no_jump_lands_on_unconditional_jump(self):
+        instructions = compiler(NestedLoops)
+        for inst in instructions:
+            if isinstance(inst, Jump) and isinstance(inst.to, int):
+                target = instructions[inst.to % len(instructions)]
+                self.assertFalse(
+                    isinstance(target, Jump)
+                    and target.op == "Eq"
+                    and not target.reverse
+                )
@@ -0,0 +1,101 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import GetLink, Jump, Operation, Print, Set, UnitControl, Write
+from MindApi.ir import ControlFlowGraph
+from MindApi.passes import hoist_invariants
+
+
+class Scaled:
+    def init(self):
+        pass
+
+    def loop(self):
+        i = 0
+        while i < 10:
+            t = self.a * self.b
+            print(t)
+            i += 1
+
+
+class TestNaturalLoops(unittest.TestCase):
+    def test_nested(self):
+        cfg = ControlFlowGraph(
+            [
+                Set("i", 0),  # 0
+                Jump("i", "GtE", 10, 6),  # 1: outer header
+                Set("j", 0),  # 2
+                Operation("j", "j", "Add", 1),  # 3: inner header
+                Jump("j", "Lt", 10, 3),  # 4
+                Jump.always(1),  # 5
+                Print("i", True),  # 6
+            ]
+        )
+        entry, outer, init, inner, latch, leave = cfg.blocks
+        loops = cfg.natural_loops()
+        self.assertEqual(loops[inner], {inner})
+        self.assertEqual(loops[outer], {outer, init, inner, latch})
+        # the whole program restarts
+        self.assertIn(leave, loops[entry])
+
+
+class TestHoisting(unittest.TestCase):
+    def listing(self, instructions):
+        return [str(i) for i in hoist_invariants(instructions)]
+
+    def test_processor_loop(self):
+        self.assertEqual(
+            self.listing(
+                [
+                    Set("a", 2),
+                    GetLink("b", 0),
+                    Operation("k", "a", "Mult", "b"),
+                    Print("k", True),
+                    Jump.always(1),
+                ]
+            ),
+            [
+                "set a 2",
+                "getlink b 0",
+                "op k a mul b",
+                "print k",
+                "jump 3 1 equal 1",
+            ],
+        )
+
+    def test_written_in_loop(self):
+        instructions = [
+            Operation("k", "a", "Mult", 2),
+            Print("k", True),
+            Operation("a", "a", "Add", 1),
+        ]
+        self.assertEqual(self.listing(instructions)[0], "op k a mul 2")
+
+    def test_side_effects_stay(self):
+        instructions = [
+            Set("i", 0),
+            Write("x", "cell1", 0),
+            UnitControl("getBlock", "x", "y", "k", "b"),
+            Operation("t", "k", "Add", 1),
+            Print("t", True),
+            Jump.always(1),
+        ]
+        listing = self.listing(instructions)
+        self.assertEqual(listing[1], "write x cell1 0")
+        # ucontrol may write k, so t changes between iterations
+        self.assertEqual(listing[3], "op t k add 1")
+
+    def test_read_before_write(self):
+        instructions = [
+            Set("t", 0),
+            Print("t", True),
+            Operation("t", "a", "Add", 1),
+            Jump.always(1),
+        ]
+        self.assertEqual(self.listing(instructions)[2], "op t a add 1")
+
+    def test_while(self):
+        listing = [str(i) for i in compiler(Scaled)]
+        multiply = listing.index("op t __a mul __b")
+        loop = next(i for i, inst in enumerate(listing) if "greaterThanEq" in inst)
+        self.assertLess(multiply, loop)
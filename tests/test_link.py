@@ -0,0 +1,57 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, JumpTable, Label, Print, Set
+from MindApi.core import link
+from MindApi.emulator import Processor
+
+
+class Nested:
+    def init(self):
+        pass
+
+    def loop(self):
+        i = 0
+        while i < 3:
+            j = 0
+            while 1:
+                if j >= i:
+                    break
+                print(j)
+                j += 1
+            i += 1
+        print("done")
+
+
+class TestLink(unittest.TestCase):
+    def test_link(self):
+        start, end, case = Label("start"), Label("end"), Label("case")
+        instructions = link(
+            [
+                start,
+                Set("a", 1),
+                Jump("a", "Eq", 1, end),
+                JumpTable("a", [case, start, end]),
+                case,
+                Print("a", True),
+                Set("__jumpback_f", end),
+                Jump.always(start),
+                end,
+            ]
+        )
+        self.assertFalse(any(isinstance(i, Label) for i in instructions))
+        self.assertEqual(instructions[1].to, 6)
+        self.assertEqual(instructions[2].targets, [3, 0, 6])
+        self.assertEqual(instructions[4].src, 6)
+        self.assertEqual(instructions[5].to, 0)
+
+    def test_unplaced(self):
+        with self.assertRaises(ValueError):
+            link([Jump.always(Label())])
+
+    def test_nested_breaks(self):
+        for opt_level in (0, 2):
+            instructions = compiler(Nested, opt_level=opt_level)
+            processor = Processor(instructions, ipt=1000)
+            processor.run(1)
+            self.assertTrue(processor.text_buffer.startswith("001done001done"))
@@ -0,0 +1,92 @@
+import contextlib
+import io
+import unittest
+
+from MindApi import compiler, dump, dumps, emit
+from MindApi.builtin import Draw, Jump, Label, Operation, Print, UnitControl
+from MindApi.core import convert
+from MindApi.types import OperationType
+
+
+class Program:
+    def init(self):
+        self.x = 1
+
+    def loop(self):
+        if self.x > 1:
+            print(self.x)
+        self.x += 1
+
+
+class TestMlog(unittest.TestCase):
+    def test_quiet(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            compiler(Program)
+            convert(Program.loop, Program)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_debug_listing(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            instructions = compiler(Program, debug=True)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), len(instructions))
+        self.assertEqual(lines[0], f"0: {instructions[0]}")
+
+    def test_emit(self):
+        instructions = compiler(Program)
+        lines = emit(instructions)
+        self.assertEqual(next(lines), str(instructions[0]))
+        self.assertEqual(len(list(lines)), len(instructions) - 1)
+
+    def test_dump(self):
+        instructions = compiler(Program)
+        buffer = io.StringIO()
+        self.assertEqual(dump(instructions, buffer), len(instructions))
+        self.assertEqual(buffer.getvalue(), dumps(instructions))
+        self.assertEqual(
+            buffer.getvalue(), "".join(f"{inst}\n" for inst in instructions)
+        )
+
+    def test_labels(self):
+        end = Label("end")
+        text = dumps([Jump.always(end), Print("a"), end])
+        self.assertEqual(text, f'jump {end} 1 equal 1\nprint "a"\n{end}:\n')
+
+        class Entry(Label):
+            __slots__ = ()
+
+        entry = Entry("entry")
+        self.assertEqual(dumps([entry]), f"{entry}:\n")
+        self.assertEqual(list(emit([entry])), [f"{entry}:"])
+
+    def test_operands(self):
+        instructions = [
+            Operation("a", "b", "Add", 1),
+            Operation("a", "b", OperationType.Max, 1),
+            Jump("a", "Lt", 2, 5),
+            Jump("a", "Lt", 2, 5, reverse=False),
+            Draw("rect", "1", "2"),
+            UnitControl("move", "x", "y"),
+        ]
+        self.assertEqual(
+            dumps(instructions).splitlines(),
+            [
+                "op a b add 1",
+                "op a b max 1",
+                "jump 5 a greaterThanEq 2",
+                "jump 5 a lessThan 2",
+                "draw rect 1 2 0 0 0 0",
+                "ucontrol move x y 0 0 0",
+            ],
+        )
+        self.assertEqual(dumps(instructions).splitlines(), list(emit(instructions)))
+        for inst in (Operation("a", "b", "Nope", 1), Jump("a", "Nope", 1, 0)):
+            with self.subTest(inst=type(inst).__name__):
+                with self.assertRaises(ValueError):
+                    dumps([inst])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Operation, Print, Set
+from MindApi.passes import PassManager, PeepholePass, PeepholeRule, optimize
+from MindApi.passes.peephole import CopyChain, JumpToNext, SelfAssignment
+
+
+class Copies:
+    def init(self):
+        a = self.b
+        a = a
+        print(a)
+
+    def loop(self):
+        pass
+
+
+class TestPeepholeRules(unittest.TestCase):
+    def run_rules(self, instructions, *rules):
+        return [str(i) for i in PeepholePass(rules)(instructions)]
+
+    def test_self_assignment(self):
+        self.assertEqual(
+            self.run_rules([Set("a", "a"), Print("a", True)], SelfAssignment()),
+            ["print a"],
+        )
+
+    def test_copy_chain(self):
+        self.assertEqual(
+            self.run_rules(
+                [Operation("t", "x", "Add", 1), Set("y", "t"), Print("y", True)],
+                CopyChain(),
+            ),
+            ["op y x add 1", "print y"],
+        )
+
+    def test_copy_chain_keeps_read_temporary(self):
+        instructions = [Set("t", "x"), Set("y", "t"), Print("t", True)]
+        self.assertEqual(len(self.run_rules(instructions, CopyChain())), 3)
+
+    def test_window_does_not_span_jump_target(self):
+        instructions = [
+            Set("t", "x"),
+            Set("y", "t"),
+            Jump("y", "Eq", 1, 1),
+        ]
+        self.assertEqual(len(self.run_rules(instructions, CopyChain())), 3)
+
+    def test_jump_to_next_relocates(self):
+        instructions = [
+            Jump("a", "Eq", 1, 1),
+            Print("a", True),
+            Jump("a", "Eq", 2, 1),
+        ]
+        self.assertEqual(
+            self.run_rules(instructions, JumpToNext()),
+            ["print a", "jump 0 a notEqual 2"],
+        )
+
+
+class TestPassManager(unittest.TestCase):
+    def test_custom_rule(self):
+        class DropPrints(PeepholeRule):
+            def rewrite(self, window, index, program):
+                return [] if isinstance(window[0], Print) else None
+
+        manager = PassManager([PeepholePass([DropPrints()])])
+        self.assertEqual(manager.run([Print("a", True), Set("a", 1)])[0].src, 1)
+
+    def test_opt_level(self):
+        instructions = [Set("a", "a"), Operation("b", 1, "Add", 1)]
+        self.assertEqual(len(optimize(list(instructions), 0)), 2)
+        self.assertEqual([str(i) for i in optimize(instructions, 1)], ["set b 2"])
+
+    def test_compiler(self):
+        self.assertLess(len(compiler(Copies)), len(compiler(Copies, opt_level=0)))
@@ -0,0 +1,106 @@
+import inspect
+import os
+import tempfile
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, Set
+from MindApi.emulator import Processor
+from MindApi.pgo import Profile, collect_profile
+
+
+class Dispatch:
+    def medium(self, a):
+        b = a * 2
+        c = b + 1
+        print(a)
+        print(b)
+        print(c)
+        print(self.x)
+
+    def tiny(self, a):
+        print(a)
+
+    def init(self):
+        pass
+
+    def loop(self):
+        if self.p == 1:
+            self.tiny(self.p)
+            self.tiny(self.q)
+        elif self.p == 10:
+            print("ten")
+        elif self.p == 100:
+            print("hundred")
+        else:
+            print("other")
+        if self.p > 5:
+            print("big")
+        else:
+            print("small")
+        self.medium(self.p)
+        self.medium(self.q)
+
+
+LOOP = inspect.getsourcelines(Dispatch.loop)[1]  # profiles count file lines
+INPUTS = [{"__p": 100, "__q": 3}, {"__p": 100, "__q": 4}, {"__p": 10, "__q": 5}]
+
+
+def outputs(instructions):
+    result = []
+    for p in (1, 10, 100, 7, 3):
+        processor = Processor(instructions, ipt=1000)
+        processor.variables.update(__p=p, __q=2)
+        processor.run(1)
+        result.append(processor.text_buffer)
+    return result
+
+
+def called(instructions):
+    return {
+        i.method for i in instructions if isinstance(i, Set) and i.dest == "@counter"
+    }
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.profile = collect_profile(Dispatch, INPUTS, ticks=20)
+
+    def test_counts(self):
+        profile = self.profile
+        self.assertGreater(profile.iterations, 0)
+        self.assertTrue(profile.hot("medium"))
+        self.assertTrue(profile.cold("tiny"))
+        held, failed = profile.branch("loop", LOOP + 1)
+        self.assertEqual(held, 0)
+        self.assertEqual(failed, profile.iterations)
+        self.assertGreater(
+            profile.branch("loop", LOOP + 6)[0], profile.branch("loop", LOOP + 4)[0]
+        )
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            self.profile.save(path)
+            loaded = Profile.load(path)
+        self.assertEqual(loaded.to_dict(), self.profile.to_dict())
+        merged = Profile().merge(loaded).merge(loaded)
+        self.assertEqual(merged.calls["medium"], 2 * self.profile.calls["medium"])
+        with self.assertRaises(ValueError):
+            Profile.from_dict({"version": 0})
+
+    def test_guided(self):
+        plain = compiler(Dispatch)
+        guided = compiler(Dispatch, profile=self.profile)
+        self.assertEqual(outputs(guided), outputs(plain))
+        # the hottest case is tested first
+        first = guided[0]
+        self.assertIsInstance(first, Jump)
+        self.assertIn(100, (first.left, first.right))
+        # hot methods are inlined, cold ones are not
+        self.assertEqual(called(plain), {"medium"})
+        self.assertEqual(called(guided), {"tiny"})
+
+    def test_unoptimized(self):
+        guided = compiler(Dispatch, opt_level=0, profile=self.profile)
+        self.assertEqual(outputs(guided), outputs(compiler(Dispatch, opt_level=0)))
@@ -0,0 +1,59 @@
+import inspect
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from MindApi import profile
+
+from .test_pgo import Dispatch
+
+LOOP = inspect.getsourcelines(Dispatch.loop)[1]
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.output = io.StringIO()
+        self.stats = profile(
+            Dispatch, ticks=10, inputs=[{"__p": 100}, {"__p": 1}], file=self.output
+        )
+
+    def test_counts(self):
+        stats = self.stats
+        self.assertEqual(stats.runs, 2)
+        self.assertEqual(stats.ticks, 20)
+        self.assertEqual(sum(stats.methods().values()), stats.total)
+        self.assertEqual(sum(row["executed"] for row in stats.lines()), stats.total)
+        rows = {(row["method"], row["line"]): row for row in stats.lines()}
+        self.assertEqual(rows[("loop", LOOP + 5)]["executed"], 0)  # print("ten")
+        self.assertGreater(rows[("loop", LOOP + 7)]["executed"], 0)
+
+    def test_jumps(self):
+        first = self.stats.jumps()[0]
+        self.assertEqual(first["line"], LOOP + 1)
+        # half of the runs go into the first case
+        self.assertAlmostEqual(first["taken"] / first["executed"], 0.5, delta=0.1)
+
+    def test_report(self):
+        text = self.output.getvalue()
+        self.assertIn("medium", text)
+        self.assertIn('print("hundred")', text)
+        report = self.stats.report(limit=3).splitlines()
+        executed = [int(line.split()[0]) for line in report[5:8]]
+        self.assertEqual(executed, sorted(executed, reverse=True))
+        self.assertIn("Ordered by: line", self.stats.report(sort="line"))
+
+    def test_export(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stats.json")
+            self.stats.save(path)
+            with open(path) as file:
+                data = json.load(file)
+        self.assertEqual(data["total"], self.stats.total)
+        self.assertEqual(len(data["instructions"]), len(self.stats.instructions))
+
+    def test_quiet(self):
+        output = io.StringIO()
+        profile(Dispatch, ticks=1, file=output, quiet=True)
+        self.assertEqual(output.getvalue(), "")
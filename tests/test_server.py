@@ -0,0 +1,146 @@
+import asyncio
+import contextlib
+import io
+import linecache
+import os
+import tempfile
+import threading
+import unittest
+
+from MindApi.cli import main
+from MindApi.client import Client, CompileError
+from MindApi.server import CompileServer, is_loopback
+
+SOURCE = """
+class Blink:
+    def toggle(self, a):
+        return 1 - a
+
+    def init(self):
+        self.on = 0
+
+    def loop(self):
+        self.on = self.toggle(self.on)
+        print(self.on)
+
+
+class Count:
+    def loop(self):
+        self.n += 1
+"""
+
+
+class TestCompileServer(unittest.TestCase):
+    def test_compile(self):
+        server = CompileServer()
+        first = server.compile({"source": SOURCE})
+        self.assertTrue(first["ok"])
+        self.assertEqual(set(first["programs"]), {"Blink", "Count"})
+        self.assertIn("print __on", first["programs"]["Blink"])
+        self.assertIs(server.compile({"source": SOURCE}), first)
+        self.assertEqual((server.requests, server.hits), (2, 1))
+
+    def test_new_version(self):
+        server = CompileServer()
+        request = {"source": SOURCE, "class": "Blink", "document": "blink.py"}
+        server.compile(request)
+        changed = SOURCE.replace("print(self.on)", "print(self.off)")
+        answer = server.compile(dict(request, source=changed))
+        self.assertIn("print __off", answer["programs"]["Blink"])
+        recompiler = server.recompilers[("blink.py", "Blink", 2, "cell1")]
+        self.assertEqual(recompiler.converted, {"loop"})
+
+    def test_errors(self):
+        server = CompileServer()
+        answer = server.compile({"source": SOURCE, "class": "Missing"})
+        self.assertFalse(answer["ok"])
+        self.assertIn("No processor class Missing", answer["error"])
+        answer = server.compile({"source": "class Broken:\n    x = [\n"})
+        self.assertIn("SyntaxError", answer["error"])
+        self.assertFalse(server.answer(b"{")["ok"])
+
+    def test_sources_forgotten(self):
+        server = CompileServer(cache_size=2)
+        files = []
+        for count in range(4):
+            server.compile({"source": SOURCE.replace("+= 1", f"+= {count}")})
+            files.append(next(reversed(server.files)))
+        self.assertEqual(list(server.files), files[2:])
+        self.assertEqual([name in linecache.cache for name in files], [0, 0, 1, 1])
+
+
+class TestClient(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "compile.sock")
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(CompileServer().start(self.path))
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+
+    def close(self, server):
+        async def close():
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(close(), self.loop).result()
+
+    def tearDown(self):
+        self.close(self.server)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.directory.cleanup()
+
+    def test_clients(self):
+        results = {}
+
+        def compile_with(index: int):
+            with Client(self.path) as client:
+                for _ in range(5):
+                    results[index] = client.compile(SOURCE, "Count", 1)
+
+        threads = [threading.Thread(target=compile_with, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len({results[i]["Count"] for i in results}), 1)
+        with Client(self.path) as client:
+            self.assertEqual(client.stats()["requests"], 20)
+            with self.assertRaises(CompileError):
+                client.compile("x = [", document="broken.py")
+            # the source runs off the event loop
+            with self.assertRaisesRegex(CompileError, "mindapi-compile"):
+                client.compile(
+                    "import threading\n"
+                    "raise ValueError(threading.current_thread().name)\n"
+                )
+
+    def test_loopback_only(self):
+        self.assertTrue(is_loopback("127.0.0.1"))
+        self.assertTrue(is_loopback("localhost"))
+        for host in ("0.0.0.0", "", "8.8.8.8"):
+            with self.subTest(host=host):
+                self.assertFalse(is_loopback(host))
+                with self.assertRaisesRegex(ValueError, "loopback"):
+                    asyncio.run(CompileServer().start(host=host))
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            self.assertEqual(main(["serve", "--host", "0.0.0.0"]), 2)
+        self.assertIn("Not a loopback address", errors.getvalue())
+
+    def test_tcp(self):
+        start = CompileServer().start(port=0)
+        server = asyncio.run_coroutine_threadsafe(start, self.loop).result()
+        port = server.sockets[0].getsockname()[1]
+        try:
+            with Client(port=port) as client:
+                self.assertIn("Blink", client.compile(SOURCE))
+        finally:
+            self.close(server)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import inspect
+import linecache
+import os
+import tempfile
+import unittest
+
+from MindApi import SourceMap, compiler
+from MindApi.emulator import Processor
+
+from .test_pgo import Dispatch
+
+
+class TestSourceMap(unittest.TestCase):
+    def test_origins(self):
+        path = inspect.getsourcefile(Dispatch)
+        lines, start = inspect.getsourcelines(Dispatch.medium)
+        for opt_level in (0, 2):
+            instructions = compiler(Dispatch, opt_level=opt_level)
+            source_map = SourceMap.of(instructions, Dispatch)
+            self.assertEqual(len(source_map), len(instructions))
+            self.assertEqual(source_map.files["loop"], path)
+            self.assertEqual(source_map.files["medium"], path)
+            for inst, origin in zip(instructions, source_map.origins):
+                if origin is None:
+                    continue
+                method, line, column = origin
+                text = linecache.getline(path, line)[column:]
+                if str(inst).startswith("print"):
+                    self.assertTrue(text.startswith("print("), (str(inst), text))
+                if method == "medium":
+                    self.assertTrue(start < line < start + len(lines))
+
+    def test_conditions(self):
+        instructions = compiler(Dispatch, opt_level=0)
+        source_map = SourceMap.of(instructions, Dispatch)
+        first = linecache.getline(source_map.files["loop"], source_map[0][1])
+        self.assertEqual(first.strip(), "if self.p == 1:")
+
+    def test_attribute(self):
+        instructions = compiler(Dispatch)
+        source_map = SourceMap.of(instructions, Dispatch)
+        self.assertEqual(sum(source_map.attribute().values()), len(instructions))
+        processor = Processor(instructions)
+        processor.variables["__p"] = 100
+        processor.run(10)
+        counts = source_map.attribute(processor.counts)
+        self.assertEqual(sum(counts.values()), processor.executed)
+        line = inspect.getsourcelines(Dispatch.loop)[1] + 7  # print("hundred")
+        self.assertGreater(counts[("loop", line)], 0)
+        self.assertEqual(counts.get(("loop", line - 4), 0), 0)  # print("ten")
+
+    def test_round_trip(self):
+        source_map = SourceMap.of(compiler(Dispatch), Dispatch)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "program.map.json")
+            source_map.save(path)
+            loaded = SourceMap.load(path)
+        self.assertEqual(loaded.origins, source_map.origins)
+        self.assertEqual(loaded.files, source_map.files)
+        with self.assertRaises(ValueError):
+            SourceMap.from_dict({"version": 0})
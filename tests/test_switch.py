@@ -0,0 +1,117 @@
+import unittest
+
+from MindApi import compiler
+from MindApi.builtin import Jump, JumpTable, Print
+from MindApi.emulator import Processor
+from MindApi.ir import ControlFlowGraph
+from MindApi.passes import thread_jumps
+
+
+class Machine:
+    def init(self):
+        pass
+
+    def loop(self):
+        s = self.state
+        if s == 1:
+            print(1)
+        elif s == 2:
+            print(2)
+        elif s == 4:
+            print(4)
+            self.state = 1
+        elif s == 3:
+            print(3)
+        else:
+            print(0)
+
+
+class Sparse:
+    def init(self):
+        pass
+
+    def loop(self):
+        s = self.state
+        if s == 1:
+            print(1)
+        elif s == 20:
+            print(2)
+        elif s == 40:
+            print(4)
+        elif s == 30:
+            print(3)
+
+
+class Halves:
+    def init(self):
+        self.state = 0
+
+    def loop(self):
+        s = self.state
+        if s == 0:
+            print("a")
+        elif s == 1:
+            print("b")
+        elif s == 2:
+            print("c")
+        elif s == 3:
+            print("d")
+        else:
+            print("?")
+        self.state = s + 0.5
+
+
+class TestJumpTable(unittest.TestCase):
+    def test_dense_chain(self):
+        for opt_level in (0, 2):
+            listing = [str(i) for i in compiler(Machine, opt_level=opt_level)]
+            self.assertIn("op @counter @counter add __case", listing)
+            dispatch = listing.index("op @counter @counter add __case")
+            table = listing[dispatch + 1 : dispatch + 5]
+            self.assertTrue(all(entry.endswith("1 equal 1") for entry in table))
+            # case 4 comes before case 3 in the source
+            self.assertEqual(listing[int(table[2].split()[1])], 'print "3"')
+            self.assertEqual(listing[int(table[3].split()[1])], 'print "4"')
+
+    def test_fractions(self):
+        # a value with a fraction matches no case, as in python
+        for opt_level in (0, 2):
+            with self.subTest(opt_level=opt_level):
+                instructions = compiler(Halves, opt_level=opt_level)
+                self.assertTrue(
+                    any(str(i).startswith("op @counter") for i in instructions)
+                )
+                processor = Processor(instructions)
+                processor.run(40)
+                self.assertTrue(processor.text_buffer.startswith("a?b?c?d??"))
+
+    def test_sparse_chain(self):
+        listing = [str(i) for i in compiler(Sparse)]
+        self.assertFalse(any("@counter" in inst for inst in listing))
+
+    def test_known_case(self):
+        instructions = thread_jumps(
+            [
+                JumpTable(1, [2, 3]),
+                Print("a", True),
+                Print("b", True),
+                Print("c", True),
+            ]
+        )
+        self.assertEqual(
+            [str(i) for i in instructions], ["jump 1 1 equal 1", "print c"]
+        )
+
+    def test_edges(self):
+        cfg = ControlFlowGraph(
+            [
+                JumpTable("i", [2, 3]),
+                Print("a", True),
+                Print("b", True),
+                Jump.always(0),
+            ]
+        )
+        table, dead, first, second = cfg.blocks
+        self.assertEqual(table.successors, [first, second])
+        self.assertEqual(dead.predecessors, [])
+        self.assertEqual(str(cfg.lower()[0]), "jumptable i 2 3")
@@ -0,0 +1,82 @@
+import ast
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+
+from MindApi import catalog, types
+from MindApi.builtin import LookUp
+from MindApi.emulator import IPT, Processor
+from MindApi.types import MetaType
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# compile and run a program in a fresh interpreter, then list the catalogs
+# that got built
+STARTUP = """
+import MindApi
+from MindApi import types
+from MindApi.emulator import Processor
+from tests.test_mlog import Program
+
+Processor(MindApi.compiler(Program)).run(2)
+try:
+    MindApi.compiler(Program, budget=0)
+except MindApi.BudgetExceeded:
+    pass
+print(sorted(name for name in types._CATALOGS if name in vars(types)))
+"""
+
+
+class TestTypes(unittest.TestCase):
+    def test_not_built_on_import(self):
+        result = subprocess.run(
+            [sys.executable, "-c", STARTUP],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_catalogs(self):
+        for name, table in types._CATALOGS.items():
+            enum = getattr(types, name)
+            self.assertIs(getattr(types, name), enum)
+            self.assertIn(name, dir(types))
+            members = [(member.name, member.value) for member in enum]
+            self.assertEqual(members, list(getattr(catalog, table)))
+        building = types.BuildingType.LogicProcessor
+        self.assertEqual(building, "logic-processor")
+        self.assertIs(pickle.loads(pickle.dumps(building)), building)
+        self.assertEqual(IPT[building], 8)
+        with self.assertRaises(AttributeError):
+            types.FluidType
+
+    def test_declared(self):
+        # the classes type checkers see list the same members as the catalog
+        with open(types.__file__, encoding="utf-8") as file:
+            tree = ast.parse(file.read())
+        (block,) = [node for node in tree.body if isinstance(node, ast.If)]
+        declared = {
+            node.name: [
+                (target.id, item.value.value)
+                for item in node.body
+                for target in item.targets
+            ]
+            for node in block.body
+            if isinstance(node, ast.ClassDef)
+        }
+        for name, table in types._CATALOGS.items():
+            self.assertEqual(declared.pop(name), list(getattr(catalog, table)))
+        self.assertEqual(declared, {})
+
+    def test_lookup(self):
+        processor = Processor([LookUp("x", MetaType.Item, 1)])
+        processor.run(1)
+        self.assertEqual(processor["x"], types.ItemType.Lead.value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import importlib
+import io
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+
+from MindApi import compiler
+from MindApi.watch import Recompiler, Watcher
+
+MODULE = "mindapi_watch_fixture"
+
+SOURCE = """
+class Controller:
+    def scale(self, a):
+        return a * 2
+
+    def shown(self, a):
+        print(a)
+        print(self.label)
+        print(self.unit)
+        print(self.count)
+        print(self.total)
+
+    def init(self):
+        self.n = 0
+
+    def loop(self):
+        self.n = self.scale(self.n)
+        self.shown(self.n)
+        self.shown(self.n)
+"""
+
+
+class TestWatch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, MODULE + ".py")
+        self.save(SOURCE)
+        sys.path.insert(0, self.directory.name)
+
+    def tearDown(self):
+        sys.path.remove(self.directory.name)
+        sys.modules.pop(MODULE, None)
+        self.directory.cleanup()
+
+    def save(self, source: str):
+        with open(self.path, "w") as file:
+            file.write(textwrap.dedent(source))
+
+    def load(self):
+        sys.modules.pop(MODULE, None)
+        # keep the bytecode of the last version from passing for this one
+        sys.dont_write_bytecode = True
+        try:
+            return importlib.import_module(MODULE).Controller
+        finally:
+            sys.dont_write_bytecode = False
+
+    def check(self, recompiler: Recompiler, cls):
+        instructions = recompiler.compile(cls)
+        expected = compiler(cls, opt_level=recompiler.opt_level)
+        self.assertEqual(list(map(str, instructions)), list(map(str, expected)))
+        self.assertEqual(
+            [inst.line for inst in instructions], [inst.line for inst in expected]
+        )
+
+    def test_recompile_changed(self):
+        for opt_level in (0, 2):
+            with self.subTest(opt_level=opt_level):
+                self.save(SOURCE)
+                recompiler = Recompiler(opt_level)
+                self.check(recompiler, self.load())
+                self.assertEqual(
+                    recompiler.converted, {"init", "loop", "scale", "shown"}
+                )
+
+                source = SOURCE.replace("self.n = 0", "self.n = 1")
+                self.save(source)
+                self.check(recompiler, self.load())
+                self.assertEqual(recompiler.converted, {"init"})
+
+                # the callers of a method are converted again with it
+                self.save(source.replace("a * 2", "a * 3"))
+                self.check(recompiler, self.load())
+                self.assertEqual(recompiler.converted, {"scale", "loop"})
+
+    def test_moved(self):
+        recompiler = Recompiler()
+        self.check(recompiler, self.load())
+        self.save("# a comment\n\n" + SOURCE)
+        self.check(recompiler, self.load())
+        self.assertEqual(recompiler.converted, set())
+
+    def test_line_inside_method(self):
+        recompiler = Recompiler()
+        self.check(recompiler, self.load())
+        self.save(SOURCE.replace("        print(a)\n", "        print(a)\n\n", 1))
+        self.check(recompiler, self.load())
+        self.assertIn("shown", recompiler.converted)
+        self.assertNotIn("scale", recompiler.converted)
+
+    def test_call_count_changed(self):
+        recompiler = Recompiler()
+        self.check(recompiler, self.load())
+        # called once, shown is inlined now
+        self.save(SOURCE.replace("        self.shown(self.n)\n", "", 1))
+        self.check(recompiler, self.load())
+        self.assertEqual(recompiler.converted, {"shown", "loop"})
+
+    def test_watcher(self):
+        output = os.path.join(self.directory.name, "build")
+        log = io.StringIO()
+        watcher = Watcher([self.path], output, file=log)
+        self.assertEqual(watcher.poll(), [])
+        (result,) = watcher.build_all()
+        self.assertIsNone(result["error"])
+        self.assertEqual(
+            os.path.basename(result["output"]), f"{MODULE}.Controller.mlog"
+        )
+
+        self.save(SOURCE.replace("a * 2", "a * 5"))
+        os.utime(self.path, ns=(0, 0))  # whatever the clock, a new time stamp
+        (result,) = watcher.poll()
+        self.assertEqual(result["converted"], ["loop", "scale"])
+        with open(result["output"]) as file:
+            self.assertIn("5", file.read())
+        self.assertIn("converted loop, scale", log.getvalue())
+
+        self.save(SOURCE + "\nclass Broken:\n    def loop(self):\n        x = [1]\n")
+        os.utime(self.path, ns=(1, 1))
+        results = watcher.poll()
+        self.assertEqual([r["class"] for r in results], ["Controller", "Broken"])
+        self.assertIn("NotImplementedError", results[1]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()